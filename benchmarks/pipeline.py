@@ -0,0 +1,407 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the overhead of validations separately from database time.
+
+Synthetic source and target tables of a configurable width and row count are
+validated end to end on the FileSystem (pandas) backend and on local SQLite
+databases, e.g.
+
+    python benchmarks/pipeline.py --rows 100000 --columns 20 --runs 3
+
+Each backend and validation type runs in a fresh interpreter, so that its peak
+RSS is its own. Stage times are summed over the source and target, which are
+queried concurrently, so stages can add up to more than the total. Save the
+results with --output and compare a later run against them with --baseline to
+catch regressions, e.g. in the combiner or the ValidationBuilder.
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import os
+import resource
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKENDS = ["filesystem", "sqlite"]
+VALIDATIONS = ["column", "row", "schema", "custom-query"]
+STAGES = ["config", "compile", "fetch", "combine", "result"]
+# Custom queries need a backend which runs SQL
+UNSUPPORTED = {("filesystem", "custom-query")}
+TABLE_NAME = "bench"
+
+# Stage times below this many seconds are too noisy to compare to a baseline
+MIN_COMPARED_SECONDS = 0.01
+
+
+def generate_table(rows, columns):
+    """Return a DataFrame with an id and columns of mixed types."""
+    import numpy
+    import pandas
+
+    random = numpy.random.default_rng(0)
+    data = {"id": numpy.arange(rows)}
+    for index in range(columns):
+        column_type = index % 4
+        if column_type == 0:
+            data[f"int_{index}"] = random.integers(0, 1000000, rows)
+        elif column_type == 1:
+            data[f"float_{index}"] = random.random(rows).round(6)
+        elif column_type == 2:
+            data[f"string_{index}"] = pandas.Series(
+                random.integers(0, 1000000, rows)
+            ).map("value_{}".format)
+        else:
+            data[f"timestamp_{index}"] = pandas.Timestamp("2023-01-01") + (
+                pandas.to_timedelta(random.integers(0, 86400 * 365, rows), unit="s")
+            )
+    return pandas.DataFrame(data)
+
+
+def write_tables(directory, rows, columns):
+    """Write identical source and target tables for every backend."""
+    table_df = generate_table(rows, columns)
+    for side in ["source", "target"]:
+        table_df.to_csv(os.path.join(directory, f"{side}.csv"), index=False)
+        with contextlib.closing(
+            sqlite3.connect(os.path.join(directory, f"{side}.db"))
+        ) as connection:
+            table_df.to_sql(TABLE_NAME, connection, index=False)
+
+
+def get_connection(directory, backend, side):
+    """Return the connection config and Ibis client of one side."""
+    import ibis
+    import sqlalchemy
+
+    from data_validation import clients
+
+    if backend == "filesystem":
+        connection = {
+            "source_type": "FileSystem",
+            "table_name": TABLE_NAME,
+            "file_path": os.path.join(directory, f"{side}.csv"),
+            "file_type": "csv",
+        }
+        return connection, clients.get_data_client(connection)
+
+    # SQLite is not a supported connection type, so its client is supplied
+    # directly and the connection config is only used to identify it.
+    database = os.path.join(directory, f"{side}.db")
+    client = ibis.sqlite.connect(database)
+    client._source_type = "SQLite"
+
+    # Queries run on other threads get connections of their own, which need
+    # the database attached too.
+    @sqlalchemy.event.listens_for(client.con, "connect")
+    def attach(dbapi_connection, connection_record):
+        dbapi_connection.execute(
+            f"ATTACH DATABASE '{database}' AS {client.database_name}"
+        )
+
+    return {"source_type": "SQLite", "database": database}, client
+
+
+def _get_sqlite_schema(self, table_name, database=None):
+    return self.table(table_name, database=database).schema()
+
+
+def _get_sqlite_schema_using_query(self, query):
+    from ibis import util
+
+    view_name = f"{self.database_name}.view_{util.guid()}"
+    self.con.execute(f"CREATE VIEW {view_name} AS {query}")
+    try:
+        return self.table(view_name.split(".")[1]).schema()
+    finally:
+        self.con.execute(f"DROP VIEW {view_name}")
+
+
+def build_config(directory, backend, validation):
+    """Return a validation config and its clients, built like the CLI does."""
+    from data_validation import consts
+    from data_validation.config_manager import ConfigManager
+
+    source_conn, source_client = get_connection(directory, backend, "source")
+    target_conn, target_client = get_connection(directory, backend, "target")
+    config_type = {
+        "column": consts.COLUMN_VALIDATION,
+        "row": consts.ROW_VALIDATION,
+        "schema": consts.SCHEMA_VALIDATION,
+        "custom-query": consts.CUSTOM_QUERY,
+    }[validation]
+    config = {
+        consts.CONFIG_SOURCE_CONN: source_conn,
+        consts.CONFIG_TARGET_CONN: target_conn,
+        consts.CONFIG_TYPE: config_type,
+        consts.CONFIG_SCHEMA_NAME: None,
+        consts.CONFIG_TABLE_NAME: TABLE_NAME,
+        consts.CONFIG_TARGET_SCHEMA_NAME: None,
+        consts.CONFIG_TARGET_TABLE_NAME: TABLE_NAME,
+        consts.CONFIG_LABELS: [],
+        consts.CONFIG_THRESHOLD: 0.0,
+        consts.CONFIG_FORMAT: "csv",
+        consts.CONFIG_RESULT_HANDLER: None,
+        consts.CONFIG_FILTERS: [],
+        consts.CONFIG_FILTER_STATUS: None,
+    }
+    if validation == "custom-query":
+        config[consts.CONFIG_CUSTOM_QUERY_TYPE] = "column"
+        config[consts.CONFIG_SOURCE_QUERY] = f"SELECT * FROM {TABLE_NAME}"
+        config[consts.CONFIG_TARGET_QUERY] = f"SELECT * FROM {TABLE_NAME}"
+    config_manager = ConfigManager(
+        config, source_client=source_client, target_client=target_client
+    )
+
+    if validation in ["column", "custom-query"]:
+        config_manager.append_aggregates(
+            [config_manager.build_config_count_aggregate()]
+            + config_manager.build_config_column_aggregates(
+                "sum", None, ["int64", "float64"]
+            )
+        )
+    elif validation == "row":
+        columns = config_manager.get_source_ibis_table().columns
+        config_manager.append_primary_keys(config_manager.build_column_configs(["id"]))
+        config_manager.append_comparison_fields(
+            config_manager.build_config_comparison_fields(
+                [column for column in columns if column != "id"]
+            )
+        )
+    return config_manager.config, source_client, target_client
+
+
+class StageTimer(object):
+    """Sum the time spent in the methods of each stage of a validation."""
+
+    def __init__(self):
+        self.timings = dict.fromkeys(STAGES, 0.0)
+
+    @contextlib.contextmanager
+    def time(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[stage] += time.perf_counter() - start
+
+    def wrap(self, owner, name, stage):
+        """Time every call of owner.name as part of stage."""
+        method = getattr(owner, name)
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            with self.time(stage):
+                return method(*args, **kwargs)
+
+        setattr(owner, name, timed)
+
+
+def instrument(timer):
+    """Time the stages of validations run in this interpreter, and add the
+    schema lookups schema and custom query validations need to SQLite."""
+    from ibis.backends.sqlite.client import SQLiteClient
+
+    from data_validation import clients
+    from data_validation.data_validation import DataValidation
+    from data_validation.result_handlers.text import TextResultHandler
+    from data_validation.validation_builder import ValidationBuilder
+
+    SQLiteClient.get_schema = _get_sqlite_schema
+    SQLiteClient._get_schema_using_query = _get_sqlite_schema_using_query
+
+    timer.wrap(ValidationBuilder, "get_source_query", "compile")
+    timer.wrap(ValidationBuilder, "get_target_query", "compile")
+    timer.wrap(DataValidation, "_execute_query", "fetch")
+    timer.wrap(clients, "get_ibis_table_schema", "fetch")
+    timer.wrap(DataValidation, "_combine_in_memory", "combine")
+    timer.wrap(TextResultHandler, "execute", "result")
+
+
+def run_case(directory, backend, validation, runs):
+    """Return the timings of validations run in this interpreter."""
+    from data_validation.data_validation import DataValidation
+
+    timer = StageTimer()
+    instrument(timer)
+    totals = []
+    stages = {stage: [] for stage in STAGES}
+    result_rows = 0
+    for _ in range(runs):
+        timer.timings = dict.fromkeys(STAGES, 0.0)
+        start = time.perf_counter()
+        with timer.time("config"):
+            config, source_client, target_client = build_config(
+                directory, backend, validation
+            )
+        validator = DataValidation(
+            config, source_client=source_client, target_client=target_client
+        )
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            result_rows = len(validator.execute())
+        totals.append(time.perf_counter() - start)
+        for stage in STAGES:
+            stages[stage].append(timer.timings[stage])
+
+    return {
+        "backend": backend,
+        "validation": validation,
+        "total": statistics.median(totals),
+        "stages": {stage: statistics.median(stages[stage]) for stage in STAGES},
+        "result_rows": result_rows,
+        # Kilobytes on Linux, bytes on macOS
+        "peak_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def run_case_in_subprocess(directory, backend, validation, runs):
+    """Return the timings of a case run in a fresh interpreter, or None if the
+    backend does not support the validation."""
+    completed = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--run-case",
+            directory,
+            backend,
+            validation,
+            "--runs",
+            str(runs),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if completed.returncode != 0:
+        error = (completed.stderr.strip().splitlines() or ["unknown error"])[-1]
+        print(f"{backend} {validation} failed: {error}", file=sys.stderr)
+        return None
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def get_regressions(results, baseline, max_regression):
+    """Return descriptions of stages slower than the baseline by more than
+    max_regression, as a fraction of the baseline time."""
+    baseline_results = {
+        (result["backend"], result["validation"]): result for result in baseline
+    }
+    regressions = []
+    for result in results:
+        base = baseline_results.get((result["backend"], result["validation"]))
+        if base is None:
+            continue
+        timings = [("total", result["total"], base["total"])] + [
+            (stage, result["stages"][stage], base["stages"][stage]) for stage in STAGES
+        ]
+        for name, seconds, base_seconds in timings:
+            if base_seconds < MIN_COMPARED_SECONDS:
+                continue
+            if seconds > base_seconds * (1 + max_regression):
+                regressions.append(
+                    f"{result['backend']} {result['validation']} {name}: "
+                    f"{base_seconds:.3f}s -> {seconds:.3f}s"
+                )
+    return regressions
+
+
+def print_results(results, rows):
+    header = f"{'backend':<12}{'validation':<14}{'total (s)':>10}"
+    header += "".join(f"{stage + ' (s)':>13}" for stage in STAGES)
+    header += f"{'rows/s':>12}{'peak RSS (MB)':>15}"
+    print(header)
+    for result in results:
+        line = f"{result['backend']:<12}{result['validation']:<14}"
+        line += f"{result['total']:>10.3f}"
+        line += "".join(f"{result['stages'][stage]:>13.3f}" for stage in STAGES)
+        line += f"{rows / result['total']:>12,.0f}"
+        line += f"{result['peak_rss'] / 1024:>15.1f}"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--rows", type=int, default=100000, help="Rows per table.")
+    parser.add_argument(
+        "--columns", type=int, default=10, help="Columns per table besides the id."
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Runs per validation.")
+    parser.add_argument(
+        "--backends", default=",".join(BACKENDS), help="Comma separated backends."
+    )
+    parser.add_argument(
+        "--validations",
+        default=",".join(VALIDATIONS),
+        help="Comma separated validation types.",
+    )
+    parser.add_argument("--output", help="JSON file to save the results to.")
+    parser.add_argument("--baseline", help="JSON file of results to compare to.")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.25,
+        help="Fraction a stage may be slower than the baseline (default 0.25).",
+    )
+    parser.add_argument(
+        "--run-case",
+        nargs=3,
+        metavar=("DIRECTORY", "BACKEND", "VALIDATION"),
+        help=argparse.SUPPRESS,
+    )
+    args = parser.parse_args(argv)
+
+    if args.run_case:
+        print(json.dumps(run_case(*args.run_case, args.runs)))
+        return 0
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        write_tables(directory, args.rows, args.columns)
+        for backend in args.backends.split(","):
+            for validation in args.validations.split(","):
+                if (backend, validation) in UNSUPPORTED:
+                    continue
+                result = run_case_in_subprocess(
+                    directory, backend, validation, args.runs
+                )
+                if result is not None:
+                    results.append(result)
+
+    print_results(results, args.rows)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(
+                {"rows": args.rows, "columns": args.columns, "results": results},
+                output_file,
+                indent=2,
+            )
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = get_regressions(results, baseline["results"], args.max_regression)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
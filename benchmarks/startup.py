@@ -0,0 +1,75 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measure the startup time of the data-validation CLI.
+
+Every command runs in a fresh interpreter so that no module is cached, e.g.
+
+    python benchmarks/startup.py --runs 10
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+COMMANDS = {
+    "import data_validation.__main__": [
+        sys.executable,
+        "-c",
+        "import data_validation.__main__",
+    ],
+    "data-validation connections list": [
+        sys.executable,
+        "-m",
+        "data_validation",
+        "connections",
+        "list",
+    ],
+    "import data_validation.__main__ + Postgres client": [
+        sys.executable,
+        "-c",
+        "import data_validation.__main__; "
+        "from data_validation import clients; "
+        "clients.CLIENT_LOOKUP['Postgres']",
+    ],
+}
+
+
+def time_command(command, runs):
+    """Return the wall clock seconds of each run of a command."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="Runs per command.")
+    args = parser.parse_args(argv)
+
+    print(f"{'command':<55}{'median (s)':>12}{'min (s)':>10}")
+    for name, command in COMMANDS.items():
+        timings = time_command(command, args.runs)
+        print(f"{name:<55}{statistics.median(timings):>12.3f}{min(timings):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
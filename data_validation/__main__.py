@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
 import json
 import logging
 import os
 import sys
+import threading
+import pandas
+from concurrent.futures import ThreadPoolExecutor
 
 from yaml import Dumper, dump
 from argparse import Namespace
@@ -271,14 +275,24 @@ def build_config_managers_from_args(
     pre_build_configs_list = cli_tools.get_pre_build_configs(args, validate_cmd)
 
     # Build a list of ConfigManager objects
-    for pre_build_configs in pre_build_configs_list:
-        config_manager = ConfigManager.build_config_manager(**pre_build_configs)
-
-        # Append post build configs to ConfigManager object
-        config_manager = build_config_from_args(args, config_manager)
-
-        # Append ConfigManager object to configs list
-        configs.append(config_manager)
+    try:
+        for pre_build_configs in pre_build_configs_list:
+            config_manager = ConfigManager.build_config_manager(**pre_build_configs)
+
+            # Append post build configs to ConfigManager object
+            config_manager = build_config_from_args(args, config_manager)
+
+            # Append ConfigManager object to configs list
+            configs.append(config_manager)
+    finally:
+        # Each ConfigManager checks out the shared clients for itself.
+        if pre_build_configs_list:
+            clients.release_shared_data_client(
+                pre_build_configs_list[0]["source_client"]
+            )
+            clients.release_shared_data_client(
+                pre_build_configs_list[0]["target_client"]
+            )
 
     return configs
 
@@ -295,7 +309,23 @@ def config_runner(args):
         config_file_path = _get_arg_config_file(args)
         config_managers = build_config_managers_from_yaml(args, config_file_path)
 
-    run_validations(args, config_managers)
+    try:
+        run_validations(args, config_managers)
+    finally:
+        _release_clients(config_managers)
+
+
+def _apply_cache_args(args, config):
+    """Override the query cache settings of a YAML validation with arguments."""
+    if getattr(args, "no_cache", False):
+        config[consts.CONFIG_CACHE] = False
+        return
+    if getattr(args, "cache", False):
+        config[consts.CONFIG_CACHE] = True
+    if getattr(args, "cache_ttl", None):
+        config[consts.CONFIG_CACHE_TTL] = args.cache_ttl
+    if getattr(args, "cache_version", None):
+        config[consts.CONFIG_CACHE_VERSION] = args.cache_version
 
 
 def build_config_managers_from_yaml(args, config_file_path):
@@ -309,19 +339,27 @@ def build_config_managers_from_yaml(args, config_file_path):
     source_conn = mgr.get_connection_config(yaml_configs[consts.YAML_SOURCE])
     target_conn = mgr.get_connection_config(yaml_configs[consts.YAML_TARGET])
 
-    source_client = clients.get_data_client(source_conn)
-    target_client = clients.get_data_client(target_conn)
+    source_client = clients.get_shared_data_client(source_conn)
+    target_client = clients.get_shared_data_client(target_conn)
 
     config_managers = []
-    for config in yaml_configs[consts.YAML_VALIDATIONS]:
-        config[consts.CONFIG_SOURCE_CONN] = source_conn
-        config[consts.CONFIG_TARGET_CONN] = target_conn
-        config[consts.CONFIG_RESULT_HANDLER] = yaml_configs[consts.YAML_RESULT_HANDLER]
-        config_manager = ConfigManager(
-            config, source_client, target_client, verbose=args.verbose
-        )
-        config_manager.config[consts.CONFIG_FILE] = config_file_path
-        config_managers.append(config_manager)
+    try:
+        for config in yaml_configs[consts.YAML_VALIDATIONS]:
+            config[consts.CONFIG_SOURCE_CONN] = source_conn
+            config[consts.CONFIG_TARGET_CONN] = target_conn
+            config[consts.CONFIG_RESULT_HANDLER] = yaml_configs[
+                consts.YAML_RESULT_HANDLER
+            ]
+            _apply_cache_args(args, config)
+            config_manager = ConfigManager(
+                config, source_client, target_client, verbose=args.verbose
+            )
+            config_manager.config[consts.CONFIG_FILE] = config_file_path
+            config_managers.append(config_manager)
+    finally:
+        # Each ConfigManager checks out the shared clients for itself.
+        clients.release_shared_data_client(source_client)
+        clients.release_shared_data_client(target_client)
 
     return config_managers
 
@@ -419,20 +457,240 @@ def convert_config_to_yaml(args, config_managers):
     return yaml_config
 
 
-def run_validation(config_manager, verbose=False):
+def _get_data_validation(config_manager, verbose=False, profile=False):
+    """Return a DataValidation instance for the supplied config manager,
+    reusing its source and target clients."""
+    return DataValidation(
+        config_manager.config,
+        validation_builder=None,
+        result_handler=None,
+        verbose=verbose,
+        source_client=config_manager.source_client,
+        target_client=config_manager.target_client,
+        profile=profile,
+    )
+
+
+def _release_clients(config_managers):
+    """Release the shared clients checked out by the supplied configs, so
+    that they can be closed once idle. Released configs are not rerun."""
+    for config_manager in config_managers:
+        config_manager.release_clients()
+
+
+def _write_profile(validator, profile):
+    """Write the time spent in each stage of a validation with --profile."""
+    if profile:
+        validator.write_profile()
+
+
+def run_validation(config_manager, verbose=False, profile=False):
     """Run a single validation.
 
     Args:
         config_manager (ConfigManager): Validation config manager instance.
         verbose (bool): Validation setting to log queries run.
+        profile (bool): Validation setting to print the time of each stage.
     """
-    validator = DataValidation(
-        config_manager.config,
-        validation_builder=None,
-        result_handler=None,
-        verbose=verbose,
+    validator = _get_data_validation(config_manager, verbose=verbose, profile=profile)
+    try:
+        validator.execute()
+        _write_profile(validator, profile)
+    finally:
+        _release_clients([validator.config_manager, config_manager])
+
+
+def _get_validation_result(config_manager, verbose=False, profile=False):
+    """Run a single validation and return the validator with its report.
+
+    The Result Handler is not called so the caller can control the order
+    in which reports are written. The clients stay checked out by the
+    supplied config manager until the caller releases them.
+    """
+    validator = _get_data_validation(config_manager, verbose=verbose, profile=profile)
+    try:
+        return validator, validator.get_result_df()
+    finally:
+        validator.config_manager.release_clients()
+
+
+def _get_connection_names(config_manager):
+    """Return the names of the stored connections a validation uses."""
+    config = config_manager.config or {}
+    names = {
+        config.get(consts.CONFIG_SOURCE_CONN_NAME),
+        config.get(consts.CONFIG_TARGET_CONN_NAME),
+    }
+    return sorted(name for name in names if name)
+
+
+def _get_connection_slots(args, config_managers):
+    """Return a semaphore per connection name which bounds the validations
+    using it at once, or None without --connection-parallelism."""
+    limit = getattr(args, "connection_parallelism", None)
+    if not limit:
+        return None
+    return {
+        name: threading.BoundedSemaphore(limit)
+        for config_manager in config_managers
+        for name in _get_connection_names(config_manager)
+    }
+
+
+def _get_validation_result_in_slots(connection_slots, config_manager, **kwargs):
+    """Run a validation while holding a slot of each connection it uses."""
+    if not connection_slots:
+        return _get_validation_result(config_manager, **kwargs)
+    with contextlib.ExitStack() as stack:
+        # Slots are taken in name order so validations never wait on each other.
+        for name in _get_connection_names(config_manager):
+            stack.enter_context(connection_slots[name])
+        return _get_validation_result(config_manager, **kwargs)
+
+
+def _run_validations_in_parallel(args, config_managers, parallelism):
+    """Run validations on a bounded pool of worker threads.
+
+    Queries for up to `parallelism` validations are in flight at any time.
+    With `--connection-parallelism`, at most that many of them use the same
+    connection at once. Reports are passed to the Result Handlers in the order
+    of the supplied configs so output stays deterministic.
+
+    Args:
+        config_managers (list[ConfigManager]): List of config manager instances.
+        parallelism (int): Max number of validations to run concurrently.
+    """
+    profile = getattr(args, "profile", False)
+    connection_slots = _get_connection_slots(args, config_managers)
+    try:
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            futures = [
+                executor.submit(
+                    _get_validation_result_in_slots,
+                    connection_slots,
+                    config_manager,
+                    verbose=args.verbose,
+                    profile=profile,
+                )
+                for config_manager in config_managers
+            ]
+            for config_manager, future in zip(config_managers, futures):
+                config_file = (config_manager.config or {}).get(consts.CONFIG_FILE)
+                if config_file:
+                    logging.info(
+                        "Currently running the validation for yml file: %s",
+                        config_file,
+                    )
+                try:
+                    validator, result_df = future.result()
+                    validator.handle_result(result_df)
+                    _write_profile(validator, profile)
+                except Exception as e:
+                    if not config_file:
+                        for pending_future in futures:
+                            pending_future.cancel()
+                        raise
+                    logging.error(
+                        "Error %s occured while running config file %s. Skipping it for now.",
+                        str(e),
+                        config_file,
+                    )
+                finally:
+                    config_manager.release_clients()
+    finally:
+        _release_clients(config_managers)
+
+
+def _merge_partition_results(result_dfs, run_id=None):
+    """Return the reports of a table's partitions as a single report.
+
+    The merged report takes the supplied run_id, or the run_id of the first
+    partition with a report, as partitions may have no rows. It spans from
+    the earliest start_time to the latest end_time.
+    """
+    result_df = pandas.concat(result_dfs, ignore_index=True)
+    if result_df.empty:
+        return result_df
+    result_df["run_id"] = run_id or result_df["run_id"].iloc[0]
+    result_df["start_time"] = result_df["start_time"].min()
+    result_df["end_time"] = result_df["end_time"].max()
+    return result_df
+
+
+def run_partitioned_validations(args, config_managers):
+    """Run row validations split into `--partition-num` partitions per table.
+
+    Partition filters are generated in memory instead of YAML files. The
+    partitions of all tables share their table's clients and run on a pool
+    of `--parallelism` worker threads, bounded per connection by
+    `--connection-parallelism`. The partition reports of each table
+    are merged and passed to its Result Handler in table order.
+
+    Args:
+        config_managers (list[ConfigManager]): List of config manager instances.
+    """
+    partition_builder = PartitionBuilder(config_managers, args)
+    partition_config_managers = partition_builder.get_partition_config_managers()
+    try:
+        _run_partitions(args, config_managers, partition_config_managers)
+    finally:
+        _release_clients(
+            config_managers
+            + [
+                config_manager
+                for table_config_managers in partition_config_managers
+                for config_manager in table_config_managers
+            ]
+        )
+
+
+def _run_partitions(args, config_managers, partition_config_managers):
+    """Run the partitions of every table and handle the merged report of
+    each table, releasing the clients of a table once it is handled."""
+    parallelism = getattr(args, "parallelism", None) or 1
+    profile = getattr(args, "profile", False)
+    connection_slots = _get_connection_slots(
+        args,
+        [
+            config_manager
+            for table_config_managers in partition_config_managers
+            for config_manager in table_config_managers
+        ],
     )
-    validator.execute()
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        futures = [
+            [
+                executor.submit(
+                    _get_validation_result_in_slots,
+                    connection_slots,
+                    config_manager,
+                    verbose=args.verbose,
+                    profile=profile,
+                )
+                for config_manager in table_config_managers
+            ]
+            for table_config_managers in partition_config_managers
+        ]
+        try:
+            for config_manager, table_config_managers, table_futures in zip(
+                config_managers, partition_config_managers, futures
+            ):
+                results = [future.result() for future in table_futures]
+                validator = results[0][0]
+                validator.handle_result(
+                    _merge_partition_results(
+                        [result_df for _, result_df in results],
+                        run_id=validator.run_metadata.run_id,
+                    )
+                )
+                for partition_validator, _ in results:
+                    _write_profile(partition_validator, profile)
+                _release_clients(table_config_managers + [config_manager])
+        except Exception:
+            for table_futures in futures:
+                for future in table_futures:
+                    future.cancel()
+            raise
 
 
 def run_validations(args, config_managers):
@@ -441,7 +699,10 @@ def run_validations(args, config_managers):
     Args:
         config_managers (list[ConfigManager]): List of config manager instances.
     """
-    # TODO(issue/31): Add parallel execution logic
+    parallelism = getattr(args, "parallelism", None) or 1
+    if parallelism > 1 and len(config_managers) > 1:
+        return _run_validations_in_parallel(args, config_managers, parallelism)
+
     for config_manager in config_managers:
         if config_manager.config and consts.CONFIG_FILE in config_manager.config:
             logging.info(
@@ -449,7 +710,11 @@ def run_validations(args, config_managers):
                 config_manager.config[consts.CONFIG_FILE],
             )
             try:
-                run_validation(config_manager, verbose=args.verbose)
+                run_validation(
+                    config_manager,
+                    verbose=args.verbose,
+                    profile=getattr(args, "profile", False),
+                )
             except Exception as e:
                 logging.error(
                     "Error %s occured while running config file %s. Skipping it for now.",
@@ -457,7 +722,11 @@ def run_validations(args, config_managers):
                     config_manager.config[consts.CONFIG_FILE],
                 )
         else:
-            run_validation(config_manager, verbose=args.verbose)
+            run_validation(
+                config_manager,
+                verbose=args.verbose,
+                profile=getattr(args, "profile", False),
+            )
 
 
 def store_yaml_config_file(args, config_managers):
@@ -482,8 +751,11 @@ def partition_and_store_config_files(args: Namespace) -> None:
     """
     # Default Validate Type
     config_managers = build_config_managers_from_args(args, consts.ROW_VALIDATION)
-    partition_builder = PartitionBuilder(config_managers, args)
-    partition_builder.partition_configs()
+    try:
+        partition_builder = PartitionBuilder(config_managers, args)
+        partition_builder.partition_configs()
+    finally:
+        _release_clients(config_managers)
 
 
 def run(args) -> None:
@@ -498,10 +770,19 @@ def run(args) -> None:
         None
     """
     config_managers = build_config_managers_from_args(args)
-    if args.config_file:
-        store_yaml_config_file(args, config_managers)
-    else:
-        run_validations(args, config_managers)
+    try:
+        if args.config_file:
+            store_yaml_config_file(args, config_managers)
+        elif getattr(args, "partition_num", None):
+            if getattr(args, "incremental_column", None):
+                raise ValueError(
+                    "--incremental-column is not supported with --partition-num"
+                )
+            run_partitioned_validations(args, config_managers)
+        else:
+            run_validations(args, config_managers)
+    finally:
+        _release_clients(config_managers)
 
 
 def run_connections(args):
@@ -12,36 +12,245 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import json
 import os
-from data_validation import data_validation
+import threading
+from data_validation import data_validation, jobs, metrics
+from data_validation.exceptions import JobQueueFull
 import flask
 import pandas
+import pyarrow
+import pyarrow.parquet
 import logging
 
 app = flask.Flask(__name__)
 
+# Validations beyond the limit wait for a slot and are reported as queued.
+MAX_CONCURRENT_VALIDATIONS = int(os.environ.get("MAX_CONCURRENT_VALIDATIONS", 0))
+_validation_slots = (
+    threading.BoundedSemaphore(MAX_CONCURRENT_VALIDATIONS)
+    if MAX_CONCURRENT_VALIDATIONS > 0
+    else None
+)
+
+
+# Whether the bytes fetched of the metrics include the memory of strings,
+# which visits every value fetched. Otherwise only fixed width values and
+# string pointers are counted.
+METRICS_DEEP_BYTES = os.environ.get("METRICS_DEEP_BYTES", "").lower() in [
+    "1",
+    "true",
+]
+
+# Rows of a report serialized per chunk of a streamed response
+RESULT_CHUNK_ROWS = 10000
+
+RESPONSE_FORMAT_JSON = "json"
+RESPONSE_FORMAT_NDJSON = "ndjson"
+RESPONSE_FORMAT_ARROW = "arrow"
+RESPONSE_FORMAT_PARQUET = "parquet"
+RESPONSE_CONTENT_TYPES = {
+    RESPONSE_FORMAT_JSON: "application/json",
+    RESPONSE_FORMAT_NDJSON: "application/x-ndjson",
+    RESPONSE_FORMAT_ARROW: "application/vnd.apache.arrow.stream",
+    RESPONSE_FORMAT_PARQUET: "application/vnd.apache.parquet",
+}
+
+
+def _stringify_timestamps(series):
+    """Return a timestamp column as the strings of its pandas.Timestamps."""
+    if pandas.api.types.is_datetime64_any_dtype(series):
+        # Unlike naive columns, each value of a tz-aware column is formatted
+        # on its own, the same way as str(pandas.Timestamp).
+        if series.dt.tz is None:
+            text = series.dt.tz_localize("UTC").astype(str).str[: -len("+00:00")]
+        else:
+            text = series.astype(str)
+        return text.where(series.notna(), None)
+    inferred_type = pandas.api.types.infer_dtype(series, skipna=True)
+    if inferred_type in ["datetime", "mixed", "mixed-integer"]:
+        return series.map(
+            lambda value: str(value) if isinstance(value, pandas.Timestamp) else value
+        )
+    return series
+
+
+def _clean_rows(df):
+    df = df.apply(_stringify_timestamps) if len(df.columns) else df
+    return df.to_dict(orient="records")
+
 
 def _clean_dataframe(df):
-    rows = df.to_dict(orient="record")
-    for row in rows:
-        for key in row:
-            if type(row[key]) in [pandas.Timestamp]:
-                row[key] = str(row[key])
+    return json.dumps(_clean_rows(df))
+
+
+def _iter_chunks(df, chunk_rows):
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start : start + chunk_rows]
+
+
+def _iter_batch_chunks(batches):
+    """Yield Arrow record batches as DataFrames of Python values, which
+    serialize to JSON like the rows of the original report."""
+    for batch in batches:
+        yield pandas.DataFrame(batch.to_pylist())
+
+
+def _iter_json_chunks(chunks):
+    yield "["
+    for position, chunk in enumerate(chunks):
+        rows = json.dumps(_clean_rows(chunk))[1:-1]
+        yield rows if position == 0 else ", " + rows
+    yield "]"
+
+
+def _iter_json(df, chunk_rows=RESULT_CHUNK_ROWS):
+    """Yield the rows of a report as a JSON array, one chunk at a time."""
+    return _iter_json_chunks(_iter_chunks(df, chunk_rows))
+
+
+def _iter_ndjson_chunks(chunks):
+    for chunk in chunks:
+        yield "".join(json.dumps(row) + "\n" for row in _clean_rows(chunk))
+
+
+def _iter_ndjson(df, chunk_rows=RESULT_CHUNK_ROWS):
+    """Yield the rows of a report as newline delimited JSON, one chunk at a
+    time so the full response is never held in memory."""
+    return _iter_ndjson_chunks(_iter_chunks(df, chunk_rows))
+
+
+def _iter_arrow(schema, batches):
+    """Yield Arrow record batches as an IPC stream, one batch at a time."""
+    sink = io.BytesIO()
+    with pyarrow.ipc.new_stream(sink, schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            yield sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+    yield sink.getvalue()
+
+
+def _get_parquet(schema, batches):
+    """Return record batches as a Parquet file, which is only complete once
+    written."""
+    buffer = io.BytesIO()
+    with pyarrow.parquet.ParquetWriter(buffer, schema) as writer:
+        for batch in batches:
+            writer.write_table(pyarrow.Table.from_batches([batch], schema=schema))
+    return buffer.getvalue()
+
+
+def _get_response_format(request, default_format):
+    response_format = request.args.get("format", default_format)
+    if response_format not in RESPONSE_CONTENT_TYPES:
+        flask.abort(
+            400,
+            description=f"Unknown format {response_format}, expected one of "
+            f"{list(RESPONSE_CONTENT_TYPES)}",
+        )
+    return response_format
 
-    return json.dumps(rows)
+
+def _get_response(df, response_format):
+    """Return a streamed response with a report in the requested format.
+
+    Arrow and Parquet reports are converted before the response starts, so
+    reports they can not represent fail with an error, not a partial body.
+    """
+    if response_format in [RESPONSE_FORMAT_ARROW, RESPONSE_FORMAT_PARQUET]:
+        table = pyarrow.Table.from_pandas(df, preserve_index=False)
+        return _get_batches_response(
+            table.schema,
+            table.to_batches(max_chunksize=RESULT_CHUNK_ROWS),
+            response_format,
+        )
+    if response_format == RESPONSE_FORMAT_NDJSON:
+        body = _iter_ndjson(df)
+    else:
+        body = _iter_json(df)
+    return flask.Response(
+        flask.stream_with_context(body),
+        content_type=RESPONSE_CONTENT_TYPES[response_format],
+    )
+
+
+def _get_batches_response(schema, batches, response_format):
+    """Return a streamed response with the Arrow record batches of a report
+    in the requested format."""
+    if response_format == RESPONSE_FORMAT_ARROW:
+        body = _iter_arrow(schema, batches)
+    elif response_format == RESPONSE_FORMAT_PARQUET:
+        body = [_get_parquet(schema, batches)]
+    elif response_format == RESPONSE_FORMAT_NDJSON:
+        body = _iter_ndjson_chunks(_iter_batch_chunks(batches))
+    else:
+        body = _iter_json_chunks(_iter_batch_chunks(batches))
+    return flask.Response(
+        flask.stream_with_context(body),
+        content_type=RESPONSE_CONTENT_TYPES[response_format],
+    )
 
 
 def _get_request_content(request):
     return request.json
 
 
+def _execute_validation(config):
+    validator = None
+    metrics.start_validation(config)
+    try:
+        validator = data_validation.DataValidation(
+            config, deep_bytes=METRICS_DEEP_BYTES
+        )
+        # The service responds with the full report, even for streaming
+        # comparisons which would otherwise pass it to the handler in parts.
+        df = validator.handle_result(validator.get_result_df())
+    except Exception:
+        metrics.finish_validation(
+            config,
+            run_metadata=validator.run_metadata if validator else None,
+            status="error",
+        )
+        raise
+    finally:
+        if validator:
+            validator.config_manager.release_clients()
+    metrics.finish_validation(config, run_metadata=validator.run_metadata)
+    return df
+
+
+def _run_validation(config):
+    if _validation_slots is None:
+        return _execute_validation(config)
+
+    metrics.VALIDATIONS_QUEUED.inc()
+    _validation_slots.acquire()
+    metrics.VALIDATIONS_QUEUED.dec()
+    try:
+        return _execute_validation(config)
+    finally:
+        _validation_slots.release()
+
+
 def validate(config):
     """Run Data Validation against the supplied config."""
-    validator = data_validation.DataValidation(config)
-    df = validator.execute()
+    return _clean_dataframe(_run_validation(config))
+
 
-    return _clean_dataframe(df)
+job_manager = jobs.JobManager(
+    _execute_validation,
+    max_workers=int(os.environ.get("JOB_WORKERS", jobs.DEFAULT_JOB_WORKERS)),
+    max_finished_jobs=int(
+        os.environ.get("MAX_FINISHED_JOBS", jobs.DEFAULT_MAX_FINISHED_JOBS)
+    ),
+    max_queued_jobs=int(
+        os.environ.get("MAX_QUEUED_JOBS", jobs.DEFAULT_MAX_QUEUED_JOBS)
+    ),
+    result_directory=os.environ.get("JOB_RESULT_DIRECTORY"),
+)
 
 
 def main(request):
@@ -58,15 +267,71 @@ def main(request):
 
 @app.route("/", methods=["POST"])
 def run():
+    response_format = _get_response_format(flask.request, RESPONSE_FORMAT_JSON)
     try:
         config = _get_request_content(flask.request)
-        result = validate(config)
-        return str(result)
+        return _get_response(_run_validation(config), response_format)
     except Exception as e:
         logging.exception(e)
         return "Found Error: {}".format(e)
 
 
+@app.route("/jobs", methods=["POST"])
+def submit_job():
+    config = _get_request_content(flask.request)
+    try:
+        job = job_manager.submit(config)
+    except JobQueueFull as e:
+        flask.abort(429, description=str(e))
+    response = flask.jsonify(job.to_dict())
+    response.status_code = 202
+    response.headers["Location"] = flask.url_for("get_job", job_id=job.job_id)
+    return response
+
+
+def _get_job_or_404(job_id):
+    job = job_manager.get(job_id)
+    if job is None:
+        flask.abort(404, description=f"Unknown job: {job_id}")
+    return job
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    return flask.jsonify(_get_job_or_404(job_id).to_dict())
+
+
+@app.route("/jobs/<job_id>/results", methods=["GET"])
+def get_job_results(job_id):
+    """Return the report of a succeeded job, as newline delimited JSON unless
+    another `format` is requested.
+
+    The optional `offset` and `limit` query parameters return a page of the
+    report's rows, otherwise all rows are streamed. Rows are read from the
+    report file of the job one row group at a time.
+    """
+    response_format = _get_response_format(flask.request, RESPONSE_FORMAT_NDJSON)
+    job = _get_job_or_404(job_id)
+    if job.status != jobs.JOB_STATUS_SUCCEEDED:
+        flask.abort(409, description=f"Job {job_id} is {job.status}")
+
+    offset = flask.request.args.get("offset", 0, type=int)
+    limit = flask.request.args.get("limit", None, type=int)
+    return _get_batches_response(
+        job.get_result_schema(),
+        job.iter_results(offset=offset, limit=limit),
+        response_format,
+    )
+
+
+@app.route("/metrics", methods=["GET"])
+def get_metrics():
+    content = metrics.render()
+    if content is None:
+        flask.abort(501, description="Install prometheus-client to export metrics.")
+    return flask.Response(content, content_type=metrics.CONTENT_TYPE)
+
+
 @app.route("/test", methods=["POST"])
 def other():
     return _get_request_content(flask.request)
@@ -170,6 +170,11 @@ def configure_arg_parser():
         usage=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
     )
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose logging")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write the time, rows and bytes of each stage of a validation",
+    )
     parser.add_argument(
         "--log-level",
         "-ll",
@@ -335,6 +340,40 @@ def _configure_validation_config_parser(subparsers):
         "-cdir",
         help="Directory path containing YAML Config Files to be used for running validations.",
     )
+    run_parser.add_argument(
+        "--parallelism",
+        "-par",
+        type=positive_int,
+        default=1,
+        help="Number of validations to run concurrently (default 1).",
+    )
+    run_parser.add_argument(
+        "--connection-parallelism",
+        "-cpar",
+        type=positive_int,
+        help="Max number of validations using the same connection concurrently.",
+    )
+    run_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Read and store aggregate query results in the local query cache",
+    )
+    run_parser.add_argument(
+        "--cache-ttl",
+        "-cttl",
+        type=positive_int,
+        help="Seconds a cached query result is valid for (default no expiry)",
+    )
+    run_parser.add_argument(
+        "--cache-version",
+        "-cver",
+        help="Token such as a table snapshot id, cached results of other tokens are not used",
+    )
+    run_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not use the query cache, even if enabled in the YAML config",
+    )
 
     get_parser = configs_subparsers.add_parser(
         "get", help="Get and print a validation config"
@@ -440,13 +479,94 @@ def _configure_row_parser(row_parser):
         "--use-random-row",
         "-rr",
         action="store_true",
-        help="Finds a set of random rows of the first primary key supplied.",
+        help="Finds a set of random rows by all primary keys supplied.",
     )
     optional_arguments.add_argument(
         "--random-row-batch-size",
         "-rbs",
         help="Row batch size used for random row filters (default 10,000).",
     )
+    optional_arguments.add_argument(
+        "--random-row-confidence",
+        "-rrc",
+        type=float,
+        help=(
+            "Confidence level, e.g. 0.95, random rows are sampled with. The "
+            "sample size is derived from it in place of --random-row-batch-size."
+        ),
+    )
+    optional_arguments.add_argument(
+        "--random-row-error",
+        "-rre",
+        type=float,
+        help="Margin of error of samples sized by --random-row-confidence (default 0.01).",
+    )
+    optional_arguments.add_argument(
+        "--merkle",
+        "-mk",
+        action="store_true",
+        help=(
+            "Compare --hash row hashes in buckets summarized in the database "
+            "and only fetch the rows of differing buckets"
+        ),
+    )
+    optional_arguments.add_argument(
+        "--fingerprint",
+        "-fp",
+        action="store_true",
+        help=(
+            "Compare one fingerprint of the --hash row hashes per table and "
+            "only compare rows when the fingerprints differ"
+        ),
+    )
+    optional_arguments.add_argument(
+        "--incremental-column",
+        "-incc",
+        help=(
+            "Only validate rows above the high-water mark of this column "
+            "stored by the previous run"
+        ),
+    )
+    optional_arguments.add_argument(
+        "--incremental-name",
+        "-incn",
+        help="Name to store the incremental watermark under (default source table)",
+    )
+    optional_arguments.add_argument(
+        "--memory-budget-mb",
+        "-mb",
+        type=positive_int,
+        help=(
+            "Compare rows in hash partitions spilled to local disk so that "
+            "comparison memory stays within this many MB"
+        ),
+    )
+    optional_arguments.add_argument(
+        "--partition-num",
+        "-pn",
+        type=int,
+        choices=range(1, 1001),
+        metavar="[1-1000]",
+        help=(
+            "Split each table into this many partitions and validate them "
+            "concurrently in process, merging the partition reports"
+        ),
+    )
+    optional_arguments.add_argument(
+        "--partition-key",
+        "-partkey",
+        help=(
+            "Comma separated list of columns on which the partitions would be "
+            "generated. Defaults to Primary key (all Primary keys for hash-mod)"
+        ),
+    )
+    optional_arguments.add_argument(
+        "--partition-type",
+        "-ptype",
+        choices=consts.PARTITION_TYPES,
+        default=consts.PARTITION_TYPE_RANGE,
+        help="Partitioning strategy used with --partition-num. Defaults to range",
+    )
 
     # Group required arguments
     required_arguments = row_parser.add_argument_group("required arguments")
@@ -557,6 +677,21 @@ def _configure_column_parser(column_parser):
         "-rbs",
         help="Row batch size used for random row filters (default 10,000).",
     )
+    optional_arguments.add_argument(
+        "--random-row-confidence",
+        "-rrc",
+        type=float,
+        help=(
+            "Confidence level, e.g. 0.95, random rows are sampled with. The "
+            "sample size is derived from it in place of --random-row-batch-size."
+        ),
+    )
+    optional_arguments.add_argument(
+        "--random-row-error",
+        "-rre",
+        type=float,
+        help="Margin of error of samples sized by --random-row-confidence (default 0.01).",
+    )
     optional_arguments.add_argument(
         "--wildcard-include-string-len",
         "-wis",
@@ -569,6 +704,28 @@ def _configure_column_parser(column_parser):
         action="store_true",
         help="Cast any int32 fields to int64 for large aggregations.",
     )
+    optional_arguments.add_argument(
+        "--incremental-column",
+        "-incc",
+        help=(
+            "Only validate rows above the high-water mark of this column "
+            "stored by the previous run"
+        ),
+    )
+    optional_arguments.add_argument(
+        "--incremental-name",
+        "-incn",
+        help="Name to store the incremental watermark under (default source table)",
+    )
+    optional_arguments.add_argument(
+        "--cumulative",
+        "-cuml",
+        action="store_true",
+        help=(
+            "Roll count, sum, min and max results of an incremental validation "
+            "into the stored cumulative results"
+        ),
+    )
 
     # Group required arguments
     required_arguments = column_parser.add_argument_group("required arguments")
@@ -834,6 +991,32 @@ def _add_common_arguments(optional_arguments, required_arguments):
     optional_arguments.add_argument(
         "--bq-result-handler", "-bqrh", help="BigQuery result handler config details"
     )
+    optional_arguments.add_argument(
+        "--bq-write-mode",
+        "-bqwm",
+        choices=consts.BQ_WRITE_MODES,
+        help=(
+            "How the BigQuery result handler writes results: 'streaming' "
+            "inserts (default) or a 'load' job from a local file"
+        ),
+    )
+    optional_arguments.add_argument(
+        "--file-result-handler",
+        "-frh",
+        help="Local or GCS directory to append validation results to as files",
+    )
+    optional_arguments.add_argument(
+        "--file-result-format",
+        "-frf",
+        choices=consts.RESULT_FILE_FORMATS,
+        help="File format of the file result handler, defaults to parquet",
+    )
+    optional_arguments.add_argument(
+        "--file-result-partition-by",
+        "-frp",
+        choices=list(consts.RESULT_PARTITION_COLUMNS),
+        help="Write file results to run_id=<id>/ or table=<name>/ directories",
+    )
     optional_arguments.add_argument(
         "--labels", "-l", help="Key value pair labels for validation run"
     )
@@ -842,6 +1025,27 @@ def _add_common_arguments(optional_arguments, required_arguments):
         "-sa",
         help="Path to SA key file for result handler output",
     )
+    optional_arguments.add_argument(
+        "--cache",
+        action="store_true",
+        help="Read and store aggregate query results in the local query cache",
+    )
+    optional_arguments.add_argument(
+        "--cache-ttl",
+        "-cttl",
+        type=positive_int,
+        help="Seconds a cached query result is valid for (default no expiry)",
+    )
+    optional_arguments.add_argument(
+        "--cache-version",
+        "-cver",
+        help="Token such as a table snapshot id, cached results of other tokens are not used",
+    )
+    optional_arguments.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not use the query cache, even if --cache is supplied",
+    )
     optional_arguments.add_argument(
         "--config-file",
         "-c",
@@ -860,6 +1064,38 @@ def _add_common_arguments(optional_arguments, required_arguments):
         # TODO: update if we start to support other statuses
         help="Comma separated list of statuses to filter the validation results. Supported statuses are (success, fail). If no list is provided, all statuses are returned",
     )
+    optional_arguments.add_argument(
+        "--parallelism",
+        "-par",
+        type=positive_int,
+        default=1,
+        help="Number of tables to validate concurrently (default 1).",
+    )
+    optional_arguments.add_argument(
+        "--connection-parallelism",
+        "-cpar",
+        type=positive_int,
+        help="Max number of tables or partitions using the same connection concurrently.",
+    )
+    optional_arguments.add_argument(
+        "--combiner",
+        "-comb",
+        choices=consts.COMBINER_TYPES,
+        default=consts.COMBINER_IBIS,
+        help=(
+            "Implementation used to combine source and target results into the "
+            "report: 'ibis' (default) or 'native' vectorized pandas"
+        ),
+    )
+    optional_arguments.add_argument(
+        "--remote-combine",
+        "-rc",
+        action="store_true",
+        help=(
+            "Combine source and target results with a single query on the "
+            "database when both use the same connection"
+        ),
+    )
 
 
 def _add_common_partition_arguments(optional_arguments, required_arguments):
@@ -898,6 +1134,32 @@ def _add_common_partition_arguments(optional_arguments, required_arguments):
         "-bqrh",
         help="BigQuery result handler config details",
     )
+    optional_arguments.add_argument(
+        "--bq-write-mode",
+        "-bqwm",
+        choices=consts.BQ_WRITE_MODES,
+        help=(
+            "How the BigQuery result handler writes results: 'streaming' "
+            "inserts (default) or a 'load' job from a local file"
+        ),
+    )
+    optional_arguments.add_argument(
+        "--file-result-handler",
+        "-frh",
+        help="Local or GCS directory to append validation results to as files",
+    )
+    optional_arguments.add_argument(
+        "--file-result-format",
+        "-frf",
+        choices=consts.RESULT_FILE_FORMATS,
+        help="File format of the file result handler, defaults to parquet",
+    )
+    optional_arguments.add_argument(
+        "--file-result-partition-by",
+        "-frp",
+        choices=list(consts.RESULT_PARTITION_COLUMNS),
+        help="Write file results to run_id=<id>/ or table=<name>/ directories",
+    )
     optional_arguments.add_argument(
         "--labels", "-l", help="Key value pair labels for validation run"
     )
@@ -929,10 +1191,29 @@ def _add_common_partition_arguments(optional_arguments, required_arguments):
         "--partition-key",
         "-partkey",
         help=(
-            "Column on which the partitions would be generated. "
-            "Column type must be integer. Defaults to Primary key"
+            "Comma separated list of columns on which the partitions would be "
+            "generated. Defaults to Primary key (all Primary keys for hash-mod)"
+        ),
+    )
+    optional_arguments.add_argument(
+        "--partition-type",
+        "-ptype",
+        choices=consts.PARTITION_TYPES,
+        default=consts.PARTITION_TYPE_RANGE,
+        help=(
+            "Partitioning strategy: 'range' splits an integer key into equal "
+            "width ranges, 'hash-mod' assigns rows by the remainder of integer "
+            "keys, 'quantile' splits the key into equal population ranges. "
+            "Defaults to range"
         ),
     )
+    optional_arguments.add_argument(
+        "--parallelism",
+        "-par",
+        type=positive_int,
+        default=4,
+        help="Number of tables to probe for partition bounds concurrently (default 4).",
+    )
 
 
 def get_connection_config_from_args(args):
@@ -973,6 +1254,18 @@ def threshold_float(x):
     return x
 
 
+def positive_int(x):
+    """Restrict arg to be a positive integer."""
+    try:
+        x = int(x)
+    except ValueError:
+        raise argparse.ArgumentTypeError("%r not an integer literal" % (x,))
+
+    if x < 1:
+        raise argparse.ArgumentTypeError("%r must be a positive integer" % (x,))
+    return x
+
+
 def _generate_random_name(conn):
     name = f"{conn[consts.SOURCE_TYPE]}_{str(uuid.uuid4())}"
     return name
@@ -1072,11 +1365,12 @@ def get_filters(filter_value):
     return filter_config
 
 
-def get_result_handler(rc_value, sa_file=None):
+def get_result_handler(rc_value, sa_file=None, write_mode=None):
     """Returns dict of result handler config. Backwards compatible for JSON input.
 
     rc_value (str): Result config argument specified.
     sa_file (str): SA path argument specified.
+    write_mode (str): BigQuery write mode argument specified.
     """
     config = rc_value.split(".", 1)
     if len(config) == 2:
@@ -1090,10 +1384,30 @@ def get_result_handler(rc_value, sa_file=None):
 
     if sa_file:
         result_handler["google_service_account_key_path"] = sa_file
+    if write_mode:
+        result_handler[consts.BQ_WRITE_MODE] = write_mode
 
     return result_handler
 
 
+def get_file_result_handler(directory, file_format=None, partition_by=None):
+    """Returns dict of file result handler config.
+
+    directory (str): Local or GCS directory argument specified.
+    file_format (str): File format argument specified.
+    partition_by (str): Partition argument specified.
+    """
+    result_handler = {
+        consts.CONFIG_TYPE: "File",
+        consts.RESULT_DIRECTORY: directory,
+    }
+    if file_format:
+        result_handler[consts.RESULT_FILE_FORMAT] = file_format
+    if partition_by:
+        result_handler[consts.RESULT_PARTITION_BY] = partition_by
+    return result_handler
+
+
 def get_arg_list(arg_value, default_value=None):
     """Returns list of values from argument provided. Backwards compatible for JSON input.
 
@@ -1213,7 +1527,15 @@ def get_pre_build_configs(args: Namespace, validate_cmd: str) -> List[Dict]:
     # Get result handler config
     if args.bq_result_handler:
         result_handler_config = get_result_handler(
-            args.bq_result_handler, args.service_account
+            args.bq_result_handler,
+            args.service_account,
+            getattr(args, "bq_write_mode", None),
+        )
+    elif getattr(args, "file_result_handler", None):
+        result_handler_config = get_file_result_handler(
+            args.file_result_handler,
+            getattr(args, "file_result_format", None),
+            getattr(args, "file_result_partition_by", None),
         )
     else:
         result_handler_config = None
@@ -1235,8 +1557,12 @@ def get_pre_build_configs(args: Namespace, validate_cmd: str) -> List[Dict]:
 
     # Get source and target clients
     mgr = state_manager.StateManager()
-    source_client = clients.get_data_client(mgr.get_connection_config(args.source_conn))
-    target_client = clients.get_data_client(mgr.get_connection_config(args.target_conn))
+    source_client = clients.get_shared_data_client(
+        mgr.get_connection_config(args.source_conn)
+    )
+    target_client = clients.get_shared_data_client(
+        mgr.get_connection_config(args.target_conn)
+    )
 
     # Get format: text, csv, json, table. Default is table
     format = args.format if args.format else "table"
@@ -1245,6 +1571,8 @@ def get_pre_build_configs(args: Namespace, validate_cmd: str) -> List[Dict]:
     # custom-query validation and generate-table-partitions
     use_random_rows = None
     random_row_batch_size = None
+    random_row_confidence = None
+    random_row_error = None
     if (
         args.command != "generate-table-partitions"
         and config_type != consts.SCHEMA_VALIDATION
@@ -1252,6 +1580,8 @@ def get_pre_build_configs(args: Namespace, validate_cmd: str) -> List[Dict]:
     ):
         use_random_rows = args.use_random_row
         random_row_batch_size = args.random_row_batch_size
+        random_row_confidence = getattr(args, "random_row_confidence", None)
+        random_row_error = getattr(args, "random_row_error", None)
 
     # Get table list. Not supported in case of custom query validation
     is_filesystem = source_client._source_type == "FileSystem"
@@ -1286,11 +1616,25 @@ def get_pre_build_configs(args: Namespace, validate_cmd: str) -> List[Dict]:
             "format": format,
             "use_random_rows": use_random_rows,
             "random_row_batch_size": random_row_batch_size,
+            "random_row_confidence": random_row_confidence,
+            "random_row_error": random_row_error,
             "source_client": source_client,
             "target_client": target_client,
             "result_handler_config": result_handler_config,
             "filter_config": filter_config,
             "filter_status": filter_status,
+            "combiner": getattr(args, "combiner", None),
+            "memory_budget_mb": getattr(args, "memory_budget_mb", None),
+            "process_in_memory": not getattr(args, "remote_combine", False),
+            "incremental_column": getattr(args, "incremental_column", None),
+            "incremental_name": getattr(args, "incremental_name", None),
+            "cumulative": getattr(args, "cumulative", False),
+            "cache": getattr(args, "cache", False)
+            and not getattr(args, "no_cache", False),
+            "cache_ttl": getattr(args, "cache_ttl", None),
+            "cache_version": getattr(args, "cache_version", None),
+            "merkle": getattr(args, "merkle", False),
+            "fingerprint": getattr(args, "fingerprint", False),
             "verbose": args.verbose,
         }
         pre_build_configs_list.append(pre_build_configs)
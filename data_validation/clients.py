@@ -13,28 +13,47 @@
 # limitations under the License.
 
 
+import collections
 import copy
-import warnings
+import importlib
+import itertools
+import json
 import logging
+import sys
+import threading
+import time
+import warnings
+from collections.abc import Mapping
+
 import google.oauth2.service_account
 import ibis
 import ibis.backends.pandas
 import ibis_bigquery
 import pandas
+import pyarrow
+import sqlalchemy
 import third_party.ibis.ibis_addon.datatypes
 import third_party.ibis.ibis_addon.base_sqlalchemy.alchemy
-import third_party.ibis.ibis_postgres.client
 from google.cloud import bigquery
-from ibis.backends.mysql.client import MySQLClient
 from ibis.backends.pandas.client import PandasClient
-from ibis.backends.postgres.client import PostgreSQLClient
-from third_party.ibis.ibis_cloud_spanner.api import connect as spanner_connect
-from third_party.ibis.ibis_impala.api import impala_connect
 from data_validation import client_info, consts, exceptions
 from data_validation.secret_manager import SecretManagerBuilder
 
 ibis.options.sql.default_limit = None
 
+# Shared clients unused for longer than this are evicted from the registry.
+DEFAULT_CLIENT_IDLE_SECONDS = 600
+
+# Shared clients are health checked at most once per interval.
+DEFAULT_CLIENT_HEALTH_CHECK_SECONDS = 60
+
+# Rows per batch yielded by iter_record_batches and iter_dataframes.
+DEFAULT_FETCH_BATCH_ROWS = 10000
+
+# FileSystem clients hold file contents in memory, so they are not shared
+# in case the files change.
+UNSHARED_SOURCE_TYPES = ["FileSystem"]
+
 # Our customized Ibis Datatype logic add support for new types
 third_party.ibis.ibis_addon.datatypes
 
@@ -58,38 +77,61 @@ def _raise_missing_client_error(msg):
     return get_client_call
 
 
-# If you have a Teradata License there is an optional teradatasql import
-try:
-    from third_party.ibis.ibis_teradata.client import TeradataClient
-except Exception:
-    msg = "pip install teradatasql (requires Teradata licensing)"
-    TeradataClient = _raise_missing_client_error(msg)
+class _LazyClientLookup(Mapping):
+    """Source types mapped to their client, each backend and its
+    third_party.ibis addons imported on first lookup."""
+
+    def __init__(self, client_imports):
+        self._client_imports = client_imports
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, source_type):
+        module_name, attribute, missing_msg = self._client_imports[source_type]
+        with self._lock:
+            if source_type not in self._clients:
+                try:
+                    module = importlib.import_module(module_name)
+                    self._clients[source_type] = getattr(module, attribute)
+                except Exception:
+                    if missing_msg is None:
+                        raise
+                    self._clients[source_type] = _raise_missing_client_error(
+                        missing_msg
+                    )
+            return self._clients[source_type]
+
+    def __iter__(self):
+        return iter(self._client_imports)
+
+    def __len__(self):
+        return len(self._client_imports)
+
+
+# Client classes by source type, used to check the type of a client without
+# importing backends that were never used.
+CLIENT_CLASSES = {
+    "MySQL": ("ibis.backends.mysql.client", "MySQLClient"),
+    "Oracle": ("third_party.ibis.ibis_oracle.client", "OracleClient"),
+    "Postgres": ("ibis.backends.postgres.client", "PostgreSQLClient"),
+    "Teradata": ("third_party.ibis.ibis_teradata.client", "TeradataClient"),
+    "MSSQL": ("third_party.ibis.ibis_mssql.client", "MSSQLClient"),
+    "DB2": ("third_party.ibis.ibis_DB2.client", "DB2Client"),
+    "Spanner": ("third_party.ibis.ibis_cloud_spanner.client", "CloudSpannerClient"),
+}
 
-# If you have an cx_Oracle driver installed
-try:
-    from third_party.ibis.ibis_oracle.client import OracleClient
-except Exception:
-    OracleClient = _raise_missing_client_error("pip install cx_Oracle")
 
-try:
-    from third_party.ibis.ibis_mssql.client import MSSQLClient
-except Exception:
-    MSSQLClient = _raise_missing_client_error("pip install pyodbc")
+def get_client_class(source_type):
+    """Return the client class of a source type, or None if its backend
+    has not been imported, in which case no such client exists."""
+    module_name, class_name = CLIENT_CLASSES[source_type]
+    return getattr(sys.modules.get(module_name), class_name, None)
 
-try:
-    from third_party.ibis.ibis_snowflake.client import (
-        SnowflakeClient as snowflake_connect,
-    )
-except Exception:
-    snowflake_connect = _raise_missing_client_error(
-        "pip install snowflake-connector-python"
-    )
 
-# If you have Db2 client installed
-try:
-    from third_party.ibis.ibis_DB2.client import DB2Client
-except Exception:
-    DB2Client = _raise_missing_client_error("pip install ibm_db_sa")
+def _is_client_type(client, source_types):
+    return any(
+        get_client_class(source_type) is type(client) for source_type in source_types
+    )
 
 
 def get_bigquery_client(project_id, dataset_id=None, credentials=None):
@@ -127,11 +169,7 @@ def get_pandas_client(table_name, file_path, file_type):
 
 
 def is_oracle_client(client):
-    try:
-        return isinstance(client, OracleClient)
-    except TypeError:
-        # When no Oracle client has been installed OracleClient is not a class
-        return False
+    return _is_client_type(client, ["Oracle"])
 
 
 def get_ibis_table(client, schema_name, table_name, database_name=None):
@@ -142,12 +180,7 @@ def get_ibis_table(client, schema_name, table_name, database_name=None):
     table_name (str): Table name of table object
     database_name (str): Database name (generally default is used)
     """
-    if type(client) in [
-        OracleClient,
-        PostgreSQLClient,
-        DB2Client,
-        MSSQLClient,
-    ]:
+    if _is_client_type(client, ["Oracle", "Postgres", "DB2", "MSSQL"]):
         return client.table(table_name, database=database_name, schema=schema_name)
     elif type(client) in [PandasClient]:
         return client.table(table_name, schema=schema_name)
@@ -160,6 +193,113 @@ def get_ibis_query(client, query):
     return client.sql(query)
 
 
+def _rows_to_record_batch(rows, names):
+    """Return a list of row tuples as a RecordBatch of typed columns."""
+    return pyarrow.RecordBatch.from_arrays(
+        [pyarrow.array(column, from_pandas=True) for column in zip(*rows)],
+        names=names,
+    )
+
+
+def _iter_row_batches(rows, names, batch_rows):
+    """Group an iterator of row tuples into RecordBatches of batch_rows rows."""
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, batch_rows))
+        if not chunk:
+            return
+        yield _rows_to_record_batch(chunk, names)
+
+
+def _iter_dataframe_slices(df, batch_rows):
+    for start in range(0, len(df), batch_rows):
+        yield df.iloc[start : start + batch_rows].reset_index(drop=True)
+
+
+def _iter_sqlalchemy_rows(client, expr):
+    """Return the column names and a server side cursor over the rows."""
+    with client.con.connect() as connection:
+        result = connection.execution_options(stream_results=True).execute(
+            expr.compile()
+        )
+        yield list(result.keys())
+        yield from result
+
+
+def _iter_bigquery_rows(client, expr, batch_rows):
+    rows = client.client.query(expr.compile()).result(page_size=batch_rows)
+    yield [field.name for field in rows.schema]
+    for row in rows:
+        yield tuple(row.values())
+
+
+def _iter_spanner_rows(client, expr):
+    with client._get_database().snapshot() as snapshot:
+        results = snapshot.execute_sql(expr.compile())
+        rows = iter(results)
+        first_row = next(rows, None)
+        # Spanner only knows the result columns once the first row is read.
+        yield [field.name for field in results.fields or []]
+        if first_row is not None:
+            yield tuple(first_row)
+            yield from (tuple(row) for row in rows)
+
+
+def supports_streaming(client):
+    """Return whether results of the client are streamed by iter_record_batches
+    rather than fetched at once and then split."""
+    return (
+        isinstance(getattr(client, "con", None), sqlalchemy.engine.Engine)
+        or isinstance(client, ibis_bigquery.BigQueryClient)
+        or _is_client_type(client, ["Spanner"])
+    )
+
+
+def iter_record_batches(client, expr, batch_rows=DEFAULT_FETCH_BATCH_ROWS):
+    """Yield the results of a table expression as pyarrow RecordBatches.
+
+    Results of SQLAlchemy based, BigQuery and Spanner clients are streamed
+    from the database, so only one batch of rows is held in memory at a
+    time. Other clients fetch the full result and split it.
+
+    client (IbisClient): Client to run the query
+    expr (ibis.expr.types.TableExpr): Query to fetch
+    batch_rows (int): Max number of rows per batch
+    """
+    if isinstance(getattr(client, "con", None), sqlalchemy.engine.Engine):
+        rows = _iter_sqlalchemy_rows(client, expr)
+    elif isinstance(client, ibis_bigquery.BigQueryClient):
+        rows = _iter_bigquery_rows(client, expr, batch_rows)
+    elif _is_client_type(client, ["Spanner"]):
+        rows = _iter_spanner_rows(client, expr)
+    else:
+        for df in _iter_dataframe_slices(client.execute(expr), batch_rows):
+            yield pyarrow.RecordBatch.from_pandas(df, preserve_index=False)
+        return
+
+    names = next(rows)
+    yield from _iter_row_batches(rows, names, batch_rows)
+
+
+def iter_dataframes(client, expr, batch_rows=DEFAULT_FETCH_BATCH_ROWS):
+    """Yield the results of a table expression as DataFrames of at most
+    batch_rows rows, with the same column types as client.execute(expr).
+
+    client (IbisClient): Client to run the query
+    expr (ibis.expr.types.TableExpr): Query to fetch
+    batch_rows (int): Max number of rows per DataFrame
+    """
+    if not supports_streaming(client):
+        yield from _iter_dataframe_slices(client.execute(expr), batch_rows)
+        return
+
+    schema = expr.schema()
+    for batch in iter_record_batches(client, expr, batch_rows=batch_rows):
+        df = batch.to_pandas()
+        df.columns = schema.names
+        yield schema.apply_to(df)
+
+
 def get_ibis_table_schema(client, schema_name, table_name):
     """Return Ibis Table Schema for Supplied Client.
 
@@ -168,7 +308,7 @@ def get_ibis_table_schema(client, schema_name, table_name):
     table_name (str): Table name of table object
     database_name (str): Database name (generally default is used)
     """
-    if type(client) in [MySQLClient, PostgreSQLClient]:
+    if _is_client_type(client, ["MySQL", "Postgres"]):
         return client.schema(schema_name).table(table_name).schema()
     else:
         return client.get_schema(table_name, schema_name)
@@ -176,12 +316,7 @@ def get_ibis_table_schema(client, schema_name, table_name):
 
 def list_schemas(client):
     """Return a list of schemas in the DB."""
-    if type(client) in [
-        OracleClient,
-        PostgreSQLClient,
-        DB2Client,
-        MSSQLClient,
-    ]:
+    if _is_client_type(client, ["Oracle", "Postgres", "DB2", "MSSQL"]):
         return client.list_schemas()
     elif hasattr(client, "list_databases"):
         return client.list_databases()
@@ -191,12 +326,7 @@ def list_schemas(client):
 
 def list_tables(client, schema_name):
     """Return a list of tables in the DB schema."""
-    if type(client) in [
-        OracleClient,
-        PostgreSQLClient,
-        DB2Client,
-        MSSQLClient,
-    ]:
+    if _is_client_type(client, ["Oracle", "Postgres", "DB2", "MSSQL"]):
         return client.list_tables(schema=schema_name)
     elif schema_name:
         return client.list_tables(database=schema_name)
@@ -277,6 +407,208 @@ def get_data_client(connection_config):
     return data_client
 
 
+def _is_client_healthy(client):
+    """Return whether a client can still reach its database.
+
+    Only clients backed by a SQLAlchemy engine hold connections, other
+    clients connect per request and are always considered healthy.
+    """
+    engine = getattr(client, "con", None)
+    if not isinstance(engine, sqlalchemy.engine.Engine):
+        return True
+    try:
+        with engine.connect() as connection:
+            connection.scalar(sqlalchemy.select([sqlalchemy.literal(1)]))
+        return True
+    except Exception as e:
+        logging.warning(f"Shared client failed its health check: {e}")
+        return False
+
+
+def _close_client(client):
+    """Release the pooled connections of a client."""
+    engine = getattr(client, "con", None)
+    if isinstance(engine, sqlalchemy.engine.Engine):
+        engine.dispose()
+
+
+class _SharedClient(object):
+    def __init__(self, client, now, source_type=None):
+        self.client = client
+        self.source_type = source_type
+        self.last_used = now
+        self.last_checked = now
+        self.checkouts = 0
+        self.retired = False
+
+
+class ClientRegistry(object):
+    """Process wide registry of data clients keyed by connection config.
+
+    Validations with the same connection config share one client and,
+    through its SQLAlchemy engine, one thread-safe connection pool.
+
+    Clients are checked out by get_client until release_client is called,
+    and only clients which are not checked out are evicted when idle.
+    Clients are connected and health checked under a lock per connection
+    config, so slow connections do not block other connection configs.
+    """
+
+    def __init__(
+        self,
+        idle_seconds=DEFAULT_CLIENT_IDLE_SECONDS,
+        health_check_seconds=DEFAULT_CLIENT_HEALTH_CHECK_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.idle_seconds = idle_seconds
+        self.health_check_seconds = health_check_seconds
+        self._clock = clock
+        self._clients = {}
+        self._checked_out = {}
+        self._key_locks = {}
+        # Clients evicted so far by source type and reason: idle or unhealthy
+        self._evictions = collections.Counter()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(connection_config):
+        return json.dumps(connection_config, sort_keys=True, default=str)
+
+    def get_client(self, connection_config):
+        """Check out the shared client for a connection config, creating it
+        if missing, unhealthy or evicted."""
+        if connection_config.get(consts.SOURCE_TYPE) in UNSHARED_SOURCE_TYPES:
+            return get_data_client(connection_config)
+
+        key = self._get_key(connection_config)
+        with self._lock:
+            now = self._clock()
+            evicted = self._pop_idle(now)
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        for shared in evicted:
+            _close_client(shared.client)
+
+        with key_lock:
+            with self._lock:
+                shared = self._clients.get(key)
+                if shared:
+                    self._check_out(shared)
+            if shared and now - shared.last_checked >= self.health_check_seconds:
+                shared.last_checked = now
+                if not _is_client_healthy(shared.client):
+                    with self._lock:
+                        del self._clients[key]
+                        shared.retired = True
+                        self._evictions[(shared.source_type, "unhealthy")] += 1
+                    self.release_client(shared.client)
+                    shared = None
+            if shared is None:
+                shared = _SharedClient(
+                    get_data_client(connection_config),
+                    now,
+                    source_type=connection_config.get(consts.SOURCE_TYPE),
+                )
+                with self._lock:
+                    self._clients[key] = shared
+                    self._check_out(shared)
+            return shared.client
+
+    def retain_client(self, client):
+        """Check out a client again, which is already checked out, e.g. by
+        a ConfigManager sharing the client of another. Return whether the
+        client is one of the registry's and must be released as well."""
+        with self._lock:
+            shared = self._checked_out.get(id(client))
+            if shared is None:
+                return False
+            self._check_out(shared)
+            return True
+
+    def get_checkouts(self):
+        """Return the number of check outs of every shared client."""
+        with self._lock:
+            return sum(shared.checkouts for shared in self._checked_out.values())
+
+    def get_stats(self):
+        """Return the shared clients checked out and idle, their check outs
+        and the clients evicted so far, keyed by source type."""
+        stats = collections.defaultdict(
+            lambda: {"checked_out": 0, "idle": 0, "checkouts": 0, "evictions": {}}
+        )
+        with self._lock:
+            shared_clients = {id(shared): shared for shared in self._clients.values()}
+            shared_clients.update(
+                (id(shared), shared) for shared in self._checked_out.values()
+            )
+            for shared in shared_clients.values():
+                source_stats = stats[shared.source_type]
+                if shared.checkouts:
+                    source_stats["checked_out"] += 1
+                    source_stats["checkouts"] += shared.checkouts
+                else:
+                    source_stats["idle"] += 1
+            for (source_type, reason), count in self._evictions.items():
+                stats[source_type]["evictions"][reason] = count
+        return dict(stats)
+
+    def release_client(self, client):
+        """Return a client checked out by get_client to the registry."""
+        with self._lock:
+            shared = self._checked_out.get(id(client))
+            if shared is None:
+                return
+            shared.checkouts -= 1
+            shared.last_used = self._clock()
+            if shared.checkouts > 0:
+                return
+            del self._checked_out[id(client)]
+            retired = shared.retired
+        if retired:
+            _close_client(client)
+
+    def _check_out(self, shared):
+        shared.checkouts += 1
+        shared.last_used = self._clock()
+        self._checked_out[id(shared.client)] = shared
+
+    def _pop_idle(self, now):
+        """Remove and return the idle clients which are not checked out."""
+        evicted = []
+        for key, shared in list(self._clients.items()):
+            if not shared.checkouts and now - shared.last_used >= self.idle_seconds:
+                evicted.append(self._clients.pop(key))
+                self._evictions[(shared.source_type, "idle")] += 1
+        return evicted
+
+    def clear(self):
+        """Close and remove all shared clients."""
+        with self._lock:
+            evicted = list(self._clients.values())
+            self._clients.clear()
+            self._checked_out.clear()
+        for shared in evicted:
+            _close_client(shared.client)
+
+
+CLIENT_REGISTRY = ClientRegistry()
+
+
+def get_shared_data_client(connection_config):
+    """Return a DataClient shared by every caller with the same configuration"""
+    return CLIENT_REGISTRY.get_client(connection_config)
+
+
+def retain_shared_data_client(client):
+    """Check out a DataClient returned by get_shared_data_client again.
+    Return whether it must be released with release_shared_data_client."""
+    return CLIENT_REGISTRY.retain_client(client)
+
+
+def release_shared_data_client(client):
+    """Release a DataClient returned by get_shared_data_client."""
+    CLIENT_REGISTRY.release_client(client)
+
+
 def get_max_column_length(client):
     """Return the max column length supported by client.
 
@@ -292,17 +624,40 @@ def get_max_column_length(client):
     return 128
 
 
-CLIENT_LOOKUP = {
-    "BigQuery": get_bigquery_client,
-    "Impala": impala_connect,
-    "MySQL": MySQLClient,
-    "Oracle": OracleClient,
-    "FileSystem": get_pandas_client,
-    "Postgres": PostgreSQLClient,
-    "Redshift": PostgreSQLClient,
-    "Teradata": TeradataClient,
-    "MSSQL": MSSQLClient,
-    "Snowflake": snowflake_connect,
-    "Spanner": spanner_connect,
-    "DB2": DB2Client,
-}
+CLIENT_LOOKUP = _LazyClientLookup(
+    {
+        "BigQuery": (__name__, "get_bigquery_client", None),
+        "Impala": ("third_party.ibis.ibis_impala.api", "impala_connect", None),
+        "MySQL": ("ibis.backends.mysql.client", "MySQLClient", None),
+        "Oracle": (
+            "third_party.ibis.ibis_oracle.client",
+            "OracleClient",
+            "pip install cx_Oracle",
+        ),
+        "FileSystem": (__name__, "get_pandas_client", None),
+        "Postgres": ("third_party.ibis.ibis_postgres.client", "PostgreSQLClient", None),
+        "Redshift": ("third_party.ibis.ibis_postgres.client", "PostgreSQLClient", None),
+        # If you have a Teradata License there is an optional teradatasql import
+        "Teradata": (
+            "third_party.ibis.ibis_teradata.client",
+            "TeradataClient",
+            "pip install teradatasql (requires Teradata licensing)",
+        ),
+        "MSSQL": (
+            "third_party.ibis.ibis_mssql.client",
+            "MSSQLClient",
+            "pip install pyodbc",
+        ),
+        "Snowflake": (
+            "third_party.ibis.ibis_snowflake.client",
+            "SnowflakeClient",
+            "pip install snowflake-connector-python",
+        ),
+        "Spanner": ("third_party.ibis.ibis_cloud_spanner.api", "connect", None),
+        "DB2": (
+            "third_party.ibis.ibis_DB2.client",
+            "DB2Client",
+            "pip install ibm_db_sa",
+        ),
+    }
+)
@@ -24,6 +24,8 @@ import json
 import logging
 import ibis
 import ibis.expr.datatypes
+import numpy
+import pandas
 
 from data_validation import consts
 
@@ -256,9 +258,11 @@ def _pivot_result(result, join_on_fields, validations, result_type):
             else:
                 primary_keys = ibis.literal(None).cast("string").name("primary_keys")
 
+            # Ibis only resolves a list of columns when fusing the projection
+            # into a query selection, as with remote combines.
             pivots.append(
                 result.projection(
-                    (
+                    [
                         ibis.literal(field).name("validation_name"),
                         ibis.literal(validation.validation_type).name(
                             "validation_type"
@@ -279,8 +283,8 @@ def _pivot_result(result, join_on_fields, validations, result_type):
                             "num_random_rows"
                         ),
                         result[field].cast("string").name("agg_value"),
-                    )
-                    + join_on_fields
+                    ]
+                    + list(join_on_fields)
                 )
             )
     pivot = functools.reduce(lambda pivot1, pivot2: pivot1.union(pivot2), pivots)
@@ -373,3 +377,383 @@ def _add_metadata(joined, run_metadata):
         ibis.literal(run_metadata.end_time).name("end_time"),
     ]
     return joined
+
+
+def generate_report_from_dataframes(
+    run_metadata,
+    source_df,
+    target_df,
+    join_on_fields=(),
+    is_value_comparison=False,
+    verbose=False,
+):
+    """Combine results into a report using vectorized pandas operations.
+
+    Produces the same report as ``generate_report`` run on the Ibis pandas
+    backend, but computes each output column with a handful of NumPy/pandas
+    operations over all validation fields at once instead of building one
+    projection and union per field.
+
+    Args:
+        run_metadata (data_validation.metadata.RunMetadata):
+            Metadata about the run and validations.
+        source_df (pandas.DataFrame): Source query results.
+        target_df (pandas.DataFrame): Target query results.
+        join_on_fields (Sequence[str]):
+            A collection of column names to use to join source and target.
+        is_value_comparison (boolean): Boolean representing if source and
+            target agg values should be compared with 'equals to' rather than
+            a 'difference' comparison.
+
+    Returns:
+        pandas.DataFrame:
+            A pandas DataFrame with the results of the validation in the same
+            schema as the report table.
+    """
+    join_on_fields = tuple(join_on_fields)
+
+    source_names = list(source_df.columns)
+    target_names = list(target_df.columns)
+
+    if source_names != target_names:
+        raise ValueError(
+            "Expected source and target to have same schema, got "
+            f"source: {source_names} target: {target_names}"
+        )
+    validations = run_metadata.validations
+    difference_fields = [name for name in source_names if name in validations]
+    pivot_fields = [
+        name
+        for name in difference_fields
+        if name not in join_on_fields or "hash__all" in join_on_fields
+    ]
+
+    differences = _dataframe_differences(
+        source_df,
+        target_df,
+        difference_fields,
+        join_on_fields,
+        validations,
+        is_value_comparison,
+    )
+    source_pivot = _dataframe_pivot(
+        source_df, pivot_fields, join_on_fields, validations, consts.RESULT_TYPE_SOURCE
+    )
+    target_pivot = _dataframe_pivot(
+        target_df, pivot_fields, join_on_fields, validations, consts.RESULT_TYPE_TARGET
+    )
+    result_df = _dataframe_join_pivots(
+        source_pivot, target_pivot, differences, join_on_fields
+    )
+
+    run_metadata.end_time = datetime.datetime.now(datetime.timezone.utc)
+    result_df["run_id"] = run_metadata.run_id
+    result_df["labels"] = pandas.Series(
+        [run_metadata.labels] * len(result_df), index=result_df.index, dtype=object
+    )
+    result_df["start_time"] = run_metadata.start_time
+    result_df["end_time"] = run_metadata.end_time
+
+    if verbose:
+        logging.debug("-- ** Combiner Result Shape ** --")
+        logging.debug(result_df.shape)
+
+    result_df.validation_status.fillna(consts.VALIDATION_STATUS_FAIL, inplace=True)
+    return result_df
+
+
+def _dataframe_value_kind(series):
+    """Return the comparison kind Ibis would infer for a result column."""
+    if pandas.api.types.is_datetime64_any_dtype(series.dtype):
+        return "timestamp"
+    if series.dtype == numpy.float64:
+        return "float64"
+    if series.dtype == numpy.object_:
+        inferred = pandas.api.types.infer_dtype(series, skipna=True)
+        if inferred in ("string", "empty"):
+            return "string"
+        if inferred == "decimal":
+            return "decimal"
+        if inferred == "datetime":
+            return "timestamp"
+    return "numeric"
+
+
+def _dataframe_comparable_values(series, kind):
+    """Return values in the form used for comparison, as a pandas.Series."""
+    if kind == "timestamp":
+        series = pandas.to_datetime(series)
+        if series.dt.tz is not None:
+            series = series.dt.tz_convert(None)
+        epoch_seconds = series.to_numpy(dtype="datetime64[ns]").view("int64") // int(
+            1e9
+        )
+        return pandas.Series(epoch_seconds, dtype="float64").where(
+            series.notnull().to_numpy()
+        )
+    if kind == "float64":
+        return series.round(4)
+    if kind == "decimal":
+        return series.astype("float64").round(4)
+    if kind == "numeric" and not pandas.api.types.is_numeric_dtype(series.dtype):
+        return pandas.to_numeric(series, errors="coerce")
+    if pandas.api.types.is_bool_dtype(series.dtype):
+        return series.astype("float64")
+    return series
+
+
+def _dataframe_join_positions(source_df, target_df, join_on_fields):
+    """Return the source and target row positions of an inner join."""
+    if not join_on_fields:
+        # When no join_on_fields are present, we expect only one row per
+        # table, so this cross join is usually a single row.
+        source_positions = numpy.arange(len(source_df))
+        target_positions = numpy.arange(len(target_df))
+        return (
+            numpy.repeat(source_positions, len(target_positions)),
+            numpy.tile(target_positions, len(source_positions)),
+        )
+
+    key_names = [f"key_{index}" for index in range(len(join_on_fields))]
+    left = pandas.DataFrame(
+        {
+            key: source_df[field].to_numpy()
+            for key, field in zip(key_names, join_on_fields)
+        }
+    )
+    left["source_position"] = numpy.arange(len(left))
+    right = pandas.DataFrame(
+        {
+            key: target_df[field].to_numpy()
+            for key, field in zip(key_names, join_on_fields)
+        }
+    )
+    right["target_position"] = numpy.arange(len(right))
+    joined = left.merge(right, on=key_names, how="inner")
+    return (
+        joined["source_position"].to_numpy(),
+        joined["target_position"].to_numpy(),
+    )
+
+
+def _dataframe_differences(
+    source_df, target_df, fields, join_on_fields, validations, is_value_comparison
+):
+    """Calculate differences between source and target fields.
+
+    Returns one row per joined source/target row and validation field with
+    the same columns as the pivot built by ``_calculate_differences``.
+    """
+    source_positions, target_positions = _dataframe_join_positions(
+        source_df, target_df, join_on_fields
+    )
+    num_rows = len(source_positions)
+
+    differences = []
+    pct_differences = []
+    statuses = []
+    thresholds = []
+    for field in fields:
+        source_raw = source_df[field].iloc[source_positions].reset_index(drop=True)
+        target_raw = target_df[field].iloc[target_positions].reset_index(drop=True)
+        kind = _dataframe_value_kind(source_raw)
+        source_value = _dataframe_comparable_values(source_raw, kind)
+        target_value = _dataframe_comparable_values(target_raw, kind)
+        threshold = validations[field].threshold
+        both_null = (source_value.isnull() & target_value.isnull()).to_numpy()
+
+        if is_value_comparison:
+            # Does not calculate difference between agg values for row hash
+            # due to int64 overflow.
+            difference = pct_difference = numpy.full(num_rows, None, dtype=object)
+            matches = both_null | (source_value == target_value).to_numpy()
+        elif kind == "string":
+            difference = pct_difference = numpy.full(num_rows, numpy.nan)
+            matches = both_null
+        else:
+            source_float = source_value.to_numpy(dtype="float64", na_value=numpy.nan)
+            target_float = target_value.to_numpy(dtype="float64", na_value=numpy.nan)
+            difference = target_float - source_float
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                pct_difference = numpy.where(
+                    difference == 0,
+                    0.0,
+                    100.0
+                    * difference
+                    / numpy.where(source_float == 0, target_float, source_float),
+                )
+                th_diff = numpy.abs(pct_difference) - threshold
+                matches = both_null | ~(numpy.isnan(th_diff) | (th_diff > 0.0))
+
+        differences.append(difference)
+        pct_differences.append(pct_difference)
+        statuses.append(
+            numpy.where(
+                matches,
+                consts.VALIDATION_STATUS_SUCCESS,
+                consts.VALIDATION_STATUS_FAIL,
+            ).astype(object)
+        )
+        thresholds.append(numpy.full(num_rows, threshold, dtype="float64"))
+
+    differences_df = pandas.DataFrame(
+        {"validation_name": numpy.repeat(numpy.array(fields, dtype=object), num_rows)}
+    )
+    for join_field in join_on_fields:
+        join_values = source_df[join_field].iloc[source_positions]
+        differences_df[join_field] = _repeat_series(join_values, len(fields))
+    differences_df["difference"] = _concatenate(differences, object_default=True)
+    differences_df["pct_difference"] = _concatenate(pct_differences)
+    differences_df["pct_threshold"] = _concatenate(thresholds)
+    differences_df["validation_status"] = _concatenate(statuses, object_default=True)
+    return differences_df
+
+
+def _concatenate(arrays, object_default=False):
+    if arrays:
+        return numpy.concatenate(arrays)
+    return numpy.array([], dtype=object if object_default else "float64")
+
+
+def _repeat_series(series, times):
+    """Return the values of series stacked ``times`` times, keeping dtype."""
+    if times == 0:
+        return series.iloc[:0].reset_index(drop=True)
+    return pandas.concat([series] * times, ignore_index=True)
+
+
+def _dataframe_pivot(result_df, fields, join_on_fields, validations, result_type):
+    """Return the long-format (one row per field) view of a result set."""
+    num_rows = len(result_df)
+    metadata_records = []
+    agg_values = []
+    for field in fields:
+        validation = validations[field]
+        if validation.primary_keys:
+            primary_keys = "{" + ", ".join(validation.primary_keys) + "}"
+        else:
+            primary_keys = None
+        column_name = validation.get_column_name(result_type)
+        metadata_records.append(
+            {
+                "validation_name": field,
+                "validation_type": validation.validation_type,
+                "aggregation_type": validation.aggregation_type,
+                "table_name": validation.get_table_name(result_type),
+                # Keep None for NULL column names (such as count aggregations).
+                "column_name": None if column_name is None else str(column_name),
+                "primary_keys": primary_keys,
+                "num_random_rows": validation.num_random_rows,
+            }
+        )
+        agg_value = result_df[field]
+        # String columns are not cast, matching Ibis, so NULLs stay NULL.
+        if _dataframe_value_kind(agg_value) != "string":
+            agg_value = agg_value.astype(str)
+        agg_values.append(agg_value.to_numpy(dtype=object))
+
+    pivot = pandas.DataFrame(
+        {"validation_name": numpy.repeat(numpy.array(fields, dtype=object), num_rows)}
+    )
+    metadata_df = pandas.DataFrame.from_records(
+        metadata_records,
+        columns=[
+            "validation_name",
+            "validation_type",
+            "aggregation_type",
+            "table_name",
+            "column_name",
+            "primary_keys",
+            "num_random_rows",
+        ],
+    )
+    pivot = pivot.merge(metadata_df, on="validation_name", how="left")
+    pivot["agg_value"] = _concatenate(agg_values, object_default=True)
+    for join_field in join_on_fields:
+        pivot[join_field] = _repeat_series(result_df[join_field], len(fields))
+    return pivot
+
+
+def _dataframe_as_json(series):
+    """Make field values into valid strings, see ``_as_json``."""
+    return (
+        series.astype(str)
+        .fillna("null")
+        .str.replace("\\", "\\\\", regex=False)
+        .str.replace('"', '\\"', regex=False)
+    )
+
+
+def _dataframe_join_pivots(source, target, differences, join_on_fields):
+    join_keys = ["validation_name"] + list(join_on_fields)
+    source = source.rename(
+        columns={
+            "table_name": "source_table_name",
+            "column_name": "source_column_name",
+            "agg_value": "source_agg_value",
+        }
+    )
+    target = target[
+        join_keys
+        + [
+            "validation_type",
+            "aggregation_type",
+            "table_name",
+            "column_name",
+            "agg_value",
+        ]
+    ].rename(
+        columns={
+            "validation_type": "target_validation_type",
+            "aggregation_type": "target_aggregation_type",
+            "table_name": "target_table_name",
+            "column_name": "target_column_name",
+            "agg_value": "target_agg_value",
+        }
+    )
+    source_difference = source.merge(differences, on=join_keys, how="outer")
+    joined = source_difference.merge(target, on=join_keys, how="outer")
+    joined["validation_type"] = joined["validation_type"].fillna(
+        joined["target_validation_type"]
+    )
+    joined["aggregation_type"] = joined["aggregation_type"].fillna(
+        joined["target_aggregation_type"]
+    )
+
+    if join_on_fields:
+        group_by_columns = None
+        for field in join_on_fields:
+            join_value = (
+                json.dumps(field) + ': "' + _dataframe_as_json(joined[field]) + '"'
+            )
+            group_by_columns = (
+                join_value
+                if group_by_columns is None
+                else group_by_columns + ", " + join_value
+            )
+        joined["group_by_columns"] = "{" + group_by_columns + "}"
+    else:
+        joined["group_by_columns"] = pandas.Series(
+            [None] * len(joined), index=joined.index, dtype=object
+        )
+
+    return joined[
+        [
+            "validation_name",
+            "validation_type",
+            "aggregation_type",
+            "source_table_name",
+            "source_column_name",
+            "source_agg_value",
+            "target_table_name",
+            "target_column_name",
+            "target_agg_value",
+            "group_by_columns",
+            "primary_keys",
+            "num_random_rows",
+            "difference",
+            "pct_difference",
+            "pct_threshold",
+            "validation_status",
+        ]
+    ].reset_index(drop=True)
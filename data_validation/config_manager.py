@@ -14,6 +14,7 @@
 
 import copy
 import logging
+import re
 from typing import Optional, Union, TYPE_CHECKING
 
 import google.oauth2.service_account
@@ -22,6 +23,7 @@ import ibis.expr.datatypes as dt
 
 from data_validation import clients, consts, state_manager
 from data_validation.result_handlers.bigquery import BigQueryResultHandler
+from data_validation.result_handlers.file import FileResultHandler
 from data_validation.result_handlers.text import TextResultHandler
 from data_validation.validation_builder import ValidationBuilder
 
@@ -54,18 +56,42 @@ class ConfigManager(object):
         self._state_manager = state_manager.StateManager()
         self._config = config
 
-        self.source_client = source_client or clients.get_data_client(
-            self.get_source_connection()
-        )
-        self.target_client = target_client or clients.get_data_client(
-            self.get_target_connection()
-        )
+        # Shared clients checked out by this ConfigManager, see release_clients.
+        # Supplied shared clients are checked out again, so that every
+        # ConfigManager releases its own check outs.
+        self._shared_clients = []
+        if source_client is None:
+            source_client = clients.get_shared_data_client(self.get_source_connection())
+            self._shared_clients.append(source_client)
+        elif clients.retain_shared_data_client(source_client):
+            self._shared_clients.append(source_client)
+        if target_client is None:
+            target_client = clients.get_shared_data_client(self.get_target_connection())
+            self._shared_clients.append(target_client)
+        elif clients.retain_shared_data_client(target_client):
+            self._shared_clients.append(target_client)
+        self.source_client = source_client
+        self.target_client = target_client
+        if (
+            not self._config.get(consts.CONFIG_PROCESS_IN_MEMORY, True)
+            and self.source_client is not self.target_client
+            and self.get_source_connection() == self.get_target_connection()
+        ):
+            # A remote combine compiles the source and target queries into a
+            # single query, which Ibis only allows on a single client.
+            self.target_client = self.source_client
 
         self.verbose = verbose
         if self.validation_type not in consts.CONFIG_TYPES:
             raise ValueError(f"Unknown Configuration Type: {self.validation_type}")
         self._comparison_max_col_length = None
 
+    def release_clients(self):
+        """Release the shared clients checked out for this config, so that
+        they can be closed once idle."""
+        while self._shared_clients:
+            clients.release_shared_data_client(self._shared_clients.pop())
+
     @property
     def config(self):
         """Return config object."""
@@ -109,19 +135,109 @@ class ConfigManager(object):
             or consts.DEFAULT_NUM_RANDOM_ROWS
         )
 
+    def random_row_confidence(self):
+        """Return the confidence level random rows are sampled with or None."""
+        return self._config.get(consts.CONFIG_RANDOM_ROW_CONFIDENCE)
+
+    def random_row_error(self):
+        """Return the margin of error random rows are sampled with."""
+        return (
+            self._config.get(consts.CONFIG_RANDOM_ROW_ERROR)
+            or consts.DEFAULT_RANDOM_ROW_ERROR
+        )
+
     def get_random_row_batch_size(self):
         """Return number of random rows or None."""
         return self.random_row_batch_size() if self.use_random_rows() else None
 
+    @property
+    def combiner(self):
+        """Return the combiner implementation used to build the report."""
+        return self._config.get(consts.CONFIG_COMBINER) or consts.COMBINER_IBIS
+
+    @property
+    def memory_budget_mb(self):
+        """Return the row comparison memory budget in MB or None if unbounded."""
+        return self._config.get(consts.CONFIG_MEMORY_BUDGET_MB)
+
+    @property
+    def incremental_column(self):
+        """Return the watermark column of an incremental validation or None."""
+        return self._config.get(consts.CONFIG_INCREMENTAL_COLUMN)
+
+    @property
+    def incremental_name(self):
+        """Return the name the incremental validation state is stored under."""
+        name = self._config.get(consts.CONFIG_INCREMENTAL_NAME) or (
+            f"{self.full_source_table}.{self.validation_type}"
+        )
+        return re.sub(r"[^\w.-]", "_", name)
+
+    @property
+    def cumulative(self):
+        """Return if incremental results are rolled into cumulative results."""
+        return self._config.get(consts.CONFIG_CUMULATIVE) or False
+
+    @property
+    def use_cache(self):
+        """Return if query results are read from and stored in the query cache."""
+        return self._config.get(consts.CONFIG_CACHE) or False
+
+    @property
+    def cache_ttl(self):
+        """Return the seconds a cached query result is valid for or None."""
+        return self._config.get(consts.CONFIG_CACHE_TTL)
+
+    @property
+    def cache_version(self):
+        """Return the token identifying the version of the cached tables."""
+        return self._config.get(consts.CONFIG_CACHE_VERSION)
+
+    @property
+    def use_merkle(self):
+        """Return if row hashes are compared in buckets of a Merkle tree."""
+        return self._config.get(consts.CONFIG_MERKLE) or False
+
+    @property
+    def use_fingerprint(self):
+        """Return if row hashes are compared by a table fingerprint first."""
+        return self._config.get(consts.CONFIG_FINGERPRINT) or False
+
     def process_in_memory(self):
-        """Return whether to process in memory or on a remote platform."""
-        return True
+        """Return whether to process in memory or on a remote platform.
+
+        Results are combined on the remote platform only when requested and
+        the source and target share a connection.
+        """
+        if self._config.get(consts.CONFIG_PROCESS_IN_MEMORY, True):
+            return True
+        if self.source_client is not self.target_client:
+            logging.warning(
+                "Source and target use different connections, "
+                "combining results in memory."
+            )
+            return True
+        return False
 
     @property
     def max_recursive_query_size(self):
         """Return Aggregates from Config"""
         return self._config.get(consts.CONFIG_MAX_RECURSIVE_QUERY_SIZE, 50000)
 
+    @property
+    def recursive_batch_size(self):
+        """Return the max number of group keys filtered per recursive query."""
+        return self._config.get(
+            consts.CONFIG_RECURSIVE_BATCH_SIZE, consts.DEFAULT_RECURSIVE_BATCH_SIZE
+        )
+
+    @property
+    def max_recursive_workers(self):
+        """Return the max number of recursive batches queried concurrently."""
+        return self._config.get(
+            consts.CONFIG_MAX_RECURSIVE_WORKERS, consts.DEFAULT_MAX_RECURSIVE_WORKERS
+        )
+
     @property
     def aggregates(self):
         """Return Aggregates from Config"""
@@ -422,6 +538,22 @@ class ConfigManager(object):
                 self.filter_status,
                 table_id=table_id,
                 credentials=credentials,
+                write_mode=self.result_handler_config.get(
+                    consts.BQ_WRITE_MODE, consts.BQ_WRITE_MODE_STREAMING
+                ),
+                batch_rows=self.result_handler_config.get(
+                    consts.BQ_BATCH_ROWS, consts.DEFAULT_BQ_BATCH_ROWS
+                ),
+            )
+        elif result_type == "File":
+            return FileResultHandler(
+                self.result_handler_config[consts.RESULT_DIRECTORY],
+                file_format=self.result_handler_config.get(
+                    consts.RESULT_FILE_FORMAT, consts.RESULT_FILE_FORMAT_PARQUET
+                ),
+                partition_by=self.result_handler_config.get(consts.RESULT_PARTITION_BY),
+                status_list=self.filter_status,
+                compression=self.result_handler_config.get(consts.RESULT_COMPRESSION),
             )
         else:
             raise ValueError(f"Unknown ResultHandler Class: {result_type}")
@@ -437,11 +569,24 @@ class ConfigManager(object):
         format,
         use_random_rows=None,
         random_row_batch_size=None,
+        random_row_confidence=None,
+        random_row_error=None,
         source_client=None,
         target_client=None,
         result_handler_config=None,
         filter_config=None,
         filter_status=None,
+        combiner=None,
+        memory_budget_mb=None,
+        process_in_memory=True,
+        incremental_column=None,
+        incremental_name=None,
+        cumulative=False,
+        cache=False,
+        cache_ttl=None,
+        cache_version=None,
+        merkle=False,
+        fingerprint=False,
         verbose=False,
     ):
         if isinstance(filter_config, dict):
@@ -470,7 +615,25 @@ class ConfigManager(object):
             consts.CONFIG_USE_RANDOM_ROWS: use_random_rows,
             consts.CONFIG_RANDOM_ROW_BATCH_SIZE: random_row_batch_size,
             consts.CONFIG_FILTER_STATUS: filter_status,
+            consts.CONFIG_COMBINER: combiner,
+            consts.CONFIG_MEMORY_BUDGET_MB: memory_budget_mb,
+            consts.CONFIG_PROCESS_IN_MEMORY: process_in_memory,
         }
+        if incremental_column:
+            config[consts.CONFIG_INCREMENTAL_COLUMN] = incremental_column
+            config[consts.CONFIG_INCREMENTAL_NAME] = incremental_name
+            config[consts.CONFIG_CUMULATIVE] = cumulative
+        if cache:
+            config[consts.CONFIG_CACHE] = cache
+            config[consts.CONFIG_CACHE_TTL] = cache_ttl
+            config[consts.CONFIG_CACHE_VERSION] = cache_version
+        if random_row_confidence:
+            config[consts.CONFIG_RANDOM_ROW_CONFIDENCE] = random_row_confidence
+            config[consts.CONFIG_RANDOM_ROW_ERROR] = random_row_error
+        if merkle:
+            config[consts.CONFIG_MERKLE] = merkle
+        if fingerprint:
+            config[consts.CONFIG_FINGERPRINT] = fingerprint
 
         return ConfigManager(
             config,
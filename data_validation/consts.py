@@ -43,6 +43,8 @@ CONFIG_CALCULATED_SOURCE_COLUMNS = "source_calculated_columns"
 CONFIG_CALCULATED_TARGET_COLUMNS = "target_calculated_columns"
 CONFIG_USE_RANDOM_ROWS = "use_random_rows"
 CONFIG_RANDOM_ROW_BATCH_SIZE = "random_row_batch_size"
+CONFIG_RANDOM_ROW_CONFIDENCE = "random_row_confidence"
+CONFIG_RANDOM_ROW_ERROR = "random_row_error"
 CONFIG_PRIMARY_KEYS = "primary_keys"
 CONFIG_SOURCE_COLUMN = "source_column"
 CONFIG_TARGET_COLUMN = "target_column"
@@ -55,6 +57,8 @@ CONFIG_FILTERS = "filters"
 CONFIG_FILTER_SOURCE = "source"
 CONFIG_FILTER_TARGET = "target"
 CONFIG_MAX_RECURSIVE_QUERY_SIZE = "max_recursive_query_size"
+CONFIG_RECURSIVE_BATCH_SIZE = "recursive_batch_size"
+CONFIG_MAX_RECURSIVE_WORKERS = "max_recursive_workers"
 CONFIG_SOURCE_QUERY = "source_query"
 CONFIG_SOURCE_QUERY_FILE = "source_query_file"
 CONFIG_TARGET_QUERY = "target_query"
@@ -67,6 +71,20 @@ CONFIG_FILTER_TARGET_VALUE = "target_value"
 CONFIG_EXCLUSION_COLUMNS = "exclusion_columns"
 CONFIG_ALLOW_LIST = "allow_list"
 CONFIG_FILTER_STATUS = "filter_status"
+CONFIG_COMBINER = "combiner"
+CONFIG_MEMORY_BUDGET_MB = "memory_budget_mb"
+CONFIG_PROCESS_IN_MEMORY = "process_in_memory"
+CONFIG_INCREMENTAL_COLUMN = "incremental_column"
+CONFIG_INCREMENTAL_NAME = "incremental_name"
+CONFIG_CUMULATIVE = "cumulative"
+CONFIG_CACHE = "cache"
+CONFIG_CACHE_TTL = "cache_ttl"
+CONFIG_CACHE_VERSION = "cache_version"
+CONFIG_MERKLE = "merkle"
+CONFIG_FINGERPRINT = "fingerprint"
+CONFIG_FILTER_LOWER_BOUND = "lower_bound"
+CONFIG_FILTER_UPPER_BOUND = "upper_bound"
+CONFIG_FILTER_BATCH_SIZE = "batch_size"
 
 CONFIG_RESULT_HANDLER = "result_handler"
 
@@ -75,11 +93,30 @@ CONFIG_TYPE_SUM = "sum"
 
 # Default values
 DEFAULT_NUM_RANDOM_ROWS = 10000
+DEFAULT_RANDOM_ROW_ERROR = 0.01
+DEFAULT_RECURSIVE_BATCH_SIZE = 1000
+DEFAULT_MAX_RECURSIVE_WORKERS = 4
+
+# Partition Type Options
+PARTITION_TYPE_RANGE = "range"
+PARTITION_TYPE_HASH_MOD = "hash-mod"
+PARTITION_TYPE_QUANTILE = "quantile"
+PARTITION_TYPES = [
+    PARTITION_TYPE_RANGE,
+    PARTITION_TYPE_HASH_MOD,
+    PARTITION_TYPE_QUANTILE,
+]
+
+# Combiner Options
+COMBINER_IBIS = "ibis"
+COMBINER_NATIVE = "native"
+COMBINER_TYPES = [COMBINER_IBIS, COMBINER_NATIVE]
 
 # Filter Type Options
 FILTER_TYPE_CUSTOM = "custom"
 FILTER_TYPE_EQUALS = "equals"
 FILTER_TYPE_ISIN = "isin"
+FILTER_TYPE_RANGE = "range"
 
 # Validation Types
 COLUMN_VALIDATION = "Column"
@@ -99,6 +136,13 @@ CONFIG_TYPES = [
 # State Manager Fields
 DEFAULT_ENV_DIRECTORY = "~/.config/google-pso-data-validator/"
 ENV_DIRECTORY_VAR = "PSO_DV_CONFIG_HOME"
+DEFAULT_CACHE_MAX_SIZE_MB = 1024
+
+# Merkle row hash comparison
+MERKLE_DIGITS_PER_LEVEL = 2
+MERKLE_MAX_PREFIX_LENGTH = 16
+MERKLE_MAX_BUCKETS = 1000
+DEFAULT_MERKLE_LEAF_ROWS = 10000
 
 # Yaml File Config Fields
 YAML_RESULT_HANDLER = "result_handler"
@@ -110,6 +154,29 @@ YAML_VALIDATIONS = "validations"
 PROJECT_ID = "project_id"
 TABLE_ID = "table_id"
 GOOGLE_SERVICE_ACCOUNT_KEY_PATH = "google_service_account_key_path"
+BQ_WRITE_MODE = "write_mode"
+BQ_BATCH_ROWS = "batch_rows"
+BQ_WRITE_MODE_STREAMING = "streaming"
+BQ_WRITE_MODE_LOAD = "load"
+BQ_WRITE_MODES = [BQ_WRITE_MODE_STREAMING, BQ_WRITE_MODE_LOAD]
+DEFAULT_BQ_BATCH_ROWS = 500
+DEFAULT_MAX_CONSOLE_ROWS = 100
+
+# File Result Handler Configs
+RESULT_DIRECTORY = "directory"
+RESULT_FILE_FORMAT = "file_format"
+RESULT_PARTITION_BY = "partition_by"
+RESULT_COMPRESSION = "compression"
+RESULT_FILE_FORMAT_PARQUET = "parquet"
+RESULT_FILE_FORMAT_CSV = "csv"
+RESULT_FILE_FORMAT_JSONL = "jsonl"
+RESULT_FILE_FORMATS = [
+    RESULT_FILE_FORMAT_PARQUET,
+    RESULT_FILE_FORMAT_CSV,
+    RESULT_FILE_FORMAT_JSONL,
+]
+# Partition option to the result column it partitions by
+RESULT_PARTITION_COLUMNS = {"run_id": "run_id", "table": "source_table_name"}
 
 # BigQuery Output Table Fields
 VALIDATION_TYPE = "validation_type"
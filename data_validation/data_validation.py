@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import dataclasses
 import json
 import logging
+import math
+import threading
 import warnings
 from concurrent.futures import ThreadPoolExecutor
 
@@ -22,7 +25,18 @@ import ibis.expr.datatypes as dt
 import numpy
 import pandas
 
-from data_validation import combiner, consts, metadata
+from data_validation import (
+    clients,
+    combiner,
+    consts,
+    incremental,
+    merkle,
+    metadata,
+    profiling,
+    query_cache,
+    state_manager,
+    streaming_compare,
+)
 from data_validation.config_manager import ConfigManager
 from data_validation.query_builder.random_row_builder import RandomRowBuilder
 from data_validation.schema_validation import SchemaValidation
@@ -45,6 +59,10 @@ class DataValidation(object):
         schema_validator=None,
         result_handler=None,
         verbose=False,
+        source_client=None,
+        target_client=None,
+        profile=False,
+        deep_bytes=False,
     ):
         """Initialize a DataValidation client
 
@@ -54,15 +72,29 @@ class DataValidation(object):
             schema_validator (SchemaValidation): Optional instance of a SchemaValidation.
             result_handler (ResultHandler): Optional instance of as ResultHandler client.
             verbose (bool): If verbose, the Data Validation client will print the queries run.
+            source_client (IbisClient): Optional Ibis client for the source DB to reuse.
+            target_client (IbisClient): Optional Ibis client for the target DB to reuse.
+            profile (bool): If profile, the time of each stage is written and
+                the bytes fetched include the memory of strings.
+            deep_bytes (bool): If deep_bytes, the bytes fetched include the
+                memory of strings, which visits every value fetched.
         """
         self.verbose = verbose
+        self.profile = profile
+        self.deep_bytes = deep_bytes or profile
 
         # Data Client Management
         self.config = config
 
-        self.config_manager = ConfigManager(config, verbose=self.verbose)
+        self.config_manager = ConfigManager(
+            config,
+            source_client=source_client,
+            target_client=target_client,
+            verbose=self.verbose,
+        )
 
         self.run_metadata = metadata.RunMetadata()
+        self._validations_lock = threading.Lock()
         self.run_metadata.labels = self.config_manager.labels
 
         # Initialize Validation Builder if None was supplied
@@ -77,69 +109,401 @@ class DataValidation(object):
         # Initialize the default Result Handler if None was supplied
         self.result_handler = result_handler or self.config_manager.get_result_handler()
 
+        # Incremental validation state, loaded when the watermark filter is added
+        self._incremental_state = None
+        self._incremental_watermark = None
+        # Whether any report written so far has a validation which did not
+        # succeed, in which case the watermark is not advanced.
+        self._validation_failed = False
+
+        # Whether streaming comparisons pass partition reports straight to the
+        # Result Handler, and whether any were passed.
+        self._stream_reports = False
+        self._reports_streamed = False
+
     # TODO(dhercher) we planned on shifting this to use an Execution Handler.
     # Leaving to to swast on the design of how this should look.
     def execute(self):
-        """Execute Queries and Store Results"""
+        """Execute Queries and Store Results
+
+        Row validations with a memory budget pass the report of each partition
+        to the Result Handler as soon as it is compared, so the full report is
+        never held in memory. An empty report is returned for them.
+        """
+        self._stream_reports = True
+        try:
+            result_df = self.get_result_df()
+        finally:
+            self._stream_reports = False
+        if self._reports_streamed:
+            self._store_result_state()
+            return result_df
+
+        # Call Result Handler to Manage Results
+        return self.handle_result(result_df)
+
+    def handle_result(self, result_df):
+        """Call the Result Handler with the report of get_result_df and store
+        the watermark of an incremental validation once results are written."""
+        result_df = self._write_result(result_df)
+        self._store_result_state()
+        return result_df
+
+    def write_profile(self):
+        """Pass the time, rows and bytes of each stage of the run to the
+        Result Handler, which writes them next to the report."""
+        execute_profile = getattr(self.result_handler, "execute_profile", None)
+        if execute_profile is None:
+            logging.warning(
+                "Result Handler %s does not write profiles.",
+                type(self.result_handler).__name__,
+            )
+            return
+        execute_profile(profiling.get_profile_df(self.run_metadata))
+
+    def _write_result(self, result_df):
+        if (
+            consts.VALIDATION_STATUS in result_df
+            and (
+                result_df[consts.VALIDATION_STATUS] != consts.VALIDATION_STATUS_SUCCESS
+            ).any()
+        ):
+            self._validation_failed = True
+        with profiling.span(self.run_metadata, profiling.SPAN_RESULT_HANDLER):
+            return self.result_handler.execute(result_df)
+
+    def _store_result_state(self):
+        if self._incremental_state is None:
+            return
+        if self._validation_failed:
+            # Rows of a failed run are validated again by the next run.
+            logging.warning(
+                "Validation %s failed, its watermark is not advanced.",
+                self.config_manager.incremental_name,
+            )
+            return
+        self._store_incremental_state()
+
+    def get_result_df(self):
+        """Execute Queries and return the report without calling the Result Handler."""
+        with profiling.span(self.run_metadata, profiling.SPAN_VALIDATION) as run_span:
+            result_df = self._get_result_df()
+            run_span.attributes["rows"] = len(result_df)
+        self.run_metadata.process_peak_memory_mb = profiling.get_peak_memory_mb()
+        return result_df
+
+    def _get_result_df(self):
         # Apply random row filter before validations run
+        random_row_batches = None
         if self.config_manager.use_random_rows():
-            self._add_random_row_filter()
+            if self.config_manager.validation_type == consts.ROW_VALIDATION:
+                random_row_batches = self._get_random_row_batches()
+            else:
+                self._add_random_row_filter()
+
+        # Only validate rows above the watermark of an incremental validation
+        if self.config_manager.incremental_column:
+            self._add_incremental_filter()
 
         # Run correct execution for the given validation type
         if self.config_manager.validation_type == consts.ROW_VALIDATION:
             grouped_fields = self.validation_builder.pop_grouped_fields()
-            result_df = self.execute_recursive_validation(
-                self.validation_builder, grouped_fields
-            )
+            if random_row_batches:
+                result_df = self._execute_random_row_batches(
+                    self.validation_builder, grouped_fields, random_row_batches
+                )
+            elif self.config_manager.use_fingerprint and not grouped_fields:
+                result_df = self._execute_fingerprint_validation(
+                    self.validation_builder
+                )
+            else:
+                result_df = self._execute_row_validation(
+                    self.validation_builder, grouped_fields
+                )
         elif self.config_manager.validation_type == consts.SCHEMA_VALIDATION:
             """Perform only schema validation"""
             result_df = self.schema_validator.execute()
         else:
             result_df = self._execute_validation(
-                self.validation_builder, process_in_memory=True
+                self.validation_builder,
+                process_in_memory=self.config_manager.process_in_memory(),
             )
 
-        # Call Result Handler to Manage Results
-        return self.result_handler.execute(result_df)
+        if self._incremental_state is not None and self.config_manager.cumulative:
+            result_df = self._roll_up_incremental_results(result_df)
 
-    def _add_random_row_filter(self):
-        """Add random row filters to the validation builder."""
-        if not self.config_manager.primary_keys:
-            raise ValueError("Primary Keys are required for Random Row Filters")
+        return result_df
 
-        # Filter for only first primary key (multi-pk filter not supported)
-        primary_key_info = self.config_manager.primary_keys[0]
+    def _execute_row_validation(self, validation_builder, grouped_fields):
+        """Return the report of a row validation."""
+        result_df = None
+        if self.config_manager.use_merkle and not grouped_fields:
+            result_df = self._execute_merkle_validation(validation_builder)
+        if result_df is None:
+            result_df = self.execute_recursive_validation(
+                validation_builder, grouped_fields
+            )
+        return result_df
+
+    def _get_random_rows(self, primary_keys):
+        """Return the source values of primary keys of a set of random rows."""
+        if not primary_keys:
+            raise ValueError("Primary Keys are required for Random Row Filters")
 
-        query = RandomRowBuilder(
-            [primary_key_info[consts.CONFIG_SOURCE_COLUMN]],
+        random_row_builder = RandomRowBuilder(
+            [primary_key[consts.CONFIG_SOURCE_COLUMN] for primary_key in primary_keys],
             self.config_manager.random_row_batch_size(),
-        ).compile(
+            confidence=self.config_manager.random_row_confidence(),
+            error=self.config_manager.random_row_error(),
+        )
+        row_count = None
+        if random_row_builder.confidence:
+            # Counted through the query cache, so repeated samples of a table
+            # reuse its count.
+            count_query = random_row_builder.get_count_query(
+                self.config_manager.source_client,
+                self.config_manager.source_schema,
+                self.config_manager.source_table,
+                self.validation_builder.source_builder,
+            )
+            count_df = self._execute_query(
+                self.config_manager.source_client,
+                self.config_manager.get_source_connection(),
+                count_query,
+                is_value_comparison=False,
+            )
+            row_count = int(count_df["row_count"].iloc[0])
+        query = random_row_builder.compile(
             self.config_manager.source_client,
             self.config_manager.source_schema,
             self.config_manager.source_table,
             self.validation_builder.source_builder,
+            row_count=row_count,
         )
 
         random_rows = self.config_manager.source_client.execute(query)
+        if random_row_builder.confidence:
+            # The sample size is only known once the table was counted
+            for validation in self.validation_builder.get_metadata().values():
+                validation.num_random_rows = random_row_builder.batch_size
+        return random_rows
+
+    def _add_random_row_filter(self):
+        """Add random row filters to the validation builder.
+
+        Aggregates can not be validated in batches of random rows, so they
+        are filtered on the sampled values of the first primary key, in
+        IN-lists of at most recursive_batch_size values combined with OR.
+        """
+        random_rows = self._get_random_rows(self.config_manager.primary_keys[:1])
         if len(random_rows) == 0:
             return
+        primary_key_info = self.config_manager.primary_keys[0]
+        values = list(
+            random_rows[primary_key_info[consts.CONFIG_SOURCE_COLUMN]].unique()
+        )
         filter_field = {
             consts.CONFIG_TYPE: consts.FILTER_TYPE_ISIN,
             consts.CONFIG_FILTER_SOURCE_COLUMN: primary_key_info[
                 consts.CONFIG_SOURCE_COLUMN
             ],
-            consts.CONFIG_FILTER_SOURCE_VALUE: random_rows[
-                primary_key_info[consts.CONFIG_SOURCE_COLUMN]
-            ],
+            consts.CONFIG_FILTER_SOURCE_VALUE: values,
             consts.CONFIG_FILTER_TARGET_COLUMN: primary_key_info[
                 consts.CONFIG_TARGET_COLUMN
             ],
-            consts.CONFIG_FILTER_TARGET_VALUE: random_rows[
-                primary_key_info[consts.CONFIG_SOURCE_COLUMN]
-            ],
+            consts.CONFIG_FILTER_TARGET_VALUE: values,
+            consts.CONFIG_FILTER_BATCH_SIZE: self.config_manager.recursive_batch_size,
         }
         self.validation_builder.add_filter(filter_field)
 
+    def _get_random_row_batches(self):
+        """Return (equal_values, isin_values) filters selecting a set of random
+        rows by all of their primary keys, in batches of at most
+        recursive_batch_size keys.
+
+        Keys are batched like failed groups of recursive validations, on the
+        primary key with the most distinct values, so no filter has an
+        IN-list longer than the batch size. When too few rows share the values
+        of their other primary keys for that, the batches select every row
+        with a sampled value of that primary key instead.
+        """
+        primary_keys = self.config_manager.primary_keys
+        random_rows = self._get_random_rows(primary_keys)
+        if len(random_rows) == 0:
+            return None
+
+        aliases = [
+            primary_key[consts.CONFIG_FIELD_ALIAS] for primary_key in primary_keys
+        ]
+        random_rows = random_rows.rename(
+            columns={
+                primary_key[consts.CONFIG_SOURCE_COLUMN]: primary_key[
+                    consts.CONFIG_FIELD_ALIAS
+                ]
+                for primary_key in primary_keys
+            }
+        )[aliases].drop_duplicates()
+        batch_alias = max(aliases, key=lambda alias: random_rows[alias].nunique())
+        random_row_batches = self._get_recursive_batches(
+            random_rows.to_dict(orient="records"), batch_alias
+        )
+
+        batch_size = self.config_manager.recursive_batch_size
+        min_batches = math.ceil(len(random_rows) / batch_size)
+        if (
+            len(random_row_batches)
+            > min_batches * self.config_manager.max_recursive_workers
+        ):
+            values = list(random_rows[batch_alias].unique())
+            random_row_batches = [
+                ({}, {batch_alias: values[index : index + batch_size]})
+                for index in range(0, len(values), batch_size)
+            ]
+        return random_row_batches
+
+    def _execute_random_row_batches(
+        self, validation_builder, grouped_fields, random_row_batches
+    ):
+        """Validate batches of random rows concurrently, in batch order."""
+        batch_validation_builders = []
+        for random_row_batch in random_row_batches:
+            batch_validation_builder = validation_builder.clone()
+            self._add_recursive_validation_filter(
+                batch_validation_builder,
+                *random_row_batch,
+                key_configs=batch_validation_builder.primary_keys,
+            )
+            batch_validation_builders.append(batch_validation_builder)
+
+        if grouped_fields or not self.config_manager.use_merkle:
+            # Batches are the first level of a recursive validation
+            batch_results = self._execute_recursive_levels(
+                batch_validation_builders, grouped_fields
+            )
+            return pandas.concat(
+                [result_df for results in batch_results for result_df in results]
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=self.config_manager.max_recursive_workers
+        ) as executor:
+            return pandas.concat(
+                list(
+                    executor.map(
+                        lambda builder: self._execute_row_validation(builder, []),
+                        batch_validation_builders,
+                    )
+                )
+            )
+
+    def _add_incremental_filter(self):
+        """Add a filter for the rows above the stored watermark of an
+        incremental validation to the validation builder."""
+        column = self.config_manager.incremental_column
+        self._incremental_state = (
+            state_manager.StateManager().get_validation_state(
+                self.config_manager.incremental_name
+            )
+            or {}
+        )
+        if self._incremental_state.get("incremental_column", column) != column:
+            raise ValueError(
+                f"Incremental validation {self.config_manager.incremental_name} "
+                f"was stored for column {self._incremental_state['incremental_column']}"
+            )
+        lower_bound = incremental.decode_watermark(
+            self._incremental_state.get("watermark"),
+            self._incremental_state.get("watermark_type"),
+        )
+
+        # The upper bound is fixed before validating so rows loaded while the
+        # validation runs are validated by the next run. It is the max of both
+        # sides, so rows only loaded to one side yet are validated as missing.
+        target_columns = {
+            x.casefold(): str(x)
+            for x in self.config_manager.get_target_ibis_table().columns
+        }
+        target_column = target_columns.get(column.casefold(), column)
+        with ThreadPoolExecutor() as executor:
+            max_values = list(
+                executor.map(
+                    self._get_incremental_max,
+                    [consts.RESULT_TYPE_SOURCE, consts.RESULT_TYPE_TARGET],
+                    [column, target_column],
+                    [lower_bound, lower_bound],
+                )
+            )
+        max_values = [
+            value
+            for value in max_values
+            if value is not None and not pandas.isna(value)
+        ]
+        upper_bound = max(max_values) if max_values else lower_bound
+        if upper_bound is None:
+            return
+
+        self._incremental_watermark = upper_bound
+        filter_field = {
+            consts.CONFIG_TYPE: consts.FILTER_TYPE_RANGE,
+            consts.CONFIG_FILTER_SOURCE_COLUMN: column,
+            consts.CONFIG_FILTER_TARGET_COLUMN: target_column,
+            consts.CONFIG_FILTER_LOWER_BOUND: lower_bound,
+            consts.CONFIG_FILTER_UPPER_BOUND: upper_bound,
+        }
+        self.validation_builder.add_filter(filter_field)
+
+    def _get_incremental_max(self, side, column, lower_bound):
+        """Return the max of the incremental column of one side above the
+        lower bound, within the filters of that side."""
+        if side == consts.RESULT_TYPE_SOURCE:
+            client = self.config_manager.source_client
+            table = clients.get_ibis_table(
+                client,
+                self.config_manager.source_schema,
+                self.config_manager.source_table,
+            )
+            query_builder = self.validation_builder.source_builder
+        else:
+            client = self.config_manager.target_client
+            table = clients.get_ibis_table(
+                client,
+                self.config_manager.target_schema,
+                self.config_manager.target_table,
+            )
+            query_builder = self.validation_builder.target_builder
+        filters = query_builder.compile_filter_fields(table)
+        if lower_bound is not None:
+            filters.append(table[column] > lower_bound)
+        filtered_table = table.filter(filters) if filters else table
+        return client.execute(filtered_table[column].max())
+
+    def _roll_up_incremental_results(self, result_df):
+        """Return the report of an incremental validation rolled into the
+        stored cumulative results."""
+        if self.config_manager.validation_type != consts.COLUMN_VALIDATION:
+            logging.warning(
+                "Cumulative results are only supported for column validations."
+            )
+            return result_df
+        result_df, cumulative = incremental.roll_up_results(
+            result_df, self._incremental_state.get("cumulative", {})
+        )
+        self._incremental_state["cumulative"] = cumulative
+        return result_df
+
+    def _store_incremental_state(self):
+        """Store the watermark and cumulative results of this run."""
+        state = dict(self._incremental_state)
+        state["incremental_column"] = self.config_manager.incremental_column
+        if self._incremental_watermark is not None:
+            (
+                state["watermark"],
+                state["watermark_type"],
+            ) = incremental.encode_watermark(self._incremental_watermark)
+        state_manager.StateManager().create_validation_state(
+            self.config_manager.incremental_name, state
+        )
+
     def query_too_large(self, rows_df, grouped_fields):
         """Return bool to dictate if another level of recursion
         would create a too large result set.
@@ -179,9 +543,30 @@ class DataValidation(object):
         source and target tables. Where they differ, add to the GROUP BY
         clause recursively until the individual row differences can be
         identified.
+
+        All failing groups of a level are drilled into together, using
+        IN-list filters of at most recursive_batch_size keys, so the number
+        of queries grows with the recursion depth rather than with the number
+        of mismatched groups.
+        """
+        if not grouped_fields:
+            past_results, _ = self._execute_recursive_step(
+                validation_builder, grouped_fields
+            )
+            return pandas.concat(past_results) if past_results else None
+        return pandas.concat(
+            self._execute_recursive_levels([validation_builder], grouped_fields)[0]
+        )
+
+    def _execute_recursive_step(self, validation_builder, grouped_fields):
+        """Validate one step of a recursive validation.
+
+        Returns the reports of the groups which need no further drilling and
+        the failed groups to drill into on the next grouped field.
         """
         process_in_memory = self.config_manager.process_in_memory()
         past_results = []
+        failed_groups = []
         if len(grouped_fields) > 0:
             validation_builder.add_query_group(grouped_fields[0])
             result_df = self._execute_validation(
@@ -210,16 +595,8 @@ class DataValidation(object):
                 if group_suceeded:
                     past_results.append(grouped_key_df)
                 else:
-                    recursive_validation_builder = validation_builder.clone()
-                    self._add_recursive_validation_filter(
-                        recursive_validation_builder, row
-                    )
-                    past_results.append(
-                        self.execute_recursive_validation(
-                            recursive_validation_builder, grouped_fields[1:]
-                        )
-                    )
-        elif self.config_manager.primary_keys and len(grouped_fields) == 0:
+                    failed_groups.append(json.loads(row[consts.GROUP_BY_COLUMNS]))
+        elif self.config_manager.primary_keys:
             past_results.append(
                 self._execute_validation(
                     validation_builder, process_in_memory=process_in_memory
@@ -234,26 +611,127 @@ class DataValidation(object):
             warnings.warn(
                 "WARNING: No Primary Keys Suppplied in Row Validation", UserWarning
             )
-            return None
 
-        return pandas.concat(past_results)
+        return past_results, failed_groups
+
+    def _execute_recursive_levels(self, validation_builders, grouped_fields):
+        """Drill into the failed groups of validation_builders level by level.
+
+        The steps of a level run concurrently on a single pool of
+        max_recursive_workers threads, so the number of threads does not grow
+        with the recursion depth. Returns the reports of each builder, in
+        batch order.
+        """
+        builder_results = [[] for _ in validation_builders]
+        level = list(zip(validation_builders, builder_results))
+        with ThreadPoolExecutor(
+            max_workers=self.config_manager.max_recursive_workers
+        ) as executor:
+            for depth in range(len(grouped_fields) + 1):
+                level_fields = grouped_fields[depth:]
+                step_results = executor.map(
+                    lambda step, fields=level_fields: self._execute_recursive_step(
+                        step[0], fields
+                    ),
+                    level,
+                )
+                next_level = []
+                for (validation_builder, results), (
+                    past_results,
+                    failed_groups,
+                ) in zip(level, step_results):
+                    results.extend(past_results)
+                    if not failed_groups:
+                        continue
+                    for recursive_batch in self._get_recursive_batches(
+                        failed_groups, level_fields[0][consts.CONFIG_FIELD_ALIAS]
+                    ):
+                        recursive_validation_builder = validation_builder.clone()
+                        self._add_recursive_validation_filter(
+                            recursive_validation_builder, *recursive_batch
+                        )
+                        # Reports of a batch follow the reports of its parent
+                        batch_results = []
+                        results.append(batch_results)
+                        next_level.append((recursive_validation_builder, batch_results))
+                level = next_level
+                if not level:
+                    break
+
+        return [self._flatten_results(results) for results in builder_results]
+
+    @classmethod
+    def _flatten_results(cls, results):
+        """Return the reports of nested lists of recursive step reports."""
+        result_dfs = []
+        for result in results:
+            if isinstance(result, list):
+                result_dfs.extend(cls._flatten_results(result))
+            else:
+                result_dfs.append(result)
+        return result_dfs
+
+    def _get_recursive_batches(self, failed_groups, batch_alias):
+        """Return (equal_values, isin_values) filters covering failed_groups.
+
+        Groups sharing values for every alias except batch_alias are batched
+        into a single IN-list filter on batch_alias, so each batch selects
+        exactly the failed groups it covers.
+        """
+        batch_size = self.config_manager.recursive_batch_size
+        batches = {}
+        for group in failed_groups:
+            equal_values = tuple(
+                (alias, value) for alias, value in group.items() if alias != batch_alias
+            )
+            batches.setdefault(equal_values, []).append(group[batch_alias])
+
+        recursive_batches = []
+        for equal_values, batch_values in batches.items():
+            for index in range(0, len(batch_values), batch_size):
+                recursive_batches.append(
+                    (
+                        dict(equal_values),
+                        {batch_alias: batch_values[index : index + batch_size]},
+                    )
+                )
+        return recursive_batches
 
-    def _add_recursive_validation_filter(self, validation_builder, row):
-        """Return ValidationBuilder Configured for Next Recursive Search"""
-        group_by_columns = json.loads(row[consts.GROUP_BY_COLUMNS])
-        for alias, value in group_by_columns.items():
+    def _add_recursive_validation_filter(
+        self, validation_builder, equal_values, isin_values, key_configs=None
+    ):
+        """Return ValidationBuilder Configured for Next Recursive Search
+
+        Filter aliases are grouped fields, unless key_configs supplies the
+        columns of each alias, e.g. the primary keys of the builder.
+        """
+        key_configs = key_configs or validation_builder.group_aliases
+        for alias, value in equal_values.items():
             filter_field = {
                 consts.CONFIG_TYPE: consts.FILTER_TYPE_EQUALS,
-                consts.CONFIG_FILTER_SOURCE_COLUMN: validation_builder.get_grouped_alias_source_column(
-                    alias
-                ),
+                consts.CONFIG_FILTER_SOURCE_COLUMN: key_configs[alias][
+                    consts.CONFIG_SOURCE_COLUMN
+                ],
                 consts.CONFIG_FILTER_SOURCE_VALUE: value,
-                consts.CONFIG_FILTER_TARGET_COLUMN: validation_builder.get_grouped_alias_target_column(
-                    alias
-                ),
+                consts.CONFIG_FILTER_TARGET_COLUMN: key_configs[alias][
+                    consts.CONFIG_TARGET_COLUMN
+                ],
                 consts.CONFIG_FILTER_TARGET_VALUE: value,
             }
             validation_builder.add_filter(filter_field)
+        for alias, values in isin_values.items():
+            filter_field = {
+                consts.CONFIG_TYPE: consts.FILTER_TYPE_ISIN,
+                consts.CONFIG_FILTER_SOURCE_COLUMN: key_configs[alias][
+                    consts.CONFIG_SOURCE_COLUMN
+                ],
+                consts.CONFIG_FILTER_SOURCE_VALUE: values,
+                consts.CONFIG_FILTER_TARGET_COLUMN: key_configs[alias][
+                    consts.CONFIG_TARGET_COLUMN
+                ],
+                consts.CONFIG_FILTER_TARGET_VALUE: values,
+            }
+            validation_builder.add_filter(filter_field)
 
     @classmethod
     def _get_pandas_schema(
@@ -292,12 +770,24 @@ class DataValidation(object):
 
         return pd_schema
 
+    def _set_validations(self, validation_builder):
+        """Record the validations of a builder in the run metadata.
+
+        Builders cloned for concurrent steps hold equal validations, so the
+        run metadata is only replaced when the validations change.
+        """
+        validations = validation_builder.get_metadata()
+        with self._validations_lock:
+            if self.run_metadata.validations != validations:
+                self.run_metadata.validations = validations
+
     def _execute_validation(self, validation_builder, process_in_memory=True):
         """Execute Against a Supplied Validation Builder"""
-        self.run_metadata.validations = validation_builder.get_metadata()
+        self._set_validations(validation_builder)
 
-        source_query = validation_builder.get_source_query()
-        target_query = validation_builder.get_target_query()
+        with profiling.span(self.run_metadata, profiling.SPAN_COMPILE):
+            source_query = validation_builder.get_source_query()
+            target_query = validation_builder.get_target_query()
 
         join_on_fields = (
             set(validation_builder.get_primary_keys())
@@ -318,64 +808,421 @@ class DataValidation(object):
             )
         )
 
-        if process_in_memory:
+        if (
+            process_in_memory
+            and is_value_comparison
+            and join_on_fields
+            and self.config_manager.memory_budget_mb
+        ):
+            result_df = self._execute_streaming_validation(
+                source_query, target_query, join_on_fields, is_value_comparison
+            )
+        elif process_in_memory:
             futures = []
             with ThreadPoolExecutor() as executor:
                 # Submit the two query network calls concurrently
                 futures.append(
                     executor.submit(
-                        self.config_manager.source_client.execute, source_query
+                        self._execute_query,
+                        self.config_manager.source_client,
+                        self.config_manager.get_source_connection(),
+                        source_query,
+                        is_value_comparison,
+                        side=consts.RESULT_TYPE_SOURCE,
                     )
                 )
                 futures.append(
                     executor.submit(
-                        self.config_manager.target_client.execute, target_query
+                        self._execute_query,
+                        self.config_manager.target_client,
+                        self.config_manager.get_target_connection(),
+                        target_query,
+                        is_value_comparison,
+                        side=consts.RESULT_TYPE_TARGET,
                     )
                 )
                 source_df = futures[0].result()
                 target_df = futures[1].result()
 
-            join_on_schema = {_: source_query.schema()[_] for _ in join_on_fields}
-            pd_schema = self._get_pandas_schema(
-                source_df, target_df, join_on_schema, verbose=self.verbose
-            )
-
-            pandas_client = ibis.backends.pandas.connect(
-                {combiner.DEFAULT_SOURCE: source_df, combiner.DEFAULT_TARGET: target_df}
+            result_df = self._combine_in_memory(
+                source_df,
+                target_df,
+                source_query,
+                join_on_fields,
+                is_value_comparison,
             )
-
-            try:
+        else:
+            # The remote combine runs the source and target queries as well
+            with profiling.span(
+                self.run_metadata, profiling.SPAN_COMBINE, mode="remote"
+            ):
                 result_df = combiner.generate_report(
-                    pandas_client,
+                    self.config_manager.source_client,
                     self.run_metadata,
-                    pandas_client.table(combiner.DEFAULT_SOURCE, schema=pd_schema),
-                    pandas_client.table(combiner.DEFAULT_TARGET, schema=pd_schema),
+                    source_query,
+                    target_query,
                     join_on_fields=join_on_fields,
                     is_value_comparison=is_value_comparison,
                     verbose=self.verbose,
                 )
-            except Exception as e:
-                if self.verbose:
-                    logging.error("-- ** Logging Source DF ** --")
-                    logging.error(source_df.dtypes)
-                    logging.error(source_df)
-                    logging.error("-- ** Logging Target DF ** --")
-                    logging.error(target_df.dtypes)
-                    logging.error(target_df)
-                raise e
-        else:
-            result_df = combiner.generate_report(
-                self.config_manager.source_client,
-                self.run_metadata,
+
+        return result_df
+
+    def _execute_source_and_target(self, source_query, target_query):
+        """Execute the source and target queries concurrently."""
+        with ThreadPoolExecutor() as executor:
+            source_future = executor.submit(
+                self._fetch,
+                consts.RESULT_TYPE_SOURCE,
+                self.config_manager.source_client.execute,
                 source_query,
+            )
+            target_future = executor.submit(
+                self._fetch,
+                consts.RESULT_TYPE_TARGET,
+                self.config_manager.target_client.execute,
                 target_query,
-                join_on_fields=join_on_fields,
-                is_value_comparison=is_value_comparison,
-                verbose=self.verbose,
             )
+            return source_future.result(), target_future.result()
 
+    def _fetch(self, side, execute, query):
+        """Execute the query of one side, recording the rows fetched."""
+        with profiling.span(
+            self.run_metadata, profiling.SPAN_FETCH, side=side
+        ) as fetch_span:
+            result_df = execute(query)
+            fetch_span.attributes["rows"] = len(result_df)
+            fetch_span.attributes["bytes"] = profiling.get_frame_bytes(
+                result_df, deep=self.deep_bytes
+            )
         return result_df
 
+    def _execute_fingerprint_validation(self, validation_builder):
+        """Compare one fingerprint of the row hashes of each table.
+
+        Each database returns a single row summarizing its row hashes. Rows
+        are only compared when the fingerprints differ, and their report is
+        returned after the fingerprint report.
+        """
+        source_query = validation_builder.get_source_query()
+        target_query = validation_builder.get_target_query()
+        hash_column = merkle.get_hash_column(
+            source_query, validation_builder.get_primary_keys()
+        )
+        source_df, target_df = self._execute_source_and_target(
+            merkle.get_fingerprint_query(source_query, hash_column),
+            merkle.get_fingerprint_query(target_query, hash_column),
+        )
+
+        self.run_metadata.validations = {
+            hash_column: dataclasses.replace(
+                validation_builder.get_metadata()[hash_column],
+                aggregation_type=consts.CONFIG_FINGERPRINT,
+                primary_keys=[],
+            )
+        }
+        source_df = pandas.DataFrame({hash_column: [merkle.get_fingerprint(source_df)]})
+        target_df = pandas.DataFrame({hash_column: [merkle.get_fingerprint(target_df)]})
+        result_df = self._combine_in_memory(
+            source_df,
+            target_df,
+            source_query,
+            set(),
+            is_value_comparison=True,
+        )
+        if (result_df["validation_status"] == consts.VALIDATION_STATUS_SUCCESS).all():
+            return result_df
+
+        logging.info("Table fingerprints differ, comparing rows.")
+        row_df = self._execute_row_validation(validation_builder, [])
+        return pandas.concat([result_df, row_df], ignore_index=True)
+
+    def _execute_merkle_validation(self, validation_builder):
+        """Compare row hashes in buckets of a Merkle tree.
+
+        Row hashes are summarized per bucket in the database and only the
+        buckets which differ are split further, so only the rows of differing
+        buckets are returned from the databases. The report starts with a row
+        counting the rows of the matching buckets. Returns None when too many
+        buckets differ, in which case all rows should be compared.
+        """
+        self._set_validations(validation_builder)
+        source_query = validation_builder.get_source_query()
+        target_query = validation_builder.get_target_query()
+        primary_keys = validation_builder.get_primary_keys()
+        hash_column = merkle.get_hash_column(source_query, primary_keys)
+
+        buckets = None
+        prefix_length = 0
+        source_rows = target_rows = None
+        while prefix_length < consts.MERKLE_MAX_PREFIX_LENGTH:
+            prefix_length += consts.MERKLE_DIGITS_PER_LEVEL
+            source_df, target_df = self._execute_source_and_target(
+                merkle.get_bucket_query(
+                    source_query, hash_column, prefix_length, buckets
+                ),
+                merkle.get_bucket_query(
+                    target_query, hash_column, prefix_length, buckets
+                ),
+            )
+            if source_rows is None:
+                source_rows = int(source_df[merkle.COUNT_ALIAS].sum())
+                target_rows = int(target_df[merkle.COUNT_ALIAS].sum())
+            buckets, row_count = merkle.get_differing_buckets(source_df, target_df)
+            logging.info(
+                "%s buckets of %s hex digits with %s rows differ",
+                len(buckets),
+                prefix_length,
+                row_count,
+            )
+            if not buckets or row_count <= consts.DEFAULT_MERKLE_LEAF_ROWS:
+                break
+            if len(buckets) > consts.MERKLE_MAX_BUCKETS:
+                logging.warning(
+                    "Too many differing buckets for a Merkle comparison, "
+                    "comparing all rows."
+                )
+                return None
+
+        source_df, target_df = self._execute_source_and_target(
+            merkle.get_leaf_query(source_query, hash_column, prefix_length, buckets),
+            merkle.get_leaf_query(target_query, hash_column, prefix_length, buckets),
+        )
+        row_df = self._combine_in_memory(
+            source_df,
+            target_df,
+            source_query,
+            set(primary_keys),
+            is_value_comparison=True,
+        )
+        summary_df = self._get_merkle_summary(
+            validation_builder,
+            hash_column,
+            source_rows - len(source_df),
+            target_rows - len(target_df),
+        )
+        return pandas.concat([summary_df, row_df], ignore_index=True)
+
+    def _get_merkle_summary(
+        self, validation_builder, hash_column, source_matched_rows, target_matched_rows
+    ):
+        """Return a report row comparing the source and target rows of the
+        buckets which matched, so that identical tables are reported as a
+        success. The rows of each side are its rows outside of the buckets
+        compared row by row."""
+        run_metadata = dataclasses.replace(
+            self.run_metadata,
+            validations={
+                hash_column: dataclasses.replace(
+                    validation_builder.get_metadata()[hash_column],
+                    aggregation_type=consts.CONFIG_MERKLE,
+                    primary_keys=[],
+                )
+            },
+        )
+        source_df = pandas.DataFrame({hash_column: [str(source_matched_rows)]})
+        target_df = pandas.DataFrame({hash_column: [str(target_matched_rows)]})
+        return combiner.generate_report_from_dataframes(
+            run_metadata, source_df, target_df, is_value_comparison=True
+        )
+
+    def _execute_query(
+        self,
+        client,
+        connection_config,
+        query,
+        is_value_comparison,
+        side=consts.RESULT_TYPE_SOURCE,
+    ):
+        """Execute a query, using the query cache for aggregate queries when
+        the cache is enabled."""
+        if not self.config_manager.use_cache or is_value_comparison:
+            return self._fetch(side, client.execute, query)
+        cache = query_cache.QueryCache(ttl_seconds=self.config_manager.cache_ttl)
+        return self._fetch(
+            side,
+            lambda cached_query: cache.execute(
+                client,
+                connection_config,
+                cached_query,
+                version=self.config_manager.cache_version,
+            ),
+            query,
+        )
+
+    def _combine_in_memory(
+        self, source_df, target_df, source_query, join_on_fields, is_value_comparison
+    ):
+        """Return the report combining source and target result DataFrames."""
+        join_on_schema = {_: source_query.schema()[_] for _ in join_on_fields}
+        pd_schema = self._get_pandas_schema(
+            source_df, target_df, join_on_schema, verbose=self.verbose
+        )
+
+        try:
+            with profiling.span(
+                self.run_metadata, profiling.SPAN_COMBINE
+            ) as combine_span:
+                if self.config_manager.combiner == consts.COMBINER_NATIVE:
+                    result_df = combiner.generate_report_from_dataframes(
+                        self.run_metadata,
+                        source_df,
+                        target_df,
+                        join_on_fields=join_on_fields,
+                        is_value_comparison=is_value_comparison,
+                        verbose=self.verbose,
+                    )
+                else:
+                    pandas_client = ibis.backends.pandas.connect(
+                        {
+                            combiner.DEFAULT_SOURCE: source_df,
+                            combiner.DEFAULT_TARGET: target_df,
+                        }
+                    )
+                    result_df = combiner.generate_report(
+                        pandas_client,
+                        self.run_metadata,
+                        pandas_client.table(combiner.DEFAULT_SOURCE, schema=pd_schema),
+                        pandas_client.table(combiner.DEFAULT_TARGET, schema=pd_schema),
+                        join_on_fields=join_on_fields,
+                        is_value_comparison=is_value_comparison,
+                        verbose=self.verbose,
+                    )
+                combine_span.attributes["rows"] = len(result_df)
+        except Exception as e:
+            if self.verbose:
+                logging.error("-- ** Logging Source DF ** --")
+                logging.error(source_df.dtypes)
+                logging.error(source_df)
+                logging.error("-- ** Logging Target DF ** --")
+                logging.error(target_df.dtypes)
+                logging.error(target_df)
+            raise e
+
+        return result_df
+
+    def _execute_streaming_validation(
+        self, source_query, target_query, join_on_fields, is_value_comparison
+    ):
+        """Compare row results partition by partition within the memory budget.
+
+        Both result sets are streamed in chunks and hash partitioned by
+        primary key into spill files, then each source and target partition
+        pair is combined on its own. The concatenated
+        partition reports equal the report of an in-memory comparison.
+
+        When called through execute, each partition report is passed to the
+        Result Handler instead of being kept, and an empty report is returned.
+        """
+        memory_budget_bytes = self.config_manager.memory_budget_mb * 1024 * 1024
+        key_fields = sorted(join_on_fields)
+        sides = (
+            (
+                consts.RESULT_TYPE_SOURCE,
+                self.config_manager.source_client,
+                source_query,
+            ),
+            (
+                consts.RESULT_TYPE_TARGET,
+                self.config_manager.target_client,
+                target_query,
+            ),
+        )
+
+        # Partitions are sized from the row counts and the schema, so no rows
+        # are fetched before streaming.
+        row_bytes = streaming_compare.estimate_row_bytes(source_query.schema())
+        with ThreadPoolExecutor() as executor:
+            counts = list(
+                executor.map(lambda side: side[1].execute(side[2].count()), sides)
+            )
+        total_rows = max(counts)
+
+        num_partitions = streaming_compare.num_partitions_for_budget(
+            total_rows, row_bytes, memory_budget_bytes
+        )
+        chunk_rows = streaming_compare.chunk_rows_for_budget(
+            row_bytes, memory_budget_bytes
+        )
+        if self.verbose:
+            logging.info(
+                "-- ** Streaming row comparison: %s rows, %s partitions, "
+                "%s rows per chunk ** --",
+                total_rows,
+                num_partitions,
+                chunk_rows,
+            )
+
+        with streaming_compare.SpillStore(num_partitions) as spill_store:
+
+            def spill(side, client, query):
+                with profiling.span(
+                    self.run_metadata, profiling.SPAN_FETCH, side=side
+                ) as fetch_span:
+                    rows = fetched_bytes = 0
+                    for chunk in clients.iter_dataframes(
+                        client, query, batch_rows=chunk_rows
+                    ):
+                        rows += len(chunk)
+                        fetched_bytes += profiling.get_frame_bytes(
+                            chunk, deep=self.deep_bytes
+                        )
+                        spill_store.append(side, chunk, key_fields)
+                    fetch_span.attributes["rows"] = rows
+                    fetch_span.attributes["bytes"] = fetched_bytes
+
+            with ThreadPoolExecutor() as executor:
+                # Fetch and spill source and target concurrently
+                futures = [executor.submit(spill, *side) for side in sides]
+                for future in futures:
+                    future.result()
+
+            templates = {
+                side: spill_store.templates.get(side, self._get_empty_result(query))
+                for side, _, query in sides
+            }
+            partition_results = []
+            for partition in range(num_partitions):
+                source_df = spill_store.read(
+                    consts.RESULT_TYPE_SOURCE,
+                    partition,
+                    templates[consts.RESULT_TYPE_SOURCE],
+                )
+                target_df = spill_store.read(
+                    consts.RESULT_TYPE_TARGET,
+                    partition,
+                    templates[consts.RESULT_TYPE_TARGET],
+                )
+                if len(source_df) == 0 and len(target_df) == 0:
+                    continue
+                partition_df = self._combine_in_memory(
+                    source_df,
+                    target_df,
+                    source_query,
+                    join_on_fields,
+                    is_value_comparison,
+                )
+                if self._stream_reports:
+                    self._write_result(partition_df)
+                    self._reports_streamed = True
+                else:
+                    partition_results.append(partition_df)
+
+        if not partition_results:
+            return self._combine_in_memory(
+                templates[consts.RESULT_TYPE_SOURCE].copy(),
+                templates[consts.RESULT_TYPE_TARGET].copy(),
+                source_query,
+                join_on_fields,
+                is_value_comparison,
+            )
+        return pandas.concat(partition_results, ignore_index=True)
+
+    @staticmethod
+    def _get_empty_result(query):
+        """Return an empty DataFrame with the columns and types of a query."""
+        return query.schema().apply_to(pandas.DataFrame(columns=query.columns))
+
     def combine_data(self, source_df, target_df, join_on_fields):
         """TODO: Return List of Dictionaries"""
         # Clean Data to Standardize
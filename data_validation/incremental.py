@@ -0,0 +1,201 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Watermarks and cumulative results of incremental validations.
+
+An incremental validation only validates the rows with a watermark column
+value above the high-water mark stored by its previous run. The state of an
+incremental validation is stored with the StateManager as:
+
+    {
+        "incremental_column": "updated_at",
+        "watermark": "2023-01-02T00:00:00",
+        "watermark_type": "timestamp",
+        "cumulative": {"count": {"aggregation_type": "count", ...}},
+    }
+"""
+
+import datetime
+import decimal
+import logging
+import numbers
+
+import numpy
+import pandas
+
+from data_validation import consts
+
+WATERMARK_TIMESTAMP = "timestamp"
+WATERMARK_DATE = "date"
+WATERMARK_DECIMAL = "decimal"
+WATERMARK_NUMBER = "number"
+WATERMARK_STRING = "string"
+
+ADDITIVE_AGGREGATES = [consts.CONFIG_TYPE_COUNT, consts.CONFIG_TYPE_SUM]
+EXTREMUM_AGGREGATES = {"min": min, "max": max}
+
+NULL_AGG_VALUES = ["None", "nan", "NaN", ""]
+
+
+def encode_watermark(value):
+    """Return the watermark value and type to store a watermark as JSON."""
+    if isinstance(value, (datetime.datetime, numpy.datetime64)):
+        return pandas.Timestamp(value).isoformat(), WATERMARK_TIMESTAMP
+    if isinstance(value, datetime.date):
+        return value.isoformat(), WATERMARK_DATE
+    if isinstance(value, decimal.Decimal):
+        return str(value), WATERMARK_DECIMAL
+    if isinstance(value, numbers.Integral):
+        return int(value), WATERMARK_NUMBER
+    if isinstance(value, numbers.Real):
+        return float(value), WATERMARK_NUMBER
+    return str(value), WATERMARK_STRING
+
+
+def decode_watermark(value, watermark_type):
+    """Return a watermark stored by encode_watermark as a filter value."""
+    if value is None:
+        return None
+    if watermark_type == WATERMARK_TIMESTAMP:
+        return pandas.Timestamp(value).to_pydatetime()
+    if watermark_type == WATERMARK_DATE:
+        return datetime.date.fromisoformat(value)
+    if watermark_type == WATERMARK_DECIMAL:
+        return decimal.Decimal(value)
+    return value
+
+
+def _to_number(value):
+    """Return an aggregate value of the report as a number or None."""
+    if isinstance(value, numbers.Number) and not isinstance(value, bool):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_null(value):
+    if isinstance(value, str):
+        return value in NULL_AGG_VALUES
+    return value is None or bool(pandas.isna(value))
+
+
+def _roll_up_value(aggregation_type, cumulative_value, value):
+    """Return an aggregate value combined with its cumulative value."""
+    if _is_null(cumulative_value):
+        return value
+    if _is_null(value):
+        return cumulative_value
+
+    cumulative_number, number = _to_number(cumulative_value), _to_number(value)
+    if aggregation_type in ADDITIVE_AGGREGATES:
+        return str(cumulative_number + number)
+    if cumulative_number is not None and number is not None:
+        extremum = EXTREMUM_AGGREGATES[aggregation_type](cumulative_number, number)
+        return cumulative_value if extremum == cumulative_number else value
+    return EXTREMUM_AGGREGATES[aggregation_type](str(cumulative_value), str(value))
+
+
+def _compare_values(source_value, target_value, pct_threshold):
+    """Return the difference, pct_difference and validation_status of two
+    aggregate values, as calculated by the combiner."""
+    if _is_null(source_value) and _is_null(target_value):
+        return None, None, consts.VALIDATION_STATUS_SUCCESS
+
+    source_number, target_number = _to_number(source_value), _to_number(target_value)
+    if source_number is None or target_number is None:
+        status = (
+            consts.VALIDATION_STATUS_SUCCESS
+            if source_value == target_value
+            else consts.VALIDATION_STATUS_FAIL
+        )
+        return None, None, status
+
+    difference = float(target_number - source_number)
+    if difference == 0:
+        pct_difference = 0.0
+    else:
+        pct_difference = 100.0 * difference / float(source_number or target_number)
+    status = (
+        consts.VALIDATION_STATUS_FAIL
+        if abs(pct_difference) > pct_threshold
+        else consts.VALIDATION_STATUS_SUCCESS
+    )
+    return difference, pct_difference, status
+
+
+def _get_cumulative_key(row):
+    group_by_columns = row.get("group_by_columns")
+    if _is_null(group_by_columns):
+        return row["validation_name"]
+    return f"{row['validation_name']}|{group_by_columns}"
+
+
+def roll_up_results(result_df, cumulative):
+    """Return the report with its aggregates rolled into the cumulative
+    aggregates of previous runs, and the new cumulative aggregates.
+
+    Count and sum aggregates are added and min and max aggregates are
+    compared. Other aggregates, such as avg, are reported for the new rows
+    only as they can not be combined.
+
+    Args:
+        result_df (DataFrame): The report of the rows above the watermark.
+        cumulative (Dict): The cumulative aggregates of previous runs.
+    """
+    result_df = result_df.copy()
+    new_cumulative = {}
+    for index, row in result_df.iterrows():
+        aggregation_type = row["aggregation_type"]
+        if (
+            aggregation_type not in ADDITIVE_AGGREGATES
+            and aggregation_type not in EXTREMUM_AGGREGATES
+        ):
+            logging.warning(
+                "Unable to roll up %s aggregate %s, reporting new rows only.",
+                aggregation_type,
+                row["validation_name"],
+            )
+            continue
+
+        key = _get_cumulative_key(row)
+        source_value = row["source_agg_value"]
+        target_value = row["target_agg_value"]
+        if key in cumulative:
+            source_value = _roll_up_value(
+                aggregation_type, cumulative[key]["source_agg_value"], source_value
+            )
+            target_value = _roll_up_value(
+                aggregation_type, cumulative[key]["target_agg_value"], target_value
+            )
+        new_cumulative[key] = {
+            "aggregation_type": aggregation_type,
+            "source_agg_value": None if _is_null(source_value) else str(source_value),
+            "target_agg_value": None if _is_null(target_value) else str(target_value),
+        }
+
+        difference, pct_difference, status = _compare_values(
+            source_value, target_value, row["pct_threshold"]
+        )
+        result_df.at[index, "source_agg_value"] = source_value
+        result_df.at[index, "target_agg_value"] = target_value
+        result_df.at[index, "difference"] = difference
+        result_df.at[index, "pct_difference"] = pct_difference
+        result_df.at[index, "validation_status"] = status
+    return result_df, new_cumulative
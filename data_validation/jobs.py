@@ -0,0 +1,212 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Validation jobs run in the background by the validation service.
+
+Jobs run on a bounded pool of worker threads, and submissions are rejected
+once `max_queued_jobs` jobs wait for a worker. The report of a finished job
+is spilled to a Parquet file in `result_directory` and read back one row
+group at a time, so reports are not kept in memory. Report files are removed
+once more than `max_finished_jobs` jobs have finished after them.
+"""
+
+import collections
+import dataclasses
+import datetime
+import logging
+import os
+import tempfile
+import threading
+import typing
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pyarrow
+import pyarrow.parquet
+
+from data_validation import metrics
+from data_validation.exceptions import JobQueueFull
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_SUCCEEDED = "succeeded"
+JOB_STATUS_FAILED = "failed"
+
+DEFAULT_JOB_WORKERS = 4
+DEFAULT_MAX_FINISHED_JOBS = 100
+DEFAULT_MAX_QUEUED_JOBS = 100
+
+# Rows per row group of report files, the unit reports are read back in
+RESULT_ROW_GROUP_ROWS = 10000
+
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def _format_time(time):
+    return time.isoformat() if time else None
+
+
+@dataclasses.dataclass
+class Job(object):
+    job_id: str = dataclasses.field(default_factory=lambda: str(uuid.uuid4()))
+    status: str = JOB_STATUS_QUEUED
+    created_time: datetime.datetime = dataclasses.field(default_factory=_now)
+    start_time: typing.Optional[datetime.datetime] = None
+    end_time: typing.Optional[datetime.datetime] = None
+    error: typing.Optional[str] = None
+    rows: typing.Optional[int] = None
+    result_path: typing.Optional[str] = None
+
+    def to_dict(self):
+        """Return the status of the job as a JSON serializable dict."""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "created_time": _format_time(self.created_time),
+            "start_time": _format_time(self.start_time),
+            "end_time": _format_time(self.end_time),
+            "error": self.error,
+            "rows": self.rows,
+        }
+
+    def get_result_schema(self):
+        """Return the Arrow schema of the report."""
+        return pyarrow.parquet.read_schema(self.result_path)
+
+    def iter_results(self, offset=0, limit=None):
+        """Yield the report rows from offset, up to limit rows, as Arrow
+        record batches read one row group at a time.
+
+        Args:
+            offset (int): Number of rows to skip.
+            limit (int): Max number of rows, or None for all rows.
+        """
+        parquet_file = pyarrow.parquet.ParquetFile(self.result_path)
+        end = self.rows if limit is None else min(offset + limit, self.rows)
+        start = 0
+        for row_group in range(parquet_file.num_row_groups):
+            group_rows = parquet_file.metadata.row_group(row_group).num_rows
+            group_start, start = start, start + group_rows
+            if start <= offset or group_start >= end:
+                continue
+            table = parquet_file.read_row_group(row_group)
+            first = max(offset - group_start, 0)
+            yield from table.slice(
+                first, min(end, start) - group_start - first
+            ).to_batches()
+
+
+class JobManager(object):
+    def __init__(
+        self,
+        execute,
+        max_workers=DEFAULT_JOB_WORKERS,
+        max_finished_jobs=DEFAULT_MAX_FINISHED_JOBS,
+        max_queued_jobs=DEFAULT_MAX_QUEUED_JOBS,
+        result_directory=None,
+    ):
+        """Build a JobManager running validations in the background.
+
+        Args:
+            execute (Callable): Runs a validation config and returns its report.
+            max_workers (int): Max number of jobs running at once.
+            max_finished_jobs (int): Number of finished jobs kept with their
+                reports.
+            max_queued_jobs (int): Max number of jobs waiting for a worker,
+                beyond which submissions raise JobQueueFull.
+            result_directory (str): Directory of the report files, a new
+                temporary directory by default.
+        """
+        self._execute = execute
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.max_finished_jobs = max_finished_jobs
+        self.max_queued_jobs = max_queued_jobs
+        self.result_directory = result_directory or tempfile.mkdtemp(
+            prefix="data-validation-jobs-"
+        )
+        os.makedirs(self.result_directory, exist_ok=True)
+        self._jobs = {}
+        self._finished_job_ids = collections.deque()
+        self._queued_jobs = 0
+        self._lock = threading.Lock()
+
+    def submit(self, config):
+        """Queue a validation config and return its Job.
+
+        Raises:
+            JobQueueFull: When max_queued_jobs jobs already wait for a worker.
+        """
+        job = Job()
+        with self._lock:
+            if self._queued_jobs >= self.max_queued_jobs:
+                raise JobQueueFull(
+                    f"{self._queued_jobs} jobs are already waiting to run"
+                )
+            self._queued_jobs += 1
+            self._jobs[job.job_id] = job
+        metrics.VALIDATIONS_QUEUED.inc()
+        self._executor.submit(self._run, job, config)
+        return job
+
+    def get(self, job_id):
+        """Return the Job with the supplied id, or None if it is unknown."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job, config):
+        with self._lock:
+            self._queued_jobs -= 1
+        metrics.VALIDATIONS_QUEUED.dec()
+        job.start_time = _now()
+        job.status = JOB_STATUS_RUNNING
+        try:
+            self._store_result(job, self._execute(config))
+            job.status = JOB_STATUS_SUCCEEDED
+        except Exception as e:
+            logging.exception(e)
+            job.error = str(e)
+            job.status = JOB_STATUS_FAILED
+        job.end_time = _now()
+        self._finish(job)
+
+    def _store_result(self, job, result_df):
+        """Spill the report of a job to its Parquet file."""
+        result_path = os.path.join(self.result_directory, f"{job.job_id}.parquet")
+        table = pyarrow.Table.from_pandas(result_df, preserve_index=False)
+        pyarrow.parquet.write_table(
+            table, result_path, row_group_size=RESULT_ROW_GROUP_ROWS
+        )
+        job.result_path = result_path
+        job.rows = len(result_df)
+
+    def _finish(self, job):
+        """Keep the report of a finished job, evicting the oldest jobs."""
+        with self._lock:
+            self._finished_job_ids.append(job.job_id)
+            evicted_jobs = []
+            while len(self._finished_job_ids) > self.max_finished_jobs:
+                evicted_job = self._jobs.pop(self._finished_job_ids.popleft(), None)
+                if evicted_job is not None:
+                    evicted_jobs.append(evicted_job)
+        for evicted_job in evicted_jobs:
+            if evicted_job.result_path:
+                try:
+                    os.remove(evicted_job.result_path)
+                except FileNotFoundError:
+                    pass
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,100 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SQL expressions hashing key columns to integers.
+
+Keys are cast to strings, joined with a separator and hashed with MD5, of
+which the leading 32 bits are returned as a non-negative integer. MD5 is
+native to every supported engine, so rows of a source and a target on
+different engines hash to the same integer, as long as their keys cast to
+the same strings, e.g. integer and string keys. The hash of a row with a
+NULL key is NULL on every engine.
+
+Strings are hashed as UTF-8 bytes. On SQL Server, keys are converted to
+UTF-8 through a UTF-8 collation, which requires SQL Server 2019 or later.
+"""
+
+from typing import List
+
+KEY_SEPARATOR = "|"
+
+# SQL Server collation of keys hashed as UTF-8
+MSSQL_UTF8_COLLATION = "Latin1_General_100_BIN2_UTF8"
+
+# Cast of a key to a string, keyed by source type
+STRING_CASTS = {
+    "BigQuery": "CAST({key} AS STRING)",
+    # NVARCHAR converted to VARCHAR of a UTF-8 collation is encoded as UTF-8,
+    # where VARCHAR would hash the bytes of the code page of the database.
+    "MSSQL": (
+        "CAST(CAST({key} AS NVARCHAR(4000)) COLLATE {collation} AS VARCHAR(4000))"
+    ),
+    "MySQL": "CAST({key} AS CHAR)",
+    "Oracle": "CAST({key} AS VARCHAR2(4000))",
+    "Postgres": "CAST({key} AS VARCHAR)",
+    "Redshift": "CAST({key} AS VARCHAR)",
+    "Snowflake": "CAST({key} AS VARCHAR)",
+    "Spanner": "CAST({key} AS STRING)",
+}
+
+# Leading 32 bits of the MD5 hash of a string, keyed by source type
+MD5_INTEGERS = {
+    "BigQuery": "CAST(CONCAT('0x', SUBSTR(TO_HEX(MD5({value})), 1, 8)) AS INT64)",
+    "MSSQL": "CAST(CAST(HASHBYTES('MD5', {value}) AS BINARY(4)) AS BIGINT)",
+    "MySQL": "CAST(CONV(SUBSTRING(MD5({value}), 1, 8), 16, 10) AS UNSIGNED)",
+    "Oracle": (
+        "TO_NUMBER(SUBSTR(RAWTOHEX(STANDARD_HASH({value}, 'MD5')), 1, 8), "
+        "'XXXXXXXX')"
+    ),
+    "Postgres": "('x' || SUBSTR(MD5({value}), 1, 8))::BIT(32)::BIGINT",
+    "Redshift": "STRTOL(SUBSTRING(MD5({value}), 1, 8), 16)",
+    "Snowflake": "TO_NUMBER(SUBSTR(MD5({value}), 1, 8), 'XXXXXXXX')",
+    "Spanner": "CAST(CONCAT('0x', SUBSTR(TO_HEX(MD5({value})), 1, 8)) AS INT64)",
+}
+
+
+def supports_key_hash(source_type: str) -> bool:
+    """Return whether keys can be hashed on a source type."""
+    return source_type in MD5_INTEGERS
+
+
+def _concat(source_type: str, values: List[str]) -> str:
+    if source_type == "MSSQL":
+        return " + ".join(values)
+    if source_type == "MySQL":
+        return f"CONCAT({', '.join(values)})"
+    return " || ".join(values)
+
+
+def get_key_hash_sql(source_type: str, keys: List[str]) -> str:
+    """Return the SQL of the integer hash of the keys of a row.
+
+    Args:
+        source_type (str): The source type of the connection.
+        keys (List[str]): SQL column names of the keys.
+    """
+    if not supports_key_hash(source_type):
+        raise ValueError(f"Hashing keys is not supported for {source_type}")
+    values = []
+    for key in keys:
+        if values:
+            values.append(f"'{KEY_SEPARATOR}'")
+        values.append(
+            STRING_CASTS[source_type].format(key=key, collation=MSSQL_UTF8_COLLATION)
+        )
+    key_hash = MD5_INTEGERS[source_type].format(value=_concat(source_type, values))
+    # Oracle joins a NULL key as an empty string, so rows with a NULL key get
+    # no hash on any engine and are only kept in the partition of NULL keys.
+    nulls = " OR ".join(f"{key} IS NULL" for key in keys)
+    return f"CASE WHEN {nulls} THEN NULL ELSE {key_hash} END"
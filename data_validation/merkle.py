@@ -0,0 +1,207 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Queries to compare row hashes in buckets of a Merkle tree.
+
+Rows are bucketed by the leading hex digits of their row hash. Each bucket is
+summarized in the database by its row count, the sums of DIGEST_SLICES 24 bit
+integers taken from the trailing hex digits of its row hashes, and its min and
+max row hash. Buckets with different summaries are split on the next hex
+digits, until few enough rows remain to be compared row by row.
+
+The summary of all rows of a table is its fingerprint, which tells whether two
+tables differ with one row returned from each database.
+"""
+
+import ibis.expr.datatypes as dt
+import pandas
+
+from data_validation import consts
+
+HEX_DIGITS = "0123456789abcdef"
+# Number of hex digits of a row hash summed as a 24 bit integer. The sums fit
+# a signed 64 bit integer for up to 2**39 rows, while sums of 32 bit integers
+# would overflow above 2**31 rows.
+DIGEST_HEX_DIGITS = 6
+# Number of 24 bit slices of the trailing hex digits summed separately, so
+# that a summary holds 96 bits of the row hashes.
+DIGEST_SLICES = 4
+
+BUCKET_ALIAS = "merkle_bucket"
+COUNT_ALIAS = "merkle_count"
+DIGEST_ALIASES = [f"merkle_digest_{pos}" for pos in range(DIGEST_SLICES)]
+MIN_HASH_ALIAS = "merkle_min_hash"
+MAX_HASH_ALIAS = "merkle_max_hash"
+SUMMARY_ALIASES = [COUNT_ALIAS] + DIGEST_ALIASES + [MIN_HASH_ALIAS, MAX_HASH_ALIAS]
+
+
+def get_hash_column(query, primary_keys):
+    """Return the alias of the row hash of a row validation query.
+
+    Args:
+        query (ibis.Expr): The row validation query of one side.
+        primary_keys (List[str]): Aliases of the primary keys.
+    """
+    comparison_columns = [col for col in query.columns if col not in primary_keys]
+    schema = query.schema()
+    if len(comparison_columns) != 1 or not isinstance(
+        schema[comparison_columns[0]], dt.String
+    ):
+        raise ValueError(
+            "Merkle row comparison requires a single hash comparison field, "
+            "e.g. --hash '*'"
+        )
+    return comparison_columns[0]
+
+
+def _hex_digit_to_int(digit):
+    case = digit.case()
+    for value, hex_digit in enumerate(HEX_DIGITS):
+        case = case.when(hex_digit, value)
+    return case.else_(0).end().cast("int64")
+
+
+def _hex_to_int(row_hash, slice_pos=0):
+    """Return an expression for a slice of the trailing hex digits of a hash
+    as an int, the last DIGEST_HEX_DIGITS for slice 0, the ones before them
+    for slice 1 and so on."""
+    digits = row_hash.right(DIGEST_HEX_DIGITS * (slice_pos + 1)).substr(
+        0, DIGEST_HEX_DIGITS
+    )
+    return sum(
+        _hex_digit_to_int(digits.substr(pos, 1)) * (16 ** (DIGEST_HEX_DIGITS - 1 - pos))
+        for pos in range(DIGEST_HEX_DIGITS)
+    )
+
+
+def _filter_buckets(query, hash_column, prefix_length, buckets):
+    """Return the rows of query with row hashes starting with a bucket prefix."""
+    if buckets is None:
+        return query
+    if not buckets:
+        return query.limit(0)
+    row_hash = query[hash_column].lower()
+    return query.filter(row_hash.substr(0, prefix_length).isin(buckets))
+
+
+def get_bucket_query(query, hash_column, prefix_length, parent_buckets=None):
+    """Return a query summarizing the row hashes of each bucket.
+
+    Args:
+        query (ibis.Expr): The row validation query of one side.
+        hash_column (str): Alias of the row hash.
+        prefix_length (int): Number of leading hex digits identifying a bucket.
+        parent_buckets (List[str]): Buckets of the previous level to split, or
+            None to split all rows.
+    """
+    parent_length = prefix_length - consts.MERKLE_DIGITS_PER_LEVEL
+    query = _filter_buckets(query, hash_column, parent_length, parent_buckets)
+    row_hash = query[hash_column].lower()
+    hashes = query[
+        [
+            row_hash.substr(0, prefix_length).name(BUCKET_ALIAS),
+            row_hash.name(hash_column),
+        ]
+        + _get_digests(row_hash)
+    ]
+    return hashes.group_by(BUCKET_ALIAS).aggregate(_get_summaries(hashes, hash_column))
+
+
+def _get_digests(row_hash):
+    return [
+        _hex_to_int(row_hash, slice_pos).name(alias)
+        for slice_pos, alias in enumerate(DIGEST_ALIASES)
+    ]
+
+
+def _get_summaries(hashes, hash_column):
+    return (
+        [hashes.count().name(COUNT_ALIAS)]
+        + [hashes[alias].sum().name(alias) for alias in DIGEST_ALIASES]
+        + [
+            hashes[hash_column].min().name(MIN_HASH_ALIAS),
+            hashes[hash_column].max().name(MAX_HASH_ALIAS),
+        ]
+    )
+
+
+def get_fingerprint_query(query, hash_column):
+    """Return a query summarizing all row hashes of a table in one row.
+
+    The summary does not depend on the order of the rows, so equal tables
+    have equal fingerprints on any backend. Different fingerprints prove that
+    tables differ, while equal fingerprints of different tables are unlikely
+    but possible, as they only hold the row count, the min and max row hash
+    and the sums of 96 bits of the row hashes.
+
+    Args:
+        query (ibis.Expr): The row validation query of one side.
+        hash_column (str): Alias of the row hash.
+    """
+    row_hash = query[hash_column].lower()
+    hashes = query[[row_hash.name(hash_column)] + _get_digests(row_hash)]
+    return hashes.aggregate(_get_summaries(hashes, hash_column))
+
+
+def get_fingerprint(fingerprint_df):
+    """Return the fingerprint of a table from the result of its fingerprint
+    query as a string."""
+    summary = fingerprint_df.iloc[0]
+    values = [
+        0 if pandas.isna(summary[alias]) else int(summary[alias])
+        for alias in [COUNT_ALIAS] + DIGEST_ALIASES
+    ] + [summary[MIN_HASH_ALIAS], summary[MAX_HASH_ALIAS]]
+    return ":".join("" if pandas.isna(value) else str(value) for value in values)
+
+
+def get_leaf_query(query, hash_column, prefix_length, buckets):
+    """Return the rows of query in the supplied buckets.
+
+    Args:
+        query (ibis.Expr): The row validation query of one side.
+        hash_column (str): Alias of the row hash.
+        prefix_length (int): Number of leading hex digits identifying a bucket.
+        buckets (List[str]): Buckets whose rows are compared row by row.
+    """
+    return _filter_buckets(query, hash_column, prefix_length, buckets)
+
+
+def _normalize_summaries(bucket_df):
+    """Return bucket summaries indexed by bucket with comparable values."""
+    bucket_df = bucket_df.set_index(BUCKET_ALIAS)
+    for alias in [COUNT_ALIAS] + DIGEST_ALIASES:
+        bucket_df[alias] = bucket_df[alias].map(
+            lambda value: None if pandas.isna(value) else int(value)
+        )
+    return bucket_df[SUMMARY_ALIASES]
+
+
+def get_differing_buckets(source_df, target_df):
+    """Return the buckets whose summaries differ and their number of rows.
+
+    The number of rows of a bucket is the larger of its source and target
+    row counts.
+    """
+    source_df = _normalize_summaries(source_df)
+    target_df = _normalize_summaries(target_df)
+    source_df, target_df = source_df.align(target_df, join="outer")
+    differs = ~((source_df == target_df) | (source_df.isna() & target_df.isna())).all(
+        axis=1
+    )
+
+    buckets = sorted(source_df.index[differs])
+    counts = pandas.concat(
+        [source_df[COUNT_ALIAS].fillna(0), target_df[COUNT_ALIAS].fillna(0)], axis=1
+    ).max(axis=1)
+    return buckets, int(counts[differs].sum())
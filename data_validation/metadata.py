@@ -71,3 +71,7 @@ class RunMetadata(object):
         default_factory=lambda: datetime.datetime.now(datetime.timezone.utc)
     )
     end_time: typing.Optional[datetime.datetime] = None
+    spans: list = dataclasses.field(default_factory=list)
+    # Peak resident memory of the whole process, including other validations
+    # and runs which shared it, not of this run alone.
+    process_peak_memory_mb: typing.Optional[float] = None
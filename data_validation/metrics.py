@@ -0,0 +1,212 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Prometheus metrics of the validation service.
+
+Metrics are recorded with the prometheus_client package when it is
+installed, otherwise they are not recorded. Query latencies, rows and bytes
+are taken from the profiling spans of each finished validation, and the
+shared database clients are read from the client registry when scraped.
+"""
+
+from data_validation import clients, consts, profiling
+
+try:
+    import prometheus_client
+    from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+except ImportError:
+    prometheus_client = None
+
+# Validations run from seconds to hours, so buckets are wider than the
+# Prometheus defaults.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+
+UNKNOWN_BACKEND = "unknown"
+
+
+class _DisabledMetric(object):
+    """Metric which records nothing, used without prometheus_client."""
+
+    def labels(self, *args, **kwargs):
+        return self
+
+    def inc(self, amount=1):
+        pass
+
+    def dec(self, amount=1):
+        pass
+
+    def observe(self, value):
+        pass
+
+
+class _ClientRegistryCollector(object):
+    """Collect the shared clients of the client registry when scraped."""
+
+    def collect(self):
+        client_counts = GaugeMetricFamily(
+            "dvt_connection_clients",
+            "Shared database clients, either checked out by validations or idle.",
+            labels=["backend", "state"],
+        )
+        checkouts = GaugeMetricFamily(
+            "dvt_connection_client_checkouts",
+            "Check outs of shared database clients by running validations.",
+            labels=["backend"],
+        )
+        evictions = CounterMetricFamily(
+            "dvt_connection_client_evictions",
+            "Shared database clients closed when idle or unhealthy.",
+            labels=["backend", "reason"],
+        )
+        stats = clients.CLIENT_REGISTRY.get_stats()
+        for source_type, source_stats in sorted(
+            stats.items(), key=lambda item: str(item[0])
+        ):
+            backend = source_type or UNKNOWN_BACKEND
+            for state in ["checked_out", "idle"]:
+                client_counts.add_metric([backend, state], source_stats[state])
+            checkouts.add_metric([backend], source_stats["checkouts"])
+            for reason, count in sorted(source_stats["evictions"].items()):
+                evictions.add_metric([backend, reason], count)
+        yield client_counts
+        yield checkouts
+        yield evictions
+
+
+if prometheus_client is None:
+    REGISTRY = None
+    CONTENT_TYPE = "text/plain; charset=utf-8"
+else:
+    REGISTRY = prometheus_client.CollectorRegistry()
+    REGISTRY.register(_ClientRegistryCollector())
+    CONTENT_TYPE = prometheus_client.CONTENT_TYPE_LATEST
+
+
+def _get_metric(metric_type, name, documentation, label_names=(), **kwargs):
+    if prometheus_client is None:
+        return _DisabledMetric()
+    return getattr(prometheus_client, metric_type)(
+        name, documentation, label_names, registry=REGISTRY, **kwargs
+    )
+
+
+VALIDATIONS_IN_FLIGHT = _get_metric(
+    "Gauge", "dvt_validations_in_flight", "Validations currently running."
+)
+VALIDATIONS_QUEUED = _get_metric(
+    "Gauge",
+    "dvt_validations_queued",
+    "Validation requests waiting for a free validation slot.",
+)
+VALIDATIONS = _get_metric(
+    "Counter", "dvt_validations", "Finished validations.", ["status"]
+)
+VALIDATION_SECONDS = _get_metric(
+    "Histogram",
+    "dvt_validation_seconds",
+    "Duration of validations.",
+    buckets=LATENCY_BUCKETS,
+)
+QUERY_SECONDS = _get_metric(
+    "Histogram",
+    "dvt_query_seconds",
+    "Duration of the source and target queries of validations.",
+    ["backend", "side"],
+    buckets=LATENCY_BUCKETS,
+)
+ROWS_FETCHED = _get_metric(
+    "Counter", "dvt_rows_fetched", "Rows fetched by queries.", ["backend", "side"]
+)
+BYTES_FETCHED = _get_metric(
+    "Counter",
+    "dvt_bytes_fetched",
+    "Memory size of the query results fetched, without the memory of "
+    "strings unless METRICS_DEEP_BYTES is set.",
+    ["backend", "side"],
+)
+ROWS_COMPARED = _get_metric(
+    "Counter",
+    "dvt_rows_compared",
+    "Report rows of source and target results compared in memory. "
+    "The rate of this counter is the rows compared per second.",
+)
+COMBINE_SECONDS = _get_metric(
+    "Histogram",
+    "dvt_combine_seconds",
+    "Duration of comparing source and target results.",
+    buckets=LATENCY_BUCKETS,
+)
+RESULT_HANDLER_SECONDS = _get_metric(
+    "Histogram",
+    "dvt_result_handler_seconds",
+    "Duration of writing validation reports.",
+    buckets=LATENCY_BUCKETS,
+)
+
+
+def render():
+    """Return all metrics in the Prometheus text exposition format, or None
+    without prometheus_client."""
+    if prometheus_client is None:
+        return None
+    return prometheus_client.generate_latest(REGISTRY)
+
+
+def get_backend(config, side):
+    """Return the source type of the source or target connection of a config."""
+    conn_key = (
+        consts.CONFIG_SOURCE_CONN
+        if side == consts.RESULT_TYPE_SOURCE
+        else consts.CONFIG_TARGET_CONN
+    )
+    connection = (config or {}).get(conn_key) or {}
+    if not isinstance(connection, dict):
+        return UNKNOWN_BACKEND
+    return connection.get(consts.SOURCE_TYPE) or UNKNOWN_BACKEND
+
+
+def start_validation(config):
+    """Record a validation as running."""
+    VALIDATIONS_IN_FLIGHT.inc()
+
+
+def finish_validation(config, run_metadata=None, status="success"):
+    """Record a finished validation and the spans of its run.
+
+    Args:
+        config (Dict): The config the validation was built from.
+        run_metadata (RunMetadata): The run of the validation, if it was built.
+        status (str): Either "success" or "error".
+    """
+    VALIDATIONS_IN_FLIGHT.dec()
+    VALIDATIONS.labels(status=status).inc()
+    if run_metadata is None:
+        return
+
+    for run_span in run_metadata.spans:
+        attributes = run_span.attributes
+        if run_span.name == profiling.SPAN_FETCH:
+            side = attributes.get("side") or consts.RESULT_TYPE_SOURCE
+            labels = {"backend": get_backend(config, side), "side": side}
+            QUERY_SECONDS.labels(**labels).observe(run_span.seconds)
+            ROWS_FETCHED.labels(**labels).inc(attributes.get("rows") or 0)
+            BYTES_FETCHED.labels(**labels).inc(attributes.get("bytes") or 0)
+        elif run_span.name == profiling.SPAN_COMBINE:
+            COMBINE_SECONDS.observe(run_span.seconds)
+            ROWS_COMPARED.inc(attributes.get("rows") or 0)
+        elif run_span.name == profiling.SPAN_RESULT_HANDLER:
+            RESULT_HANDLER_SECONDS.observe(run_span.seconds)
+        elif run_span.name == profiling.SPAN_VALIDATION:
+            VALIDATION_SECONDS.observe(run_span.seconds)
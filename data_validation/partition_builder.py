@@ -12,13 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import datetime
+import decimal
 import os
 import logging
 import numpy
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Tuple, Union
+
+import ibis.expr.datatypes as dt
 from argparse import Namespace
 
-from data_validation import cli_tools, consts
+from data_validation import cli_tools, consts, key_hash
 from data_validation.config_manager import ConfigManager
 from data_validation.query_builder.partition_row_builder import PartitionRowBuilder
 from data_validation.validation_builder import ValidationBuilder
@@ -29,9 +35,11 @@ class PartitionBuilder:
         self.config_managers = config_managers
         self.table_count = len(config_managers)
         self.args = args
-        self.config_dir = self._get_arg_config_dir()
+        self.config_dir = getattr(args, "config_dir", None)
         self.primary_key = self._get_primary_key()
-        self.partition_key = self._get_arg_partition_key()
+        self.partition_type = self._get_arg_partition_type()
+        self.partition_keys = self._get_arg_partition_keys()
+        self.partition_key = self.partition_keys[0]
 
     def _get_arg_config_dir(self) -> str:
         """Return String yaml config folder path."""
@@ -47,15 +55,25 @@ class PartitionBuilder:
         primary_key = primary_keys[0]
         return primary_key
 
-    def _get_arg_partition_key(self) -> str:
-        """Return Partition Key. If not supplied, defaults to Primary Key"""
+    def _get_arg_partition_type(self) -> str:
+        """Return Partition Type. If not supplied, defaults to range"""
+        return getattr(self.args, "partition_type", None) or consts.PARTITION_TYPE_RANGE
+
+    def _get_arg_partition_keys(self) -> List[str]:
+        """Return Partition Keys. If not supplied, defaults to Primary Keys.
+
+        Range partitions use only the first key, hash-mod partitions use all
+        keys and quantile partitions use the leading key.
+        """
         if not self.args.partition_key:
             logging.warning(
                 "Partition key cannot be found. Will default to Primary key"
             )
-            return self.primary_key
+            if self.partition_type == consts.PARTITION_TYPE_HASH_MOD:
+                return cli_tools.get_arg_list(self.args.primary_keys)
+            return [self.primary_key]
 
-        return self.args.partition_key
+        return cli_tools.get_arg_list(self.args.partition_key)
 
     def _get_yaml_from_config(self, config_manager: ConfigManager) -> Dict:
         """Return dict objects formatted for yaml validations.
@@ -78,13 +96,74 @@ class PartitionBuilder:
         Returns:
             None
         """
-
-        # Default partition logic: Partition key
-        # Add necessary checks and routes when support for hashmod or partitionkeymod is added
-        partition_filters = self._get_partition_key_filters()
+        self.config_dir = self._get_arg_config_dir()
+        partition_filters = self.get_partition_filters()
         yaml_configs_list = self._add_partition_filters(partition_filters)
         self._store_partitions(yaml_configs_list)
 
+    def get_partition_filters(self) -> List[List[Union[str, Tuple[str, str]]]]:
+        """Return the partition filters of every Config/Table for the supplied
+        partition type."""
+        if self.partition_type == consts.PARTITION_TYPE_HASH_MOD:
+            return self._get_hash_mod_filters()
+        elif self.partition_type == consts.PARTITION_TYPE_QUANTILE:
+            return self._get_quantile_filters()
+        # Default partition logic: Partition key ranges
+        return self._get_partition_key_filters()
+
+    def get_partition_config_managers(self) -> List[List[ConfigManager]]:
+        """Return a ConfigManager per partition of every Config/Table.
+
+        Partitions are built in memory and share the source and target
+        clients of their table's ConfigManager.
+        """
+        partition_config_managers = []
+        for config_manager, filter_list in zip(
+            self.config_managers, self.get_partition_filters()
+        ):
+            table_config_managers = []
+            for partition_filter in filter_list:
+                config = copy.deepcopy(config_manager.config)
+                config.setdefault(consts.CONFIG_FILTERS, []).append(
+                    self._get_partition_filter_dict(partition_filter)
+                )
+                table_config_managers.append(
+                    ConfigManager(
+                        config,
+                        source_client=config_manager.source_client,
+                        target_client=config_manager.target_client,
+                        verbose=config_manager.verbose,
+                    )
+                )
+            partition_config_managers.append(table_config_managers)
+        return partition_config_managers
+
+    @staticmethod
+    def _get_partition_filter_dict(
+        partition_filter: Union[str, Tuple[str, str]]
+    ) -> Dict:
+        """Return the custom filter config for a partition filter."""
+        if isinstance(partition_filter, str):
+            source_filter = target_filter = partition_filter
+        else:
+            source_filter, target_filter = partition_filter
+        return {
+            "type": "custom",
+            "source": source_filter,
+            "target": target_filter,
+        }
+
+    def _map_tables(self, get_table_filters: Callable[[ConfigManager], List]) -> List:
+        """Return get_table_filters applied to every Config/Table, in order.
+
+        Up to `--parallelism` tables are probed concurrently.
+        """
+        parallelism = getattr(self.args, "parallelism", None) or 1
+        if parallelism == 1 or self.table_count <= 1:
+            return [get_table_filters(cm) for cm in self.config_managers]
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            return list(executor.map(get_table_filters, self.config_managers))
+
     def _get_partition_key_filters(self) -> List[List[str]]:
         """Generate Partition filters for primary_key type partition for all
         Configs/Tables.
@@ -92,126 +171,320 @@ class PartitionBuilder:
         Returns:
             A list of lists of partition filters for each table
         """
+        return self._map_tables(self._get_table_partition_key_filters)
+
+    def _get_table_partition_key_filters(
+        self, config_manager: ConfigManager
+    ) -> List[str]:
+        """Generate Partition filters for primary_key type partition for a
+        single Config/Table."""
+        (
+            source_partition_row_builder,
+            target_partition_row_builder,
+        ) = self._get_partition_row_builders(config_manager, self.partition_key)
+        source_stats, target_stats = self._get_partition_stats(
+            source_partition_row_builder, target_partition_row_builder
+        )
+        partition_count = self._get_partition_count(source_stats, target_stats)
+
+        # Source and Target Primary key Min
+        source_min = source_stats["min"]
+        target_min = target_stats["min"]
+
+        # If Primary key is non numeric, raise Type Error
+        accepted_data_types = [int, numpy.int32, numpy.int64]
+        if not (
+            type(source_min) in accepted_data_types
+            and type(target_min) in accepted_data_types
+        ):
+            raise TypeError(
+                f"Supplied Partition key is not of type Numeric: "
+                f"{self.partition_key}"
+            )
 
-        master_filter_list = []
+        if source_min != target_min:
+            logging.warning(
+                "min(partition_key) for Source and Target tables do not"
+                "match, proceeding with min(source_min, target_min)"
+            )
+        lower_bound = min(source_min, target_min)
 
-        for config_manager in self.config_managers:
-            validation_builder = ValidationBuilder(config_manager)
+        # Source and Target Primary key Max
+        source_max = source_stats["max"]
+        target_max = target_stats["max"]
 
-            source_partition_row_builder = PartitionRowBuilder(
-                self.partition_key,
-                config_manager.source_client,
-                config_manager.source_schema,
-                config_manager.source_table,
-                validation_builder.source_builder,
+        if source_max != target_max:
+            logging.warning(
+                "max(partition_key) for Source and Target tables do not"
+                "match, proceeding with max(source_max, target_max)"
             )
 
-            target_partition_row_builder = PartitionRowBuilder(
-                self.partition_key,
-                config_manager.target_client,
-                config_manager.target_schema,
-                config_manager.target_table,
-                validation_builder.target_builder,
+        upper_bound = max(source_max, target_max)
+
+        filter_list = []  # Store partition filters per config/table
+        i = 0
+        marker = lower_bound
+        partition_step = (upper_bound - lower_bound) // partition_count
+        while i < partition_count:
+            lower_val = marker
+            upper_val = marker + partition_step
+
+            if i == partition_count - 1:
+                upper_val = upper_bound + 1
+
+            partition_filter = (
+                f"{self.partition_key} >= {lower_val} "
+                f"and {self.partition_key} < {upper_val}"
             )
+            filter_list.append(partition_filter)
 
-            # Get Source and Target row Count
-            source_count_query = source_partition_row_builder.get_count_query()
-            source_count = source_count_query.execute()
+            i += 1
+            marker += partition_step
 
-            target_count_query = target_partition_row_builder.get_count_query()
-            target_count = target_count_query.execute()
+        return filter_list
 
-            if source_count != target_count:
-                logging.warning(
-                    "Source and Target table row counts do not match,"
-                    "proceeding with max(source_count, target_count)"
-                )
-            row_count = max(source_count, target_count)
-
-            # If supplied partition_num is greater than count(*) coalesce it
-            if self.args.partition_num > row_count:
-                partition_count = row_count
-                logging.warning(
-                    "Supplied partition num is greater than row count, "
-                    "truncating it to row count"
-                )
-            else:
-                partition_count = self.args.partition_num
-
-            # Get Source and Target Primary key Min
-            source_min_query = source_partition_row_builder.get_min_query()
-            source_min = source_min_query.execute()
-
-            target_min_query = target_partition_row_builder.get_min_query()
-            target_min = target_min_query.execute()
-
-            # If Primary key is non numeric, raise Type Error
-            accepted_data_types = [int, numpy.int32, numpy.int64]
-            if not (
-                type(source_min) in accepted_data_types
-                and type(target_min) in accepted_data_types
-            ):
-                raise TypeError(
-                    f"Supplied Partition key is not of type Numeric: "
-                    f"{self.partition_key}"
-                )
+    def _get_partition_row_builders(
+        self, config_manager: ConfigManager, partition_key: str
+    ) -> Tuple[PartitionRowBuilder, PartitionRowBuilder]:
+        """Return source and target PartitionRowBuilders for a table."""
+        validation_builder = ValidationBuilder(config_manager)
 
-            if source_min != target_min:
-                logging.warning(
-                    "min(partition_key) for Source and Target tables do not"
-                    "match, proceeding with min(source_min, target_min)"
-                )
-            lower_bound = min(source_min, target_min)
+        source_partition_row_builder = PartitionRowBuilder(
+            partition_key,
+            config_manager.source_client,
+            config_manager.source_schema,
+            config_manager.source_table,
+            validation_builder.source_builder,
+        )
 
-            # Get Source and Target Primary key Max
-            source_max_query = source_partition_row_builder.get_max_query()
-            source_max = source_max_query.execute()
+        target_partition_row_builder = PartitionRowBuilder(
+            partition_key,
+            config_manager.target_client,
+            config_manager.target_schema,
+            config_manager.target_table,
+            validation_builder.target_builder,
+        )
+        return source_partition_row_builder, target_partition_row_builder
 
-            target_max_query = target_partition_row_builder.get_max_query()
-            target_max = target_max_query.execute()
+    def _get_partition_stats(
+        self,
+        source_partition_row_builder: PartitionRowBuilder,
+        target_partition_row_builder: PartitionRowBuilder,
+    ) -> Tuple[Dict, Dict]:
+        """Return the count, min and max of the partition key for source and
+        target. Each side is a single aggregate query and both run concurrently.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            source_stats = executor.submit(
+                self._execute_stats_query, source_partition_row_builder
+            )
+            target_stats = executor.submit(
+                self._execute_stats_query, target_partition_row_builder
+            )
+            return source_stats.result(), target_stats.result()
 
-            if source_min != target_min:
-                logging.warning(
-                    "max(partition_key) for Source and Target tables do not"
-                    "match, proceeding with max(source_max, target_max)"
-                )
+    @staticmethod
+    def _execute_stats_query(partition_row_builder: PartitionRowBuilder) -> Dict:
+        """Return the partition key stats of one side as a dict."""
+        return partition_row_builder.get_stats_query().execute().iloc[0].to_dict()
+
+    def _get_partition_count(self, source_stats: Dict, target_stats: Dict) -> int:
+        """Return the number of partitions to generate for a table."""
+        source_count = source_stats["count"]
+        target_count = target_stats["count"]
 
-            upper_bound = max(source_max, target_max)
+        if source_count != target_count:
+            logging.warning(
+                "Source and Target table row counts do not match,"
+                "proceeding with max(source_count, target_count)"
+            )
+        row_count = max(source_count, target_count)
 
-            filter_list = []  # Store partition filters per config/table
-            i = 0
-            marker = lower_bound
-            partition_step = (upper_bound - lower_bound) // partition_count
-            while i < partition_count:
-                lower_val = marker
-                upper_val = marker + partition_step
+        # If supplied partition_num is greater than count(*) coalesce it
+        if self.args.partition_num > row_count:
+            partition_count = row_count
+            logging.warning(
+                "Supplied partition num is greater than row count, "
+                "truncating it to row count"
+            )
+        else:
+            partition_count = self.args.partition_num
 
-                if i == partition_count - 1:
-                    upper_val = upper_bound + 1
+        return max(partition_count, 1)
 
-                partition_filter = (
-                    f"{self.partition_key} >= {lower_val} "
-                    f"and {self.partition_key} < {upper_val}"
-                )
-                filter_list.append(partition_filter)
+    def _get_hash_mod_filters(self) -> List[List[Tuple[str, str]]]:
+        """Generate Partition filters assigning rows by the remainder of the
+        hash of their partition keys divided by the partition count.
+
+        Unlike ranges, this balances sparse or skewed keys and supports
+        composite and string keys.
+
+        Returns:
+            A list of lists of (source, target) partition filters for each table
+        """
+        return self._map_tables(self._get_table_hash_mod_filters)
+
+    def _get_table_hash_mod_filters(
+        self, config_manager: ConfigManager
+    ) -> List[Tuple[str, str]]:
+        """Generate hash-mod Partition filters for a single Config/Table.
+
+        Keys are hashed with the MD5 function of each backend, which assigns
+        a row to the same partition on both sides. Backends without one fall
+        back to the sum of the remainders of integer keys.
+        """
+        source_type = config_manager.get_source_connection().get(consts.SOURCE_TYPE)
+        target_type = config_manager.get_target_connection().get(consts.SOURCE_TYPE)
+        use_key_hash = key_hash.supports_key_hash(
+            source_type
+        ) and key_hash.supports_key_hash(target_type)
+        key_types = (dt.Integer, dt.String) if use_key_hash else (dt.Integer,)
+
+        (
+            source_partition_row_builder,
+            target_partition_row_builder,
+        ) = self._get_partition_row_builders(config_manager, self.partition_key)
+        for partition_row_builder in (
+            source_partition_row_builder,
+            target_partition_row_builder,
+        ):
+            schema = partition_row_builder.query.schema()
+            for partition_key in self.partition_keys:
+                if not isinstance(schema[partition_key], key_types):
+                    raise TypeError(
+                        f"Supplied Partition key is not of type "
+                        f"{'Integer or String' if use_key_hash else 'Integer'}: "
+                        f"{partition_key}"
+                    )
+
+        partition_count = self._get_partition_count(
+            *self._get_partition_stats(
+                source_partition_row_builder, target_partition_row_builder
+            )
+        )
 
-                i += 1
-                marker += partition_step
+        return [
+            (
+                self._get_hash_mod_filter(
+                    source_type, partition_count, i, use_key_hash=use_key_hash
+                ),
+                self._get_hash_mod_filter(
+                    target_type, partition_count, i, use_key_hash=use_key_hash
+                ),
+            )
+            for i in range(partition_count)
+        ]
 
-            master_filter_list.append(filter_list)
+    def _get_hash_mod_filter(
+        self,
+        source_type: str,
+        partition_count: int,
+        remainder: int,
+        use_key_hash: bool = True,
+    ) -> str:
+        """Return the SQL filter selecting one hash-mod partition."""
+
+        def mod(expr):
+            if source_type == "MSSQL":
+                return f"({expr} % {partition_count})"
+            if source_type == "Teradata":
+                return f"({expr} MOD {partition_count})"
+            return f"MOD({expr}, {partition_count})"
+
+        if use_key_hash:
+            hashed = mod(key_hash.get_key_hash_sql(source_type, self.partition_keys))
+        else:
+            terms = [mod(f"ABS({key})") for key in self.partition_keys]
+            hashed = terms[0] if len(terms) == 1 else mod(" + ".join(terms))
+        partition_filter = f"{hashed} = {remainder}"
+        if remainder == 0:
+            # Rows with NULL keys have no remainder, keep them in the first
+            # partition so that every row is validated.
+            nulls = " or ".join(f"{key} IS NULL" for key in self.partition_keys)
+            partition_filter = f"({partition_filter} or {nulls})"
+        return partition_filter
+
+    def _get_quantile_filters(self) -> List[List[str]]:
+        """Generate Partition filters of equal population ranges of the
+        partition key, using its percentile ranks in a sample of the source
+        table.
+
+        Unlike equal width ranges, partitions have similar row counts for
+        skewed keys, and any orderable key type is supported. Bounds are taken
+        from the source only: as the first and last ranges are open ended,
+        every target row is still validated, but partitions are only balanced
+        when the target keys are distributed like the source keys.
 
-        return master_filter_list
+        Returns:
+            A list of lists of partition filters for each table
+        """
+        return self._map_tables(self._get_table_quantile_filters)
+
+    def _get_table_quantile_filters(self, config_manager: ConfigManager) -> List[str]:
+        """Generate quantile Partition filters for a single Config/Table."""
+        (
+            source_partition_row_builder,
+            target_partition_row_builder,
+        ) = self._get_partition_row_builders(config_manager, self.partition_key)
+        source_stats, target_stats = self._get_partition_stats(
+            source_partition_row_builder, target_partition_row_builder
+        )
+        partition_count = self._get_partition_count(source_stats, target_stats)
+
+        quantile_df = source_partition_row_builder.get_quantile_query(
+            partition_count, row_count=source_stats["count"]
+        ).execute()
+        # The key with a percent rank of 1 falls in an extra last bucket.
+        quantile_df = quantile_df[
+            (quantile_df["bucket"] > 0)
+            & (quantile_df["bucket"] < partition_count)
+            & quantile_df["lower_bound"].notnull()
+        ]
+        bounds = sorted(set(quantile_df["lower_bound"]))
+        return self._get_bounded_filters(bounds)
+
+    def _get_bounded_filters(self, bounds: List) -> List[str]:
+        """Return filters for the ranges split at the sorted bounds.
+
+        The first and last ranges are open ended so that rows outside of the
+        source key range, and NULL keys, are still validated.
+        """
+        key = self.partition_key
+        if not bounds:
+            return ["1=1"]
+
+        literals = [self._sql_literal(bound) for bound in bounds]
+        filter_list = [f"({key} < {literals[0]} or {key} IS NULL)"]
+        for lower_val, upper_val in zip(literals, literals[1:]):
+            filter_list.append(f"{key} >= {lower_val} and {key} < {upper_val}")
+        filter_list.append(f"{key} >= {literals[-1]}")
+        return filter_list
+
+    @staticmethod
+    def _sql_literal(value) -> str:
+        """Return a SQL literal for a partition key value."""
+        if isinstance(value, (bool, numpy.bool_)):
+            return str(value).upper()
+        if isinstance(value, (int, float, decimal.Decimal, numpy.number)):
+            return str(value)
+        if isinstance(value, datetime.datetime):
+            value = value.isoformat(sep=" ")
+        elif isinstance(value, datetime.date):
+            value = value.isoformat()
+        value = str(value).replace("'", "''")
+        return f"'{value}'"
 
     def _add_partition_filters(
         self,
-        partition_filters: List[List[str]],
+        partition_filters: List[List[Union[str, Tuple[str, str]]]],
     ) -> List[Dict]:
         """Add Partition Filters to ConfigManager and return a list of dict
         ConfigManager objects.
 
         Args:
-            partition_filters (List[List[str]]): List of List of Partition filters
-            for all Table/ConfigManager objects
+            partition_filters (List[List[Union[str, Tuple[str, str]]]]): List of
+            List of Partition filters for all Table/ConfigManager objects. A
+            filter is either shared SQL or a (source, target) pair of SQL.
 
         Returns:
             yaml_configs_list (List[Dict]): List of YAML configs for all tables
@@ -228,11 +501,7 @@ class PartitionBuilder:
                 "partitions": [],
             }
             for pos in range(len(filter_list)):
-                filter_dict = {
-                    "type": "custom",
-                    "source": filter_list[pos],
-                    "target": filter_list[pos],
-                }
+                filter_dict = self._get_partition_filter_dict(filter_list[pos])
                 # Append partition new filter
                 config_manager.filters.append(filter_dict)
 
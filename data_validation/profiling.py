@@ -0,0 +1,175 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Spans timing the stages of a validation run.
+
+Spans are stored in the RunMetadata of a run and summarized per stage with
+--profile, which passes the summary to the Result Handler to be written next
+to the report. When the opentelemetry package is installed, each span is also
+emitted as an OpenTelemetry span of the current tracer provider.
+"""
+
+import contextlib
+import dataclasses
+import datetime
+import sys
+import time
+
+import pandas
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None
+
+TRACER_NAME = "data_validation"
+
+SPAN_COMPILE = "compile"
+SPAN_FETCH = "fetch"
+SPAN_COMBINE = "combine"
+SPAN_RESULT_HANDLER = "result_handler"
+SPAN_VALIDATION = "validation"
+
+PROFILE_COLUMNS = [
+    "run_id",
+    "stage",
+    "side",
+    "calls",
+    "seconds",
+    "rows",
+    "bytes",
+    "process_peak_memory_mb",
+]
+
+
+@dataclasses.dataclass
+class Span(object):
+    name: str
+    start_time: datetime.datetime
+    seconds: float = 0.0
+    attributes: dict = dataclasses.field(default_factory=dict)
+
+
+@contextlib.contextmanager
+def span(run_metadata, name, **attributes):
+    """Record the wall time of a stage of a run as a Span.
+
+    The yielded Span's attributes, such as the rows fetched, can be set
+    until the stage ends.
+
+    Args:
+        run_metadata (RunMetadata): The run the stage is part of.
+        name (str): The stage, e.g. SPAN_FETCH.
+        attributes: Attributes of the stage, e.g. side="source".
+    """
+    run_span = Span(
+        name=name,
+        start_time=datetime.datetime.now(datetime.timezone.utc),
+        attributes=dict(attributes),
+    )
+    start = time.perf_counter()
+    otel_span = (
+        trace.get_tracer(TRACER_NAME).start_as_current_span(
+            name, attributes={"run_id": run_metadata.run_id, **attributes}
+        )
+        if trace is not None
+        else contextlib.nullcontext()
+    )
+    with otel_span as current_otel_span:
+        try:
+            yield run_span
+        finally:
+            run_span.seconds = time.perf_counter() - start
+            if current_otel_span is not None:
+                current_otel_span.set_attributes(
+                    {
+                        key: value
+                        for key, value in run_span.attributes.items()
+                        if value is not None
+                    }
+                )
+            # list.append is atomic, so stages of concurrent threads can be
+            # recorded without a lock.
+            run_metadata.spans.append(run_span)
+
+
+def get_frame_bytes(df, deep=True):
+    """Return the memory used by a DataFrame.
+
+    Args:
+        df (DataFrame): The DataFrame to measure.
+        deep (bool): Whether to include the memory of strings and other
+            objects, which visits every value, or only their pointers.
+    """
+    return int(df.memory_usage(index=False, deep=deep).sum())
+
+
+def get_peak_memory_mb():
+    """Return the peak resident memory of this process in MB, or None where
+    it is not available."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == "darwin":
+        return peak_memory / 1024 / 1024
+    return peak_memory / 1024
+
+
+def get_profile_df(run_metadata):
+    """Return the total time, rows and bytes of each stage of a run.
+
+    The peak memory is that of the whole process, which may have run other
+    validations, and is repeated on each stage.
+    """
+    records = [
+        {
+            "run_id": run_metadata.run_id,
+            "stage": run_span.name,
+            "side": run_span.attributes.get("side"),
+            "seconds": run_span.seconds,
+            "rows": run_span.attributes.get("rows"),
+            "bytes": run_span.attributes.get("bytes"),
+        }
+        for run_span in run_metadata.spans
+    ]
+    if not records:
+        return pandas.DataFrame(columns=PROFILE_COLUMNS)
+    spans_df = pandas.DataFrame(records).fillna({"side": ""})
+    profile_df = (
+        spans_df.groupby(["run_id", "stage", "side"], sort=False)
+        .agg(
+            calls=("seconds", "size"),
+            seconds=("seconds", "sum"),
+            rows=("rows", lambda rows: rows.sum(min_count=1)),
+            bytes=("bytes", lambda sizes: sizes.sum(min_count=1)),
+        )
+        .reset_index()
+    )
+    profile_df["process_peak_memory_mb"] = run_metadata.process_peak_memory_mb
+    return profile_df[PROFILE_COLUMNS]
+
+
+def format_profile(profile_df):
+    """Return a summary of the stages of a run to print with --profile."""
+    run_ids = profile_df["run_id"].unique()
+    summary = profile_df.drop(columns=["run_id", "process_peak_memory_mb"]).to_string(
+        index=False, na_rep=""
+    )
+    peak_memory = profile_df["process_peak_memory_mb"].max()
+    if pandas.notna(peak_memory):
+        summary += f"\nPeak memory of the process (all runs): {peak_memory:,.1f} MB"
+    return f"Profile of run {', '.join(run_ids)}:\n{summary}"
@@ -15,6 +15,14 @@
 import ibis
 from data_validation import clients
 from data_validation.query_builder.query_builder import QueryBuilder
+from data_validation.query_builder.random_row_builder import (
+    TABLE_SAMPLE_CLAUSES,
+    get_table_sample_query,
+)
+
+# Rows sampled per partition to find quantile bounds, which puts about 3% of
+# the rows of a partition on either side of its bounds.
+QUANTILE_SAMPLE_ROWS_PER_PARTITION = 1000
 
 
 class PartitionRowBuilder(object):
@@ -36,6 +44,10 @@ class PartitionRowBuilder(object):
             query_builder (QueryBuilder): QueryBuilder object.
         """
         self.partition_key = partition_key
+        self.data_client = data_client
+        self.schema_name = schema_name
+        self.table_name = table_name
+        self.query_builder = query_builder
         self.query = self._compile_query(
             data_client, schema_name, table_name, query_builder
         )
@@ -71,3 +83,56 @@ class PartitionRowBuilder(object):
     def get_count_query(self) -> ibis.Expr:
         """Return an Ibis query object to get count of Primary Key column"""
         return self.query[self.partition_key].count()
+
+    def get_stats_query(self) -> ibis.Expr:
+        """Return an Ibis query object to get count, min and max of Primary Key
+        column in a single aggregate query"""
+        partition_key = self.query[self.partition_key]
+        return self.query.aggregate(
+            [
+                partition_key.count().name("count"),
+                partition_key.min().name("min"),
+                partition_key.max().name("max"),
+            ]
+        )
+
+    def get_quantile_query(
+        self, partition_count: int, row_count: int = None
+    ) -> ibis.Expr:
+        """Return an Ibis query object to get the lowest Primary Key value of
+        each of partition_count equal population buckets.
+
+        Buckets are ranked in an engine native sample of the table, so that
+        only QUANTILE_SAMPLE_ROWS_PER_PARTITION rows per bucket are sorted.
+        Backends without table samples rank every row.
+
+        Args:
+            partition_count (int): Number of buckets to split the rows into.
+            row_count (int): Number of rows of the filtered table, which the
+                sample is sized by. The table is not sampled without it.
+        """
+        query = self.query
+        sample_rows = partition_count * QUANTILE_SAMPLE_ROWS_PER_PARTITION
+        source_type = getattr(self.data_client, "_source_type", None)
+        if (
+            row_count
+            and row_count > sample_rows
+            and source_type in TABLE_SAMPLE_CLAUSES
+        ):
+            sample = self.data_client.sql(
+                get_table_sample_query(
+                    self.data_client,
+                    self.schema_name,
+                    self.table_name,
+                    sample_rows / row_count,
+                )
+            )
+            compiled_filters = self.query_builder.compile_filter_fields(sample)
+            query = sample.filter(compiled_filters) if compiled_filters else sample
+
+        partition_key = query[self.partition_key]
+        bucket = (partition_key.percent_rank() * partition_count).floor()
+        buckets = query[partition_key.name("key"), bucket.name("bucket")]
+        return buckets.group_by("bucket").aggregate(
+            buckets["key"].min().name("lower_bound")
+        )
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import logging
+import operator
 import ibis
 from data_validation import consts
 from ibis.expr.types import StringScalar
@@ -155,11 +157,54 @@ class FilterField(object):
         )
 
     @staticmethod
-    def isin(field_name, values):
-        # Build Left and Right Objects
-        return FilterField(
-            ibis.expr.types.ColumnExpr.isin, left_field=field_name, right=values
-        )
+    def isin(field_name, values, batch_size=None):
+        """Returns a FilterField instance for field_name IN values.
+
+        Args:
+            field_name (Str): The column to filter on.
+            values (List): The values to filter for.
+            batch_size (int): Optional max number of values of one IN-list.
+                Longer lists are split into IN-lists combined with OR, as
+                databases like Oracle limit the length of an IN-list.
+        """
+        if not batch_size or len(values) <= batch_size:
+            return FilterField(
+                ibis.expr.types.ColumnExpr.isin, left_field=field_name, right=values
+            )
+
+        def isin_batches(column, values):
+            return functools.reduce(
+                operator.or_,
+                [
+                    column.isin(values[index : index + batch_size])
+                    for index in range(0, len(values), batch_size)
+                ],
+            )
+
+        return FilterField(isin_batches, left_field=field_name, right=list(values))
+
+    @staticmethod
+    def in_range(field_name, lower, upper):
+        """Returns a FilterField instance for lower < field_name <= upper.
+
+        Args:
+            field_name (Str): The column to filter on.
+            lower (Object): Exclusive lower bound, or None for no lower bound.
+            upper (Object): Inclusive upper bound, or None for no upper bound.
+        """
+
+        def between(column, bounds):
+            lower, upper = bounds
+            conditions = []
+            if lower is not None:
+                conditions.append(column > lower)
+            if upper is not None:
+                conditions.append(column <= upper)
+            if not conditions:
+                return ibis.literal(True)
+            return functools.reduce(operator.and_, conditions)
+
+        return FilterField(between, left_field=field_name, right=(lower, upper))
 
     @staticmethod
     def custom(expr):
@@ -428,6 +473,26 @@ class QueryBuilder(object):
         self.grouped_fields = grouped_fields
         self.comparison_fields = comparison_fields
         self.limit = limit
+        # Base queries by validation type, shared with copies of this builder
+        self._base_queries = {}
+
+    def copy(self):
+        """Return a copy which can be given new filters and groups without
+        changing this builder.
+
+        The copy shares the fields of this builder, which are not changed
+        once added, and the base queries compiled by either builder.
+        """
+        builder = QueryBuilder(
+            list(self.aggregate_fields),
+            calculated_fields=list(self.calculated_fields),
+            filters=list(self.filters),
+            grouped_fields=list(self.grouped_fields),
+            comparison_fields=list(self.comparison_fields),
+            limit=self.limit,
+        )
+        builder._base_queries = self._base_queries
+        return builder
 
     @staticmethod
     def build_count_validator(limit=None):
@@ -475,30 +540,65 @@ class QueryBuilder(object):
         # else:
         #     return [field.compile(table) for field in self.calculated_fields]
 
-    def compile(self, validation_type, table):
-        """Return an Ibis query object
+    def _get_base_fields(self):
+        return tuple(self.calculated_fields) + tuple(self.comparison_fields)
+
+    def compile_base(self, validation_type, table):
+        """Return the query of the calculated and comparison fields of a table,
+        which filters, groups and aggregates are added on top of.
+
+        The base query is only built once per table and set of fields, and
+        is reused by copies of this builder, e.g. for recursive validations.
 
         Args:
             table (IbisTable): The Ibis Table expression.
         """
+        base_fields = self._get_base_fields()
+        cached = self._base_queries.get(validation_type)
+        if cached is not None:
+            cached_table, cached_fields, base_query = cached
+            if (
+                cached_table is table
+                and len(cached_fields) == len(base_fields)
+                and all(a is b for a, b in zip(cached_fields, base_fields))
+            ):
+                return base_query
 
         # Build Query Expressions
+        base_query = table
         if self.calculated_fields:
             depth_limit = max(
                 field.config.get(consts.CONFIG_DEPTH, 0)
                 for field in self.calculated_fields
             )
             for n in range(0, (depth_limit + 1)):
-                table = table.mutate(self.compile_calculated_fields(table, n))
+                base_query = base_query.mutate(
+                    self.compile_calculated_fields(base_query, n)
+                )
 
         if (
             validation_type == consts.ROW_VALIDATION
             or validation_type == consts.CUSTOM_QUERY
         ):
-            table = table.projection(self.compile_comparison_fields(table))
+            base_query = base_query.projection(
+                self.compile_comparison_fields(base_query)
+            )
         else:
             if self.comparison_fields:
-                table = table.mutate(self.compile_comparison_fields(table))
+                base_query = base_query.mutate(
+                    self.compile_comparison_fields(base_query)
+                )
+
+        self._base_queries[validation_type] = (table, base_fields, base_query)
+        return base_query
+
+    def compile(self, validation_type, table):
+        """Return an Ibis query object
+
+        Args:
+            table (IbisTable): The Ibis Table expression.
+        """
+        table = self.compile_base(validation_type, table)
         compiled_filters = self.compile_filter_fields(table)
         filtered_table = table.filter(compiled_filters) if compiled_filters else table
         compiled_groups = self.compile_group_fields(filtered_table)
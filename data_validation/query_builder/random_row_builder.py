@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 import random
 import logging
+import statistics
 from typing import List
 from io import StringIO
 import sqlalchemy as sa
 import ibis
+import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.types as tz
 import ibis.expr.rules as rlz
@@ -30,7 +33,7 @@ from ibis.backends.impala.client import ImpalaClient
 from ibis.backends.pandas.client import PandasClient
 from ibis.backends.postgres.client import PostgreSQLClient
 from ibis.expr.signature import Argument as Arg
-from data_validation import clients
+from data_validation import clients, consts
 from data_validation.query_builder.query_builder import QueryBuilder
 
 
@@ -47,13 +50,86 @@ from data_validation.query_builder.query_builder import QueryBuilder
 RANDOM_SORT_SUPPORTS = {
     PandasClient: "NA",
     BigQueryClient: "RAND()",
-    clients.TeradataClient: None,
     ImpalaClient: "RAND()",
-    clients.OracleClient: "DBMS_RANDOM.VALUE",
     PostgreSQLClient: "RANDOM()",
-    clients.MSSQLClient: "NEWID()",
 }
 
+# Clients of backends imported on first use, keyed by source type
+LAZY_RANDOM_SORT_SUPPORTS = {
+    "Teradata": None,
+    "Oracle": "DBMS_RANDOM.VALUE",
+    "MSSQL": "NEWID()",
+}
+
+
+# Engine native samples of a table, keyed by source type. Teradata does not
+# need one as its limits compile to SAMPLE, which is random by nature.
+TABLE_SAMPLE_CLAUSES = {
+    "BigQuery": "TABLESAMPLE SYSTEM ({percent} PERCENT)",
+    "Postgres": "TABLESAMPLE BERNOULLI ({percent})",
+    "MSSQL": "TABLESAMPLE ({percent} PERCENT)",
+    "Oracle": "SAMPLE ({percent})",
+    "Snowflake": "TABLESAMPLE BERNOULLI ({percent})",
+}
+
+# BigQuery and SQL Server only sample blocks of rows, whose rows are sorted
+# randomly before the sample is cut to size.
+BLOCK_SAMPLE_SOURCE_TYPES = {"BigQuery", "MSSQL"}
+
+# Samples vary in size, so more rows than needed are sampled
+SAMPLE_OVERSAMPLING = 2
+
+# Modulus of the salted hash of integer primary keys, the Mersenne prime
+# 2**31 - 1, so that products of hashes and salts fit in 64 bit integers.
+KEY_HASH_MODULUS = 2147483647
+
+
+def get_sample_size(confidence, error, population):
+    """Return the number of rows to sample so that a proportion of the rows,
+    such as the rows which fail validation, is estimated within the margin
+    of error at the confidence level.
+
+    Args:
+        confidence (float): The confidence level, e.g. 0.95.
+        error (float): The margin of error, e.g. 0.01.
+        population (int): The number of rows of the table.
+    """
+    z_score = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+    # Cochran's sample size for the worst case proportion of 0.5
+    sample_size = z_score**2 * 0.25 / error**2
+    if population:
+        sample_size = sample_size / (1 + (sample_size - 1) / population)
+    return int(math.ceil(sample_size))
+
+
+def get_table_ref(data_client, schema_name, table_name):
+    """Return the name of a table quoted as the dialect of the client quotes
+    identifiers, i.e. only where the dialect requires quotes, like the table
+    names of the queries Ibis compiles."""
+    if getattr(data_client, "_source_type", None) == "BigQuery":
+        table_ref = f"{schema_name}.{table_name}" if schema_name else table_name
+        return f"`{table_ref}`"
+    preparer = data_client.con.dialect.identifier_preparer
+    return ".".join(preparer.quote(name) for name in [schema_name, table_name] if name)
+
+
+def get_table_sample_query(data_client, schema_name, table_name, fraction):
+    """Return the SQL of an engine native sample of a fraction of a table."""
+    percent = "{:.6g}".format(100 * fraction)
+    table_ref = get_table_ref(data_client, schema_name, table_name)
+    sample = TABLE_SAMPLE_CLAUSES[data_client._source_type].format(percent=percent)
+    return f"SELECT * FROM {table_ref} {sample}"
+
+
+def get_random_sort_supports():
+    """Return the random sort of every client class imported so far."""
+    random_sort_supports = dict(RANDOM_SORT_SUPPORTS)
+    for source_type, random_sort in LAZY_RANDOM_SORT_SUPPORTS.items():
+        client_class = clients.get_client_class(source_type)
+        if client_class is not None:
+            random_sort_supports[client_class] = random_sort
+    return random_sort_supports
+
 
 class RandomSortExpr(tz.AnyValue, tz.SortExpr):
     _dtype = rlz.string
@@ -81,15 +157,26 @@ class RandomSortKey(ops.SortKey):
 
 
 class RandomRowBuilder(object):
-    def __init__(self, primary_keys: List[str], batch_size: int):
+    def __init__(
+        self,
+        primary_keys: List[str],
+        batch_size: int,
+        confidence: float = None,
+        error: float = None,
+    ):
         """Build a RandomRowBuilder object which is ready to build a random row filter query.
 
         Args:
             primary_keys: A list of primary key field strings used to find random rows.
             batch_size: A max size for the number of random row values to find.
+            confidence: Optional confidence level the sample size is derived
+                from, in place of the batch size.
+            error: The margin of error of a sample sized by confidence level.
         """
         self.primary_keys = primary_keys
         self.batch_size = batch_size
+        self.confidence = confidence
+        self.error = error or consts.DEFAULT_RANDOM_ROW_ERROR
 
     def compile(
         self,
@@ -97,6 +184,7 @@ class RandomRowBuilder(object):
         schema_name: str,
         table_name: str,
         query_builder: QueryBuilder,
+        row_count: int = None,
     ) -> ibis.Expr:
         """Return an Ibis query object
 
@@ -104,26 +192,123 @@ class RandomRowBuilder(object):
             data_client (IbisClient): The client used to query random rows.
             schema_name (String): The name of the schema for the given table.
             table_name (String): The name of the table to query.
+            row_count (int): Optional number of rows of the filtered table,
+                which a sample sized by confidence level counts otherwise.
         """
         table = clients.get_ibis_table(data_client, schema_name, table_name)
-        compiled_filters = query_builder.compile_filter_fields(table)
-        filtered_table = table.filter(compiled_filters) if compiled_filters else table
+        filtered_table = self._filter(table, query_builder)
+        if self.confidence:
+            if row_count is None:
+                row_count = data_client.execute(filtered_table.count())
+            return self._compile_sample(
+                data_client,
+                schema_name,
+                table_name,
+                filtered_table,
+                query_builder,
+                row_count,
+            )
         randomly_sorted_table = self.maybe_add_random_sort(data_client, filtered_table)
         query = randomly_sorted_table.limit(self.batch_size)[self.primary_keys]
 
         return query
 
+    def get_count_query(
+        self,
+        data_client: ibis.client,
+        schema_name: str,
+        table_name: str,
+        query_builder: QueryBuilder,
+    ) -> ibis.Expr:
+        """Return a query of the number of rows of the filtered table, in a
+        row_count column, which a sample sized by confidence level is sized by."""
+        table = clients.get_ibis_table(data_client, schema_name, table_name)
+        filtered_table = self._filter(table, query_builder)
+        return filtered_table.aggregate([filtered_table.count().name("row_count")])
+
+    @staticmethod
+    def _filter(table, query_builder):
+        compiled_filters = query_builder.compile_filter_fields(table)
+        return table.filter(compiled_filters) if compiled_filters else table
+
+    def _compile_sample(
+        self,
+        data_client,
+        schema_name,
+        table_name,
+        filtered_table,
+        query_builder,
+        row_count,
+    ):
+        """Return a query of a sample sized by the confidence level.
+
+        The sample uses engine native table sampling where available, or
+        a salted hash of integer primary keys, so that only a fraction of
+        the table is scanned or sorted. Other tables fall back to a random sort.
+        """
+        self.batch_size = get_sample_size(self.confidence, self.error, row_count)
+        if self.batch_size >= row_count:
+            return filtered_table[self.primary_keys]
+
+        fraction = SAMPLE_OVERSAMPLING * self.batch_size / row_count
+        source_type = getattr(data_client, "_source_type", None)
+        if fraction < 1 and source_type in TABLE_SAMPLE_CLAUSES:
+            sample = data_client.sql(
+                get_table_sample_query(data_client, schema_name, table_name, fraction)
+            )
+            sampled_table = self._filter(sample, query_builder)
+            if source_type in BLOCK_SAMPLE_SOURCE_TYPES:
+                # Cutting a block sample would keep the rows of its first blocks
+                sampled_table = self.maybe_add_random_sort(data_client, sampled_table)
+        elif (
+            fraction < 1
+            and source_type != "Teradata"
+            and all(
+                isinstance(filtered_table[key].type(), dt.Integer)
+                for key in self.primary_keys
+            )
+        ):
+            sampled_table = filtered_table.filter(
+                self._get_key_hash(filtered_table) < int(fraction * KEY_HASH_MODULUS)
+            )
+        else:
+            sampled_table = self.maybe_add_random_sort(data_client, filtered_table)
+        return sampled_table.limit(self.batch_size)[self.primary_keys]
+
+    def _get_key_hash(self, table, salt=None):
+        """Return a hash of the integer primary keys of each row, salted so
+        that every sample selects different rows, from 0 to KEY_HASH_MODULUS.
+
+        Keys are hashed as a polynomial with a random multiplier modulo a
+        prime, a universal hash, so that keys of a common stride do not all
+        fall inside or outside the sample.
+        """
+        multiplier, increment = salt or (
+            random.randrange(1, KEY_HASH_MODULUS),
+            random.randrange(KEY_HASH_MODULUS),
+        )
+        key_hash = None
+        for key in self.primary_keys:
+            key_value = table[key].abs() % KEY_HASH_MODULUS
+            key_hash = (
+                key_value
+                if key_hash is None
+                else (key_hash * multiplier + key_value) % KEY_HASH_MODULUS
+            )
+        return (key_hash * multiplier + increment) % KEY_HASH_MODULUS
+
     def maybe_add_random_sort(
         self, data_client: ibis.client, table: ibis.Expr
     ) -> ibis.Expr:
         """Return a randomly sorted query if it is supported for the client."""
-        if type(data_client) in RANDOM_SORT_SUPPORTS:
+        random_sort_supports = get_random_sort_supports()
+        if type(data_client) in random_sort_supports:
             # Teradata 'SAMPLE' is random by nature and does not require a sort by
-            if type(data_client) == clients.TeradataClient:
+            if type(data_client) == clients.get_client_class("Teradata"):
                 return table
 
             return table.sort_by(
-                RandomSortKey(RANDOM_SORT_SUPPORTS[type(data_client)]).to_expr()
+                RandomSortKey(random_sort_supports[type(data_client)]).to_expr()
             )
 
         logging.warning(
@@ -0,0 +1,181 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An on-disk cache of query results stored as Parquet files.
+
+Results are keyed by the compiled SQL of a query, the connection it runs on
+and an optional version token, such as a table snapshot id. Queries which do
+not compile to SQL, e.g. on FileSystem connections, are never cached.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import pandas
+import sqlalchemy
+
+from data_validation import consts
+
+CACHE_FILE_SUFFIX = ".parquet"
+
+
+def get_query_sql(query):
+    """Return the SQL of an Ibis query or None if it does not compile to SQL."""
+    compiled = query.compile()
+    if isinstance(compiled, str):
+        return compiled
+    if isinstance(compiled, sqlalchemy.sql.ClauseElement):
+        try:
+            return str(compiled.compile(compile_kwargs={"literal_binds": True}))
+        except Exception:
+            # Not every bind parameter type can be rendered as a literal.
+            sql = compiled.compile()
+            return f"{sql} -- {json.dumps(sql.params, sort_keys=True, default=str)}"
+    return None
+
+
+def get_cache_directory():
+    """Return the default cache directory, next to the stored connections."""
+    root = os.environ.get(consts.ENV_DIRECTORY_VAR) or consts.DEFAULT_ENV_DIRECTORY
+    return os.path.join(os.path.expanduser(root), "cache")
+
+
+class QueryCache(object):
+    def __init__(
+        self,
+        directory=None,
+        ttl_seconds=None,
+        max_size_mb=consts.DEFAULT_CACHE_MAX_SIZE_MB,
+        clock=time.time,
+    ):
+        """Build a QueryCache storing results in a local directory.
+
+        Args:
+            directory (String): Directory of the cached Parquet files.
+            ttl_seconds (int): Seconds a cached result is valid for, or None
+                for results which only expire by version or eviction.
+            max_size_mb (int): Size of the cache after least recently used
+                results are evicted.
+            clock (Callable): Returns the current time in seconds.
+        """
+        self.directory = directory or get_cache_directory()
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(connection_config, sql, version=None):
+        """Return the cache key of a query on a connection."""
+        identity = json.dumps(
+            {"connection": connection_config, "sql": sql, "version": version},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, key + CACHE_FILE_SUFFIX)
+
+    def get(self, key):
+        """Return the cached DataFrame for a key or None on a cache miss."""
+        path = self._get_path(key)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        now = self._clock()
+        if self.ttl_seconds is not None and now - stat.st_mtime > self.ttl_seconds:
+            logging.debug("Cached result %s expired", key)
+            return None
+        try:
+            result_df = pandas.read_parquet(path)
+        except Exception as e:
+            logging.warning("Unable to read cached result %s: %s", key, e)
+            return None
+
+        # The access time orders results for eviction, the modified time
+        # is kept as the time the result was cached.
+        os.utime(path, (now, stat.st_mtime))
+        return result_df
+
+    def put(self, key, result_df):
+        """Store a DataFrame and evict least recently used results."""
+        os.makedirs(self.directory, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(file_descriptor)
+        try:
+            result_df.to_parquet(temp_path, index=False)
+        except Exception as e:
+            # Results with types Parquet does not support are not cached.
+            logging.warning("Unable to cache result %s: %s", key, e)
+            os.remove(temp_path)
+            return
+        now = self._clock()
+        os.utime(temp_path, (now, now))
+        os.replace(temp_path, self._get_path(key))
+        self._evict()
+
+    def _evict(self):
+        """Remove least recently used results until the cache fits its size."""
+        with self._lock:
+            entries = []
+            for file_name in os.listdir(self.directory):
+                if not file_name.endswith(CACHE_FILE_SUFFIX):
+                    continue
+                path = os.path.join(self.directory, file_name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_atime, stat.st_size, path))
+
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_size <= self.max_size_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total_size -= size
+
+    def execute(self, client, connection_config, query, version=None):
+        """Return the result of a query from the cache, or execute and cache it.
+
+        Args:
+            client (IbisClient): The client to execute the query with.
+            connection_config (Dict): The connection the client was built from.
+            query (ibis.Expr): The query to execute.
+            version (String): Optional token that changes with the table data.
+        """
+        sql = get_query_sql(query)
+        if sql is None:
+            return client.execute(query)
+
+        key = self.get_key(connection_config, sql, version=version)
+        result_df = self.get(key)
+        if result_df is not None:
+            logging.info("Using cached result for query %s", key[:12])
+            return result_df
+
+        result_df = client.execute(query)
+        self.put(key, result_df)
+        return result_df
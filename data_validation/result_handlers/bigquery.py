@@ -14,13 +14,16 @@
 
 """Output validation report to BigQuery tables"""
 
+import logging
+
 from google.cloud import bigquery
 
 from data_validation import client_info
-import logging
 from data_validation import consts
 from data_validation.result_handlers.text import filter_validation_status
 
+PROFILE_TABLE_SUFFIX = "_profile"
+
 
 class BigQueryResultHandler(object):
     """Write results of data validation to BigQuery.
@@ -31,14 +34,35 @@ class BigQueryResultHandler(object):
         table_id (str):
             Fully-qualified table ID (``project-id.dataset.table``) of
             destination table for results.
+        write_mode (str):
+            ``streaming`` inserts rows with the streaming API, ``load`` appends
+            the rows to the table with a single load job.
+        batch_rows (int):
+            Max number of rows sent per streaming insert request.
+        max_console_rows (int):
+            Max number of result rows logged to the console.
+
+    Profiles of runs are appended to the ``<table_id>_profile`` table, which
+    is created by the first load job.
     """
 
     def __init__(
-        self, bigquery_client, status_list=None, table_id="pso_data_validator.results"
+        self,
+        bigquery_client,
+        status_list=None,
+        table_id="pso_data_validator.results",
+        write_mode=consts.BQ_WRITE_MODE_STREAMING,
+        batch_rows=consts.DEFAULT_BQ_BATCH_ROWS,
+        max_console_rows=consts.DEFAULT_MAX_CONSOLE_ROWS,
     ):
+        if write_mode not in consts.BQ_WRITE_MODES:
+            raise ValueError(f"Unknown BigQuery write mode: {write_mode}")
         self._bigquery_client = bigquery_client
         self._table_id = table_id
         self._status_list = status_list
+        self._write_mode = write_mode
+        self._batch_rows = batch_rows
+        self._max_console_rows = max_console_rows
 
     @staticmethod
     def get_handler_for_project(
@@ -46,6 +70,8 @@ class BigQueryResultHandler(object):
         status_list=None,
         table_id="pso_data_validator.results",
         credentials=None,
+        write_mode=consts.BQ_WRITE_MODE_STREAMING,
+        batch_rows=consts.DEFAULT_BQ_BATCH_ROWS,
     ):
         """Return BigQueryResultHandler instance for given project.
 
@@ -56,26 +82,64 @@ class BigQueryResultHandler(object):
                 Explicit credentials to use in case default credentials
                 aren't working properly.
             status_list (list): provided status to filter the results with
+            write_mode (str): streaming inserts or a load job.
+            batch_rows (int): Max number of rows per streaming insert request.
         """
         info = client_info.get_http_client_info()
         client = bigquery.Client(
             project=project_id, client_info=info, credentials=credentials
         )
-        return BigQueryResultHandler(client, status_list=status_list, table_id=table_id)
+        return BigQueryResultHandler(
+            client,
+            status_list=status_list,
+            table_id=table_id,
+            write_mode=write_mode,
+            batch_rows=batch_rows,
+        )
+
+    def _log_results(self, result_df):
+        """Log the results, rendering at most max_console_rows of them."""
+        console_df = result_df.drop(consts.COLUMN_FILTER_LIST, axis=1)
+        if len(console_df) > self._max_console_rows:
+            status_counts = result_df[consts.VALIDATION_STATUS].value_counts()
+            logging.info(
+                "Writing %s result rows to %s (%s), showing the first %s",
+                len(result_df),
+                self._table_id,
+                ", ".join(
+                    f"{count} {status}" for status, count in status_counts.items()
+                ),
+                self._max_console_rows,
+            )
+            console_df = console_df.head(self._max_console_rows)
+        logging.info(console_df.to_markdown(tablefmt="fancy_grid", index=False))
+
+    def _load_rows(self, table, result_df, schema=None):
+        """Append the results to the table with one load job. The schema is
+        taken from result_df when none is supplied."""
+        job_config = bigquery.LoadJobConfig(
+            schema=schema,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+        )
+        load_job = self._bigquery_client.load_table_from_dataframe(
+            result_df, table, job_config=job_config
+        )
+        load_job.result()
 
     def execute(self, result_df):
         if self._status_list is not None:
             result_df = filter_validation_status(self._status_list, result_df)
 
         # handler also outputs the results to the console before saving to BQ
-        logging.info(
-            result_df.drop(consts.COLUMN_FILTER_LIST, axis=1).to_markdown(
-                tablefmt="fancy_grid", index=False
-            )
-        )
+        self._log_results(result_df)
         table = self._bigquery_client.get_table(self._table_id)
+        if self._write_mode == consts.BQ_WRITE_MODE_LOAD:
+            if len(result_df):
+                self._load_rows(table, result_df, schema=table.schema)
+            return result_df
+
         chunk_errors = self._bigquery_client.insert_rows_from_dataframe(
-            table, result_df
+            table, result_df, chunk_size=self._batch_rows
         )
         if any(chunk_errors):
             if (
@@ -97,3 +161,9 @@ class BigQueryResultHandler(object):
             raise RuntimeError(f"could not write rows: {chunk_errors}")
 
         return result_df
+
+    def execute_profile(self, profile_df):
+        """Append the profile of a run to the profile table."""
+        if len(profile_df):
+            self._load_rows(f"{self._table_id}{PROFILE_TABLE_SUFFIX}", profile_df)
+        return profile_df
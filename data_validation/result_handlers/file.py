@@ -0,0 +1,238 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Output validation report to Parquet, CSV or JSON Lines files"""
+
+import datetime
+import logging
+import os
+import tempfile
+import uuid
+
+import pyarrow
+import pyarrow.parquet
+from google.cloud import storage
+
+from data_validation import client_info, consts
+from data_validation.result_handlers.text import filter_validation_status
+
+FILE_EXTENSIONS = {
+    consts.RESULT_FILE_FORMAT_PARQUET: ".parquet",
+    consts.RESULT_FILE_FORMAT_CSV: ".csv",
+    consts.RESULT_FILE_FORMAT_JSONL: ".jsonl",
+}
+
+DEFAULT_COMPRESSION = {
+    consts.RESULT_FILE_FORMAT_PARQUET: "snappy",
+    consts.RESULT_FILE_FORMAT_CSV: "gzip",
+    consts.RESULT_FILE_FORMAT_JSONL: "gzip",
+}
+
+COMPRESSION_EXTENSIONS = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz", "zip": ".zip"}
+
+# Suffix of the directory profiles are written to, next to the results
+# directory so that it is not read as part of the results dataset.
+PROFILE_DIRECTORY_SUFFIX = "_profile"
+
+# Values of result columns that would not make a valid directory name.
+NULL_PARTITION = "__null__"
+
+# Parquet types of the report columns, as in the BigQuery results table.
+# Inferring types per part file would type all NULL columns as null and
+# break reading the parts of a directory as one dataset.
+REPORT_FIELDS = {
+    field.name: field
+    for field in [
+        pyarrow.field("run_id", pyarrow.string()),
+        pyarrow.field("validation_name", pyarrow.string()),
+        pyarrow.field("validation_type", pyarrow.string()),
+        pyarrow.field("start_time", pyarrow.timestamp("us", tz="UTC")),
+        pyarrow.field("end_time", pyarrow.timestamp("us", tz="UTC")),
+        pyarrow.field("source_table_name", pyarrow.string()),
+        pyarrow.field("target_table_name", pyarrow.string()),
+        pyarrow.field("source_column_name", pyarrow.string()),
+        pyarrow.field("target_column_name", pyarrow.string()),
+        pyarrow.field("aggregation_type", pyarrow.string()),
+        pyarrow.field("group_by_columns", pyarrow.string()),
+        pyarrow.field("primary_keys", pyarrow.string()),
+        pyarrow.field("num_random_rows", pyarrow.int64()),
+        pyarrow.field("source_agg_value", pyarrow.string()),
+        pyarrow.field("target_agg_value", pyarrow.string()),
+        pyarrow.field("difference", pyarrow.float64()),
+        pyarrow.field("pct_difference", pyarrow.float64()),
+        pyarrow.field("pct_threshold", pyarrow.float64()),
+        pyarrow.field("validation_status", pyarrow.string()),
+        pyarrow.field(
+            "labels",
+            pyarrow.list_(
+                pyarrow.struct(
+                    [
+                        pyarrow.field("key", pyarrow.string()),
+                        pyarrow.field("value", pyarrow.string()),
+                    ]
+                )
+            ),
+        ),
+    ]
+}
+
+
+class FileResultHandler(object):
+    """Append results of data validation to files in a local or GCS directory.
+
+    Every call writes new part files next to the existing ones, so results
+    are appended as validations finish and no results are kept in memory.
+    With partition_by, part files are written to Hive style directories such
+    as ``run_id=<run_id>/``.
+
+    Arguments:
+        directory (str): Local path or ``gs://bucket/path`` of the results.
+        file_format (str): One of ``parquet``, ``csv`` or ``jsonl``.
+        partition_by (str): Optional ``run_id`` or ``table`` to partition by.
+        status_list (list): Provided status to filter the results with.
+        compression (str): Compression codec, defaults to snappy for Parquet
+            and gzip for CSV and JSON Lines. Use ``none`` for no compression.
+    """
+
+    def __init__(
+        self,
+        directory,
+        file_format=consts.RESULT_FILE_FORMAT_PARQUET,
+        partition_by=None,
+        status_list=None,
+        compression=None,
+    ):
+        if file_format not in consts.RESULT_FILE_FORMATS:
+            raise ValueError(f"Unknown result file format: {file_format}")
+        if partition_by and partition_by not in consts.RESULT_PARTITION_COLUMNS:
+            raise ValueError(f"Unknown result partition: {partition_by}")
+        self._directory = directory
+        self._file_format = file_format
+        self._partition_by = partition_by
+        self._status_list = status_list
+        compression = compression or DEFAULT_COMPRESSION[file_format]
+        self._compression = None if compression == "none" else compression
+        self._storage_client = None
+
+    def _get_file_name(self):
+        timestamp = datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        extension = FILE_EXTENSIONS[self._file_format]
+        if self._file_format != consts.RESULT_FILE_FORMAT_PARQUET:
+            extension += COMPRESSION_EXTENSIONS.get(self._compression, "")
+        return f"part-{timestamp}-{uuid.uuid4().hex[:8]}{extension}"
+
+    def _get_partition_directory(self, value):
+        if value is None or value != value:
+            value = NULL_PARTITION
+        value = str(value).replace("/", "_")
+        return f"{self._partition_by}={value}"
+
+    @staticmethod
+    def _prepare(result_df):
+        """Return results with labels as key/value records, as in BigQuery."""
+        if "labels" not in result_df:
+            return result_df
+        result_df = result_df.copy()
+        result_df["labels"] = [
+            [{"key": key, "value": value} for key, value in labels or []]
+            for labels in result_df["labels"]
+        ]
+        return result_df
+
+    @staticmethod
+    def _get_parquet_schema(result_df):
+        """Return the report schema of the columns of result_df.
+
+        Columns which are not report columns keep their inferred types.
+        """
+        other_columns = [name for name in result_df if name not in REPORT_FIELDS]
+        other_schema = pyarrow.Schema.from_pandas(
+            result_df[other_columns], preserve_index=False
+        )
+        return pyarrow.schema(
+            [
+                REPORT_FIELDS.get(name) or other_schema.field(name)
+                for name in result_df.columns
+            ]
+        )
+
+    def _write_local(self, result_df, file_path):
+        if self._file_format == consts.RESULT_FILE_FORMAT_PARQUET:
+            table = pyarrow.Table.from_pandas(
+                result_df,
+                schema=self._get_parquet_schema(result_df),
+                preserve_index=False,
+            )
+            pyarrow.parquet.write_table(
+                table, file_path, compression=self._compression or "none"
+            )
+        elif self._file_format == consts.RESULT_FILE_FORMAT_CSV:
+            result_df.to_csv(file_path, index=False, compression=self._compression)
+        else:
+            result_df.to_json(
+                file_path,
+                orient="records",
+                lines=True,
+                date_format="iso",
+                date_unit="us",
+                compression=self._compression,
+            )
+
+    def _write_gcs(self, result_df, file_path):
+        if self._storage_client is None:
+            self._storage_client = storage.Client(
+                client_info=client_info.get_http_client_info()
+            )
+        bucket_name, blob_name = file_path[len("gs://") :].split("/", 1)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            local_path = os.path.join(temp_dir, os.path.basename(file_path))
+            self._write_local(result_df, local_path)
+            blob = self._storage_client.bucket(bucket_name).blob(blob_name)
+            blob.upload_from_filename(local_path)
+
+    def _write(self, result_df, directory):
+        file_path = "/".join([directory.rstrip("/"), self._get_file_name()])
+        if file_path.startswith("gs://"):
+            self._write_gcs(result_df, file_path)
+        else:
+            os.makedirs(directory, exist_ok=True)
+            self._write_local(result_df, file_path)
+        logging.info("Wrote %s result rows to %s", len(result_df), file_path)
+
+    def execute(self, result_df):
+        if self._status_list is not None:
+            result_df = filter_validation_status(self._status_list, result_df)
+        if result_df.empty:
+            return result_df
+
+        output_df = self._prepare(result_df)
+        if not self._partition_by:
+            self._write(output_df, self._directory)
+            return result_df
+
+        column = consts.RESULT_PARTITION_COLUMNS[self._partition_by]
+        for value, partition_df in output_df.groupby(column, sort=False, dropna=False):
+            directory = "/".join(
+                [self._directory.rstrip("/"), self._get_partition_directory(value)]
+            )
+            self._write(partition_df, directory)
+        return result_df
+
+    def execute_profile(self, profile_df):
+        """Append the profile of a run to the profile directory."""
+        if not profile_df.empty:
+            self._write(
+                profile_df, self._directory.rstrip("/") + PROFILE_DIRECTORY_SUFFIX
+            )
+        return profile_df
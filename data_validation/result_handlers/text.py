@@ -21,7 +21,9 @@ from the validation run.
 
 Output validation report to text-based log
 """
-from data_validation import consts
+import sys
+
+from data_validation import consts, profiling
 
 
 def filter_validation_status(status_list, result_df):
@@ -68,3 +70,8 @@ class TextResultHandler(object):
 
     def execute(self, result_df):
         return self.print_formatted_(result_df)
+
+    def execute_profile(self, profile_df):
+        """Print the profile of a run to stderr, apart from the report."""
+        print(profiling.format_profile(profile_df), file=sys.stderr)
+        return profile_df
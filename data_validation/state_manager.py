@@ -155,6 +155,47 @@ class StateManager(object):
 
         return [file_name for file_name in files if file_name.endswith(".yaml")]
 
+    def create_validation_state(self, name: str, state: Dict):
+        """Store the state of an incremental validation as JSON.
+
+        Args:
+            name (String): The name of the incremental validation.
+            state (Dict): A dictionary with the watermark and cumulative results.
+        """
+        state_directory = self._get_state_directory()
+        if self.file_system == FileSystem.LOCAL and not os.path.exists(state_directory):
+            os.makedirs(state_directory)
+        self._write_file(self._get_state_path(name), json.dumps(state))
+
+    def get_validation_state(self, name: str) -> Dict:
+        """Get the state of an incremental validation.
+
+        Args:
+            name: The name of the incremental validation.
+        Returns:
+            A dict of the stored state or None if the validation has not run.
+        """
+        state_path = self._get_state_path(name)
+        if self.file_system == FileSystem.GCS:
+            if self.gcs_bucket.get_blob(self._get_gcs_file_path(state_path)) is None:
+                return None
+        elif not os.path.exists(state_path):
+            return None
+
+        return json.loads(self._read_file(state_path))
+
+    def _get_state_directory(self) -> str:
+        """Returns the incremental validation state directory path."""
+        return os.path.join(self.file_system_root_path, "state/")
+
+    def _get_state_path(self, name: str) -> str:
+        """Returns the full path to the state of an incremental validation.
+
+        Args:
+            name: The name of the incremental validation.
+        """
+        return os.path.join(self._get_state_directory(), f"{name}.state.json")
+
     def _get_validations_directory(self):
         """Returns the validations directory path."""
         if self.file_system == FileSystem.LOCAL:
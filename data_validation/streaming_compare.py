@@ -0,0 +1,142 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memory bounded row comparison for row validations larger than memory.
+
+Source and target result sets are streamed in chunks and hash partitioned by
+primary key into spill files on local disk. Rows with the
+same primary key always land in the same partition, so comparing the source
+and target partitions one pair at a time produces the same report as
+comparing the full result sets, while only one partition pair is held in
+memory at a time.
+"""
+
+import math
+import os
+import shutil
+import tempfile
+
+import ibis.expr.datatypes as dt
+import numpy
+import pandas
+
+# In-memory size of a value of a column without a fixed width type, e.g. a
+# 64 character row hash held as a Python string.
+VARIABLE_VALUE_BYTES = 120
+FIXED_VALUE_BYTES = 8
+
+# A partition pair is roughly doubled in memory while being compared and the
+# long-format report holds one row per value compared.
+PARTITION_MEMORY_FACTOR = 4
+
+
+def _normalize_key(series):
+    """Return key values in a form that hashes equally on source and target."""
+    if pandas.api.types.is_bool_dtype(series.dtype):
+        return series.astype(str)
+    if pandas.api.types.is_numeric_dtype(series.dtype):
+        return series.astype("float64")
+    if pandas.api.types.infer_dtype(series, skipna=True) in (
+        "decimal",
+        "integer",
+        "floating",
+        "mixed-integer-float",
+    ):
+        return pandas.to_numeric(series, errors="coerce").astype("float64")
+    return series.astype(str)
+
+
+def partition_ids(df, key_fields, num_partitions):
+    """Return the partition number of every row of df, hashing key_fields."""
+    if num_partitions == 1:
+        return numpy.zeros(len(df), dtype="int64")
+    keys = pandas.DataFrame(
+        {
+            str(index): _normalize_key(df[field]).to_numpy()
+            for index, field in enumerate(key_fields)
+        }
+    )
+    hashes = pandas.util.hash_pandas_object(keys, index=False).to_numpy()
+    return (hashes % numpy.uint64(num_partitions)).astype("int64")
+
+
+def estimate_row_bytes(schema):
+    """Return the estimated in-memory size in bytes of a row of an Ibis schema,
+    so partitions can be sized without fetching any rows first."""
+    row_bytes = 0
+    for dtype in schema.types:
+        if isinstance(dtype, (dt.Integer, dt.Floating, dt.Timestamp, dt.Boolean)):
+            row_bytes += FIXED_VALUE_BYTES
+        else:
+            row_bytes += VARIABLE_VALUE_BYTES
+    return max(1, row_bytes)
+
+
+def num_partitions_for_budget(total_rows, row_bytes, memory_budget_bytes):
+    """Return the number of partitions keeping each partition pair in budget."""
+    partition_bytes = 2 * total_rows * row_bytes * PARTITION_MEMORY_FACTOR
+    return max(1, math.ceil(partition_bytes / memory_budget_bytes))
+
+
+def chunk_rows_for_budget(row_bytes, memory_budget_bytes):
+    """Return how many rows to fetch per chunk to stay in budget."""
+    return max(1, memory_budget_bytes // (PARTITION_MEMORY_FACTOR * max(1, row_bytes)))
+
+
+class SpillStore(object):
+    """Hash partitioned DataFrames spilled to a local directory.
+
+    Use as a context manager so the spill files are removed once the
+    comparison finishes.
+    """
+
+    def __init__(self, num_partitions, directory=None):
+        self.num_partitions = num_partitions
+        self._parent_directory = directory
+        self.directory = None
+        self._num_files = {}
+        # Empty DataFrames with the columns and types spilled for each side
+        self.templates = {}
+
+    def __enter__(self):
+        self.directory = tempfile.mkdtemp(
+            prefix="data-validation-spill-", dir=self._parent_directory
+        )
+        return self
+
+    def __exit__(self, *exc_info):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _path(self, side, partition, index):
+        return os.path.join(self.directory, f"{side}-{partition:05d}-{index:05d}.pkl")
+
+    def append(self, side, df, key_fields):
+        """Split df by partition and append each piece to its spill files."""
+        self.templates.setdefault(side, df.iloc[:0])
+        ids = partition_ids(df, key_fields, self.num_partitions)
+        for partition in numpy.unique(ids):
+            piece = df[ids == partition]
+            index = self._num_files.get((side, partition), 0)
+            piece.to_pickle(self._path(side, partition, index))
+            self._num_files[(side, partition)] = index + 1
+
+    def read(self, side, partition, empty_like):
+        """Return all rows spilled for a partition as a single DataFrame."""
+        pieces = [
+            pandas.read_pickle(self._path(side, partition, index))
+            for index in range(self._num_files.get((side, partition), 0))
+        ]
+        if not pieces:
+            return empty_like.iloc[:0]
+        return pandas.concat(pieces, ignore_index=True)
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
-from copy import deepcopy
+from copy import copy, deepcopy
 
 from data_validation import consts, metadata
 from data_validation.query_builder.query_builder import (
@@ -61,14 +61,21 @@ class ValidationBuilder(object):
         self.add_query_limit()
 
     def clone(self):
-        cloned_builder = ValidationBuilder(self.config_manager)
+        """Return a copy of this builder for a step of a recursive validation.
 
-        cloned_builder.source_builder = deepcopy(self.source_builder)
-        cloned_builder.target_builder = deepcopy(self.target_builder)
-        cloned_builder.group_aliases = deepcopy(self.group_aliases)
-        cloned_builder.calculated_aliases = deepcopy(self.calculated_aliases)
-        cloned_builder.comparison_fields = deepcopy(self.comparison_fields)
-        cloned_builder._metadata = deepcopy(self._metadata)
+        Steps only add filters and groups, so the copy shares the fields
+        already added and the base queries compiled from them. Filters and
+        groups added to either builder do not change the other.
+        """
+        cloned_builder = copy(self)
+
+        cloned_builder.source_builder = self.source_builder.copy()
+        cloned_builder.target_builder = self.target_builder.copy()
+        cloned_builder.primary_keys = dict(self.primary_keys)
+        cloned_builder.group_aliases = dict(self.group_aliases)
+        cloned_builder.calculated_aliases = dict(self.calculated_aliases)
+        cloned_builder.comparison_fields = dict(self.comparison_fields)
+        cloned_builder._metadata = dict(self._metadata)
 
         return cloned_builder
 
@@ -274,12 +281,25 @@ class ValidationBuilder(object):
             source_filter = FilterField.isin(
                 filter_field[consts.CONFIG_FILTER_SOURCE_COLUMN],
                 filter_field[consts.CONFIG_FILTER_SOURCE_VALUE],
+                batch_size=filter_field.get(consts.CONFIG_FILTER_BATCH_SIZE),
             )
             target_filter = FilterField.isin(
                 filter_field[consts.CONFIG_FILTER_TARGET_COLUMN],
                 filter_field[consts.CONFIG_FILTER_TARGET_VALUE],
+                batch_size=filter_field.get(consts.CONFIG_FILTER_BATCH_SIZE),
             )
 
+        elif filter_field[consts.CONFIG_TYPE] == consts.FILTER_TYPE_RANGE:
+            source_filter = FilterField.in_range(
+                filter_field[consts.CONFIG_FILTER_SOURCE_COLUMN],
+                filter_field.get(consts.CONFIG_FILTER_LOWER_BOUND),
+                filter_field.get(consts.CONFIG_FILTER_UPPER_BOUND),
+            )
+            target_filter = FilterField.in_range(
+                filter_field[consts.CONFIG_FILTER_TARGET_COLUMN],
+                filter_field.get(consts.CONFIG_FILTER_LOWER_BOUND),
+                filter_field.get(consts.CONFIG_FILTER_UPPER_BOUND),
+            )
         # TODO(issues/40): Add metadata around filters
         self.source_builder.add_filter_field(source_filter)
         self.target_builder.add_filter_field(target_filter)
@@ -32,7 +32,14 @@ DEFAULT_PYTHON_VERSION = "3.10"
 # Python versions used for testing.
 PYTHON_VERSIONS = ["3.7", "3.8", "3.9", "3.10"]
 
-BLACK_PATHS = ("data_validation", "samples", "tests", "noxfile.py", "setup.py")
+BLACK_PATHS = (
+    "benchmarks",
+    "data_validation",
+    "samples",
+    "tests",
+    "noxfile.py",
+    "setup.py",
+)
 LINT_PACKAGES = ["flake8", "black==22.3.0"]
 
 
@@ -21,14 +21,27 @@ import pandas
 app = flask.Flask(__name__)
 
 
-def _clean_dataframe(df):
-    rows = df.to_dict(orient="record")
-    for row in rows:
-        for key in row:
-            if type(row[key]) in [pandas.Timestamp]:
-                row[key] = str(row[key])
+def _stringify_timestamps(series):
+    """Return a timestamp column as the strings of its pandas.Timestamps."""
+    if pandas.api.types.is_datetime64_any_dtype(series):
+        # Unlike naive columns, each value of a tz-aware column is formatted
+        # on its own, the same way as str(pandas.Timestamp).
+        if series.dt.tz is None:
+            text = series.dt.tz_localize("UTC").astype(str).str[: -len("+00:00")]
+        else:
+            text = series.astype(str)
+        return text.where(series.notna(), None)
+    inferred_type = pandas.api.types.infer_dtype(series, skipna=True)
+    if inferred_type in ["datetime", "mixed", "mixed-integer"]:
+        return series.map(
+            lambda value: str(value) if isinstance(value, pandas.Timestamp) else value
+        )
+    return series
+
 
-    return json.dumps(rows)
+def _clean_dataframe(df):
+    df = df.apply(_stringify_timestamps) if len(df.columns) else df
+    return json.dumps(df.to_dict(orient="records"))
 
 
 def _get_request_content(request):
@@ -0,0 +1,93 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import ibis
+import pandas
+import pytest
+
+from data_validation import consts
+
+TABLE_DF = pandas.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation.query_builder import query_builder
+
+    return query_builder
+
+
+def _get_row_builder(module_under_test):
+    builder = module_under_test.QueryBuilder.build_count_validator()
+    builder.add_calculated_field(
+        module_under_test.CalculatedField.upper(
+            {consts.CONFIG_FIELD_ALIAS: "upper__name", consts.CONFIG_DEPTH: 0},
+            ["name"],
+        )
+    )
+    for field_name in ["id", "upper__name"]:
+        builder.add_comparison_field(
+            module_under_test.ComparisonField(field_name=field_name, alias=field_name)
+        )
+    return builder
+
+
+def test_copy_reuses_base_query(module_under_test):
+    table = ibis.pandas.connect({"my_table": TABLE_DF}).table("my_table")
+    builder = _get_row_builder(module_under_test)
+    query = builder.compile(consts.ROW_VALIDATION, table)
+
+    copied_builder = builder.copy()
+    copied_builder.add_filter_field(module_under_test.FilterField.isin("id", [2, 3]))
+    with mock.patch.object(
+        module_under_test.QueryBuilder, "compile_calculated_fields"
+    ) as compile_calculated_fields:
+        copied_query = copied_builder.compile(consts.ROW_VALIDATION, table)
+
+    compile_calculated_fields.assert_not_called()
+    assert builder.filters == []
+    assert list(query.execute()["upper__name"]) == ["A", "B", "C"]
+    assert list(copied_query.execute()["upper__name"]) == ["B", "C"]
+
+
+def test_base_query_is_rebuilt_for_new_fields(module_under_test):
+    table = ibis.pandas.connect({"my_table": TABLE_DF}).table("my_table")
+    builder = _get_row_builder(module_under_test)
+    builder.compile(consts.ROW_VALIDATION, table)
+
+    copied_builder = builder.copy()
+    copied_builder.add_comparison_field(
+        module_under_test.ComparisonField(field_name="name", alias="name")
+    )
+    query = copied_builder.compile(consts.ROW_VALIDATION, table)
+    other_table = ibis.pandas.connect({"my_table": TABLE_DF.iloc[:1]}).table("my_table")
+
+    assert query.columns == ["id", "upper__name", "name"]
+    assert builder.compile(consts.ROW_VALIDATION, table).columns == [
+        "id",
+        "upper__name",
+    ]
+    assert len(builder.compile(consts.ROW_VALIDATION, other_table).execute()) == 1
+
+
+def test_isin_filter_in_batches(module_under_test):
+    table = ibis.pandas.connect({"my_table": TABLE_DF}).table("my_table")
+    filter_field = module_under_test.FilterField.isin("id", [1, 3, 4], batch_size=2)
+
+    predicate = filter_field.compile(table)
+
+    assert isinstance(predicate.op(), ibis.expr.operations.Or)
+    assert list(table.filter(predicate).execute()["id"]) == [1, 3]
@@ -12,7 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import ibis
+import pandas
 import pytest
+from unittest import mock
+from sqlalchemy.dialects import postgresql
 
 from data_validation import clients
 from data_validation.query_builder.query_builder import QueryBuilder
@@ -76,3 +80,95 @@ def test_compile(module_under_test, fs):
 
     assert list(df.columns) == primary_keys
     assert len(df) == 10
+
+
+def test_get_sample_size(module_under_test):
+    assert module_under_test.get_sample_size(0.95, 0.01, 2000000000) == 9604
+    assert module_under_test.get_sample_size(0.95, 0.01, 1000) == 906
+    assert module_under_test.get_sample_size(0.99, 0.05, None) == 664
+
+
+def test_get_table_sample_query(module_under_test):
+    bigquery_client = mock.Mock(_source_type="BigQuery")
+    postgres_client = mock.Mock(_source_type="Postgres")
+    postgres_client.con.dialect = postgresql.dialect()
+
+    assert module_under_test.get_table_sample_query(
+        bigquery_client, "my_dataset", "my_table", 0.0001
+    ) == ("SELECT * FROM `my_dataset.my_table` TABLESAMPLE SYSTEM (0.01 PERCENT)")
+    assert module_under_test.get_table_sample_query(
+        postgres_client, None, "my_table", 0.5
+    ) == ("SELECT * FROM my_table TABLESAMPLE BERNOULLI (50)")
+    assert module_under_test.get_table_sample_query(
+        postgres_client, "My Schema", "user", 0.5
+    ) == ('SELECT * FROM "My Schema"."user" TABLESAMPLE BERNOULLI (50)')
+
+
+def test_compile_sample_by_confidence(module_under_test, fs):
+    _create_table_file(TABLE_FILE_PATH, JSON_DATA)
+    client = clients.get_data_client(CONN_CONFIG)
+    builder = module_under_test.RandomRowBuilder(
+        ["col_a"], 10, confidence=0.5, error=0.25
+    )
+
+    query = builder.compile(
+        client, None, CONN_CONFIG["table_name"], QueryBuilder([], [], [], [], [], None)
+    )
+    df = client.execute(query)
+
+    # 2 rows are needed of 24, so keys are sampled by hash instead of sorting
+    assert builder.batch_size == 2
+    assert len(df) <= 2
+    assert set(df["col_a"]) <= set(range(24))
+
+
+def test_compile_sample_reuses_row_count(module_under_test, fs):
+    _create_table_file(TABLE_FILE_PATH, JSON_DATA)
+    client = clients.get_data_client(CONN_CONFIG)
+    builder = module_under_test.RandomRowBuilder(["col_a"], 10, confidence=0.95)
+    query_builder = QueryBuilder([], [], [], [], [], None)
+
+    count_df = client.execute(
+        builder.get_count_query(client, None, CONN_CONFIG["table_name"], query_builder)
+    )
+    with mock.patch.object(client, "execute") as mock_execute:
+        builder.compile(
+            client, None, CONN_CONFIG["table_name"], query_builder, row_count=24
+        )
+
+    assert count_df["row_count"].tolist() == [24]
+    mock_execute.assert_not_called()
+
+
+def test_get_key_hash_samples_strided_keys(module_under_test):
+    df = pandas.DataFrame({"id": range(0, 60000, 6)})
+    client = ibis.pandas.connect({"my_table": df})
+    table = client.table("my_table")
+    builder = module_under_test.RandomRowBuilder(["id"], 10)
+
+    threshold = module_under_test.KEY_HASH_MODULUS // 6
+    samples = [
+        set(
+            client.execute(
+                table.filter(builder._get_key_hash(table, salt=salt) < threshold)
+            )["id"]
+        )
+        for salt in [(1103515245, 12345), (914334, 1)]
+    ]
+
+    # A sixth of the keys is sampled, although every key is a multiple of 6,
+    # and each salt samples other keys.
+    assert all(1400 < len(sample) < 1950 for sample in samples)
+    assert samples[0] != samples[1]
+
+
+def test_compile_sample_of_small_table(module_under_test, fs):
+    _create_table_file(TABLE_FILE_PATH, JSON_DATA)
+    client = clients.get_data_client(CONN_CONFIG)
+    builder = module_under_test.RandomRowBuilder(["col_a"], 10, confidence=0.95)
+
+    query = builder.compile(
+        client, None, CONN_CONFIG["table_name"], QueryBuilder([], [], [], [], [], None)
+    )
+
+    assert len(client.execute(query)) == 24
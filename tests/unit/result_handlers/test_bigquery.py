@@ -34,3 +34,110 @@ def test_get_handler_for_project_sets_user_agent(module_under_test, monkeypatch)
     mock_client.assert_called_once()
     user_agent = mock_client.call_args[1]["client_info"].to_user_agent()
     assert "google-pso-tool/data-validator" in user_agent
+
+
+def _get_result_df(rows):
+    import pandas
+    from data_validation import consts
+
+    result_df = pandas.DataFrame(
+        {
+            "validation_name": [f"col_{i}" for i in range(rows)],
+            "validation_status": ["success" if i % 2 else "fail" for i in range(rows)],
+            "source_agg_value": [str(i) for i in range(rows)],
+            "run_id": ["run"] * rows,
+            "labels": [[("name", "test")]] * rows,
+            "start_time": [None] * rows,
+            "end_time": [None] * rows,
+            "aggregation_type": ["count"] * rows,
+            "source_column_name": ["col"] * rows,
+            "target_column_name": ["col"] * rows,
+            "primary_keys": [None] * rows,
+            "group_by_columns": [None] * rows,
+            "num_random_rows": [None] * rows,
+        }
+    )
+    for column in consts.COLUMN_FILTER_LIST:
+        if column not in result_df:
+            result_df[column] = None
+    return result_df
+
+
+def _get_table():
+    return bigquery.Table(
+        "project.dataset.results",
+        schema=[
+            bigquery.SchemaField("validation_name", "STRING"),
+            bigquery.SchemaField("validation_status", "STRING"),
+            bigquery.SchemaField("source_agg_value", "STRING"),
+            bigquery.SchemaField(
+                "labels",
+                "RECORD",
+                mode="REPEATED",
+                fields=[
+                    bigquery.SchemaField("key", "STRING"),
+                    bigquery.SchemaField("value", "STRING"),
+                ],
+            ),
+        ],
+    )
+
+
+def test_execute_streams_in_batches(module_under_test, caplog):
+    mock_client = mock.create_autospec(bigquery.Client)
+    mock_client.insert_rows_from_dataframe.return_value = [[], []]
+    handler = module_under_test.BigQueryResultHandler(
+        mock_client, batch_rows=3, max_console_rows=2
+    )
+
+    with caplog.at_level("INFO"):
+        handler.execute(_get_result_df(5))
+
+    _, kwargs = mock_client.insert_rows_from_dataframe.call_args
+    assert kwargs["chunk_size"] == 3
+    assert "Writing 5 result rows" in caplog.text
+    assert "col_1" in caplog.text
+    assert "col_2" not in caplog.text
+
+
+def test_execute_appends_with_load_job(module_under_test):
+    mock_client = mock.create_autospec(bigquery.Client)
+    table = _get_table()
+    mock_client.get_table.return_value = table
+    handler = module_under_test.BigQueryResultHandler(
+        mock_client, write_mode="load", batch_rows=2
+    )
+    result_df = _get_result_df(5)
+    handler.execute(result_df)
+
+    mock_client.insert_rows_from_dataframe.assert_not_called()
+    mock_client.load_table_from_dataframe.assert_called_once()
+    (loaded_df, loaded_table), kwargs = mock_client.load_table_from_dataframe.call_args
+    assert loaded_df is result_df
+    assert loaded_table is table
+    job_config = kwargs["job_config"]
+    assert job_config.schema == table.schema
+    assert job_config.write_disposition == bigquery.WriteDisposition.WRITE_APPEND
+    mock_client.load_table_from_dataframe.return_value.result.assert_called_once()
+
+
+def test_execute_profile_appends_to_profile_table(module_under_test):
+    import pandas
+
+    mock_client = mock.create_autospec(bigquery.Client)
+    handler = module_under_test.BigQueryResultHandler(
+        mock_client, table_id="my_project.my_dataset.results"
+    )
+    profile_df = pandas.DataFrame({"run_id": ["run-1"], "stage": ["fetch"]})
+
+    handler.execute_profile(profile_df)
+
+    (loaded_df, loaded_table), kwargs = mock_client.load_table_from_dataframe.call_args
+    assert loaded_df is profile_df
+    assert loaded_table == "my_project.my_dataset.results_profile"
+    assert kwargs["job_config"].schema is None
+
+
+def test_unknown_write_mode(module_under_test):
+    with pytest.raises(ValueError, match="Unknown BigQuery write mode"):
+        module_under_test.BigQueryResultHandler(mock.Mock(), write_mode="copy")
@@ -0,0 +1,162 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+
+import pandas
+import pytest
+
+from data_validation import consts
+
+START_TIME = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+SAMPLE_RESULT_DATA = pandas.DataFrame(
+    {
+        "run_id": ["run-1", "run-1", "run-1"],
+        "source_table_name": ["schema.a", "schema.a", "schema.b"],
+        "validation_name": ["count", "sum__x", "count"],
+        "validation_status": [
+            consts.VALIDATION_STATUS_SUCCESS,
+            consts.VALIDATION_STATUS_FAIL,
+            consts.VALIDATION_STATUS_SUCCESS,
+        ],
+        "source_agg_value": ["1", "2", None],
+        "labels": [[("name", "test")], [], [("name", "test")]],
+        "start_time": [START_TIME] * 3,
+    }
+)
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation.result_handlers import file
+
+    return file
+
+
+def _read_parquet(directory):
+    return pandas.concat(
+        [pandas.read_parquet(path) for path in sorted(directory.rglob("*.parquet"))],
+        ignore_index=True,
+    )
+
+
+def test_import(module_under_test):
+    assert module_under_test is not None
+
+
+def test_unknown_file_format(module_under_test, tmp_path):
+    with pytest.raises(ValueError, match="Unknown result file format"):
+        module_under_test.FileResultHandler(str(tmp_path), file_format="xlsx")
+
+
+def test_execute_appends_parquet_parts(module_under_test, tmp_path):
+    handler = module_under_test.FileResultHandler(str(tmp_path))
+
+    result_df = handler.execute(SAMPLE_RESULT_DATA)
+    handler.execute(SAMPLE_RESULT_DATA)
+
+    assert result_df is SAMPLE_RESULT_DATA
+    assert len(list(tmp_path.glob("part-*.parquet"))) == 2
+    written_df = _read_parquet(tmp_path)
+    assert len(written_df) == 6
+    assert list(written_df["labels"][0]) == [{"key": "name", "value": "test"}]
+    assert written_df["start_time"][0] == START_TIME
+
+
+def test_execute_parquet_parts_with_null_columns(module_under_test, tmp_path):
+    """Parts with all NULL columns are read back as one dataset."""
+    import pyarrow.dataset
+
+    handler = module_under_test.FileResultHandler(str(tmp_path))
+    null_df = SAMPLE_RESULT_DATA.assign(
+        source_agg_value=None, difference=None, num_random_rows=None, labels=None
+    )
+    handler.execute(null_df)
+    handler.execute(SAMPLE_RESULT_DATA.assign(difference=1.5, num_random_rows=10))
+
+    table = pyarrow.dataset.dataset(str(tmp_path), format="parquet").to_table()
+    assert table.num_rows == 6
+    assert table.schema.field("source_agg_value").type == "string"
+    assert table.schema.field("difference").type == "double"
+    assert table.schema.field("num_random_rows").type == "int64"
+    assert sorted(table.column("num_random_rows").to_pylist(), key=str) == [
+        10,
+        10,
+        10,
+        None,
+        None,
+        None,
+    ]
+
+
+def test_execute_partition_by_table(module_under_test, tmp_path):
+    handler = module_under_test.FileResultHandler(str(tmp_path), partition_by="table")
+
+    handler.execute(SAMPLE_RESULT_DATA)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "table=schema.a",
+        "table=schema.b",
+    ]
+    assert len(_read_parquet(tmp_path / "table=schema.a")) == 2
+
+
+def test_execute_filter_status(module_under_test, tmp_path):
+    handler = module_under_test.FileResultHandler(
+        str(tmp_path), status_list=[consts.VALIDATION_STATUS_FAIL]
+    )
+
+    handler.execute(SAMPLE_RESULT_DATA)
+
+    written_df = _read_parquet(tmp_path)
+    assert list(written_df["validation_name"]) == ["sum__x"]
+
+
+@pytest.mark.parametrize(
+    "file_format,extension",
+    [
+        (consts.RESULT_FILE_FORMAT_CSV, ".csv.gz"),
+        (consts.RESULT_FILE_FORMAT_JSONL, ".jsonl.gz"),
+    ],
+)
+def test_execute_text_formats(module_under_test, tmp_path, file_format, extension):
+    handler = module_under_test.FileResultHandler(
+        str(tmp_path), file_format=file_format
+    )
+
+    handler.execute(SAMPLE_RESULT_DATA)
+
+    (path,) = tmp_path.iterdir()
+    assert path.name.endswith(extension)
+    if file_format == consts.RESULT_FILE_FORMAT_CSV:
+        written_df = pandas.read_csv(path)
+    else:
+        written_df = pandas.read_json(path, lines=True)
+    assert list(written_df["validation_name"]) == ["count", "sum__x", "count"]
+
+
+def test_execute_profile(module_under_test, tmp_path):
+    results_directory = tmp_path / "results"
+    handler = module_under_test.FileResultHandler(str(results_directory))
+    profile_df = pandas.DataFrame(
+        {"run_id": ["run-1"], "stage": ["fetch"], "seconds": [1.5]}
+    )
+
+    handler.execute(SAMPLE_RESULT_DATA)
+    handler.execute_profile(profile_df)
+
+    # Profiles are kept apart from the results dataset
+    assert len(_read_parquet(results_directory)) == 3
+    written_df = _read_parquet(tmp_path / "results_profile")
+    assert written_df.to_dict(orient="records") == profile_df.to_dict(orient="records")
@@ -13,10 +13,14 @@
 # limitations under the License.
 
 import argparse
+import threading
+import time
+import pandas
 from unittest import mock
 
-from data_validation import cli_tools, consts
+from data_validation import cli_tools, clients, consts
 from data_validation import __main__ as main
+from data_validation.config_manager import ConfigManager
 
 
 TEST_CONN = '{"source_type":"Example"}'
@@ -74,3 +78,176 @@ def test__compare_match_tables():
     table_configs = main._compare_match_tables(SOURCE_TABLE_MAP, TARGET_TABLE_MAP)
 
     assert table_configs == RESULT_TABLE_CONFIGS
+
+
+def _build_config_manager(config_file):
+    config_manager = mock.Mock()
+    config_manager.config = {consts.CONFIG_FILE: config_file}
+    return config_manager
+
+
+@mock.patch("data_validation.__main__._get_validation_result")
+def test_run_validations_in_parallel_keeps_order(mock_get_result):
+    """Test reports are handled in config order and failures are isolated."""
+    handled = []
+
+    def get_result(config_manager, verbose=False, profile=False):
+        config_file = config_manager.config[consts.CONFIG_FILE]
+        if config_file == "bad.yaml":
+            raise ValueError("boom")
+        validator = mock.Mock()
+        validator.handle_result.side_effect = handled.append
+        return validator, config_file
+
+    mock_get_result.side_effect = get_result
+    config_managers = [
+        _build_config_manager(name) for name in ["a.yaml", "bad.yaml", "c.yaml"]
+    ]
+    args = argparse.Namespace(verbose=False, parallelism=3)
+    main.run_validations(args, config_managers)
+
+    assert handled == ["a.yaml", "c.yaml"]
+
+
+@mock.patch("data_validation.__main__._get_validation_result")
+def test_run_validations_in_parallel_caps_connections(mock_get_result):
+    """Test validations of one connection never exceed --connection-parallelism."""
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def get_result(config_manager, verbose=False, profile=False):
+        # Every validation uses the "busy" target connection
+        with lock:
+            running.append(config_manager)
+            max_running.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(config_manager)
+        return mock.Mock(), None
+
+    mock_get_result.side_effect = get_result
+    config_managers = []
+    for pos in range(8):
+        config_manager = mock.Mock()
+        config_manager.config = {
+            consts.CONFIG_SOURCE_CONN_NAME: "busy" if pos % 2 else "other",
+            consts.CONFIG_TARGET_CONN_NAME: "busy",
+        }
+        config_managers.append(config_manager)
+    args = argparse.Namespace(verbose=False, parallelism=8, connection_parallelism=2)
+    main.run_validations(args, config_managers)
+
+    assert mock_get_result.call_count == 8
+    assert max(max_running) == 2
+
+
+@mock.patch("data_validation.__main__._get_validation_result")
+@mock.patch("data_validation.__main__.PartitionBuilder")
+def test_run_partitioned_validations_merges_reports(
+    mock_partition_builder, mock_get_result
+):
+    """Test partition reports are merged into one report per table."""
+    handled = []
+    partition_config_managers = [
+        [_build_config_manager(f"{table}-{pos}") for pos in range(3)]
+        for table in ["a", "b"]
+    ]
+    mock_partition_builder.return_value.get_partition_config_managers.return_value = (
+        partition_config_managers
+    )
+
+    def get_result(config_manager, verbose=False, profile=False):
+        name = config_manager.config[consts.CONFIG_FILE]
+        pos = int(name[-1])
+        validator = mock.Mock()
+        validator.run_metadata.run_id = name
+        validator.handle_result.side_effect = handled.append
+        return validator, pandas.DataFrame(
+            {
+                "run_id": [name],
+                "start_time": [pos],
+                "end_time": [pos + 10],
+                "source_agg_value": [name],
+            }
+        )
+
+    mock_get_result.side_effect = get_result
+    args = argparse.Namespace(verbose=False, parallelism=4, partition_num=3)
+    main.run_partitioned_validations(args, [mock.Mock(), mock.Mock()])
+
+    assert len(handled) == 2
+    for table, result_df in zip(["a", "b"], handled):
+        assert list(result_df["source_agg_value"]) == [
+            f"{table}-{pos}" for pos in range(3)
+        ]
+        assert set(result_df["run_id"]) == {f"{table}-0"}
+        assert set(result_df["start_time"]) == {0}
+        assert set(result_df["end_time"]) == {12}
+
+
+def test_merge_partition_results_with_empty_first_partition():
+    """Test partitions without rows, e.g. of hash-mod keys, are merged."""
+    columns = ["run_id", "start_time", "end_time", "source_agg_value"]
+    result_dfs = [
+        pandas.DataFrame(columns=columns),
+        pandas.DataFrame([["run-1", 1, 11, "x"]], columns=columns),
+        pandas.DataFrame([["run-2", 2, 12, "y"]], columns=columns),
+    ]
+
+    result_df = main._merge_partition_results(result_dfs)
+    run_result_df = main._merge_partition_results(result_dfs, run_id="run-0")
+
+    assert list(result_df["source_agg_value"]) == ["x", "y"]
+    assert set(result_df["run_id"]) == {"run-1"}
+    assert set(run_result_df["run_id"]) == {"run-0"}
+    assert main._merge_partition_results(result_dfs[:1]).empty
+
+
+@mock.patch("data_validation.__main__.DataValidation")
+@mock.patch("data_validation.clients.get_data_client")
+@mock.patch("data_validation.state_manager.StateManager.get_connection_config")
+@mock.patch("data_validation.cli_tools.get_validation")
+def test_config_runner_releases_clients(
+    mock_get_validation, mock_get_connection, mock_get_data_client, mock_validation
+):
+    """Test a CLI run returns every shared client it checks out."""
+    registry = clients.ClientRegistry()
+    checkouts = []
+    mock_get_connection.side_effect = lambda name: {
+        consts.SOURCE_TYPE: "Postgres",
+        "name": name,
+    }
+    mock_get_data_client.side_effect = lambda config: mock.Mock()
+
+    def get_validation(config, source_client=None, target_client=None, **kwargs):
+        validator = mock.Mock()
+        validator.config_manager = ConfigManager(config, source_client, target_client)
+        validator.execute.side_effect = lambda: checkouts.append(
+            registry.get_checkouts()
+        )
+        return validator
+
+    mock_validation.side_effect = get_validation
+    for parallelism in [1, 2]:
+        mock_get_validation.return_value = {
+            consts.YAML_SOURCE: "source",
+            consts.YAML_TARGET: "target",
+            consts.YAML_RESULT_HANDLER: None,
+            consts.YAML_VALIDATIONS: [
+                {consts.CONFIG_TYPE: consts.COLUMN_VALIDATION} for _ in range(3)
+            ],
+        }
+        args = argparse.Namespace(
+            config_dir=None,
+            config_file="example.yaml",
+            verbose=False,
+            parallelism=parallelism,
+        )
+        with mock.patch.object(clients, "CLIENT_REGISTRY", registry):
+            main.config_runner(args)
+
+        assert registry.get_checkouts() == 0
+
+    # The first validation holds checkouts of its own and of the two others
+    assert checkouts[0] == 3 * 2 + 2
@@ -0,0 +1,192 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+import time
+from unittest import mock
+
+import pandas
+import pyarrow
+import pytest
+
+from data_validation import jobs
+
+REPORT_DF = pandas.DataFrame(
+    {
+        "validation_name": ["count", "sum__id", "max__id"],
+        "start_time": pandas.to_datetime(["2023-01-02 03:04:05"] * 3),
+    }
+)
+
+
+@pytest.fixture
+def module_under_test(monkeypatch, tmp_path):
+    from data_validation import app
+
+    monkeypatch.setattr(
+        app,
+        "job_manager",
+        jobs.JobManager(
+            lambda config: REPORT_DF, max_workers=1, result_directory=str(tmp_path)
+        ),
+    )
+    return app
+
+
+def _wait_for_job(client, location):
+    for _ in range(100):
+        status = client.get(location).get_json()
+        if status["status"] not in [jobs.JOB_STATUS_QUEUED, jobs.JOB_STATUS_RUNNING]:
+            return status
+        time.sleep(0.01)
+    raise TimeoutError(location)
+
+
+def test_iter_ndjson(module_under_test):
+    chunks = list(module_under_test._iter_ndjson(REPORT_DF, chunk_rows=2))
+
+    assert len(chunks) == 2
+    rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+    assert [row["validation_name"] for row in rows] == ["count", "sum__id", "max__id"]
+    assert rows[0]["start_time"] == "2023-01-02 03:04:05"
+
+
+def test_clean_dataframe(module_under_test):
+    timestamps = [
+        "2023-01-02",
+        "2023-01-02 03:04:05.5",
+        "2023-01-02 00:00:00.000000001",
+        None,
+    ]
+    df = pandas.DataFrame(
+        {
+            "naive": pandas.to_datetime(timestamps),
+            "aware": pandas.to_datetime(timestamps).tz_localize("America/New_York"),
+            "mixed": pandas.Series(
+                [pandas.Timestamp("2023-01-02"), "a", 1, None], dtype=object
+            ),
+            "value": [1.5, 2.0, None, 4.0],
+        }
+    )
+
+    rows = json.loads(module_under_test._clean_dataframe(df))
+
+    for column in ["naive", "aware"]:
+        assert [row[column] for row in rows[:3]] == [str(v) for v in df[column][:3]]
+        assert rows[3][column] is None
+    assert [row["mixed"] for row in rows] == ["2023-01-02 00:00:00", "a", 1, None]
+    assert rows[0]["value"] == 1.5
+    assert module_under_test._clean_dataframe(REPORT_DF.iloc[:0]) == "[]"
+
+
+def test_iter_json(module_under_test):
+    chunks = list(module_under_test._iter_json(REPORT_DF, chunk_rows=2))
+
+    assert len(chunks) == 4
+    assert "".join(chunks) == module_under_test._clean_dataframe(REPORT_DF)
+
+
+def test_job_results(module_under_test):
+    client = module_under_test.app.test_client()
+
+    response = client.post("/jobs", json={})
+    assert response.status_code == 202
+    status = _wait_for_job(client, response.headers["Location"])
+    assert status["status"] == jobs.JOB_STATUS_SUCCEEDED
+    assert status["rows"] == 3
+
+    results_url = f"/jobs/{status['job_id']}/results"
+    response = client.get(results_url)
+    assert response.content_type == "application/x-ndjson"
+    assert len(response.get_data(as_text=True).splitlines()) == 3
+    page = client.get(results_url, query_string={"offset": 1, "limit": 1})
+    assert [
+        json.loads(line)["validation_name"]
+        for line in page.get_data(as_text=True).splitlines()
+    ] == ["sum__id"]
+    # Reports read back from the job's file serialize as the original report
+    response = client.get(results_url, query_string={"format": "json"})
+    assert response.get_json() == json.loads(
+        module_under_test._clean_dataframe(REPORT_DF)
+    )
+
+
+@pytest.mark.parametrize("response_format", ["arrow", "parquet"])
+def test_job_results_columnar_formats(module_under_test, response_format):
+    client = module_under_test.app.test_client()
+    location = client.post("/jobs", json={}).headers["Location"]
+    _wait_for_job(client, location)
+
+    response = client.get(
+        f"{location}/results", query_string={"format": response_format}
+    )
+
+    assert (
+        response.content_type
+        == module_under_test.RESPONSE_CONTENT_TYPES[response_format]
+    )
+    body = io.BytesIO(response.get_data())
+    if response_format == "arrow":
+        result_df = pyarrow.ipc.open_stream(body).read_pandas()
+    else:
+        result_df = pandas.read_parquet(body)
+    pandas.testing.assert_frame_equal(result_df, REPORT_DF)
+
+
+def test_unknown_format(module_under_test):
+    client = module_under_test.app.test_client()
+    assert client.post("/", json={}, query_string={"format": "xml"}).status_code == 400
+
+
+def test_unknown_and_failed_jobs(module_under_test, monkeypatch, tmp_path):
+    def execute(config):
+        raise ValueError("Bad config")
+
+    monkeypatch.setattr(
+        module_under_test,
+        "job_manager",
+        jobs.JobManager(execute, max_workers=1, result_directory=str(tmp_path)),
+    )
+    client = module_under_test.app.test_client()
+
+    assert client.get("/jobs/unknown").status_code == 404
+    location = client.post("/jobs", json={}).headers["Location"]
+    status = _wait_for_job(client, location)
+    assert status["error"] == "Bad config"
+    assert client.get(f"{location}/results").status_code == 409
+
+
+def test_full_job_queue(module_under_test, monkeypatch, tmp_path):
+    job_manager = jobs.JobManager(
+        lambda config: REPORT_DF, max_queued_jobs=0, result_directory=str(tmp_path)
+    )
+    monkeypatch.setattr(module_under_test, "job_manager", job_manager)
+    client = module_under_test.app.test_client()
+
+    assert client.post("/jobs", json={}).status_code == 429
+
+
+def test_execute_validation_without_deep_bytes(module_under_test, monkeypatch):
+    validator = mock.Mock()
+    validator.handle_result.return_value = REPORT_DF
+    validator.run_metadata.spans = []
+    data_validation_class = mock.Mock(return_value=validator)
+    monkeypatch.setattr(
+        module_under_test.data_validation, "DataValidation", data_validation_class
+    )
+
+    assert module_under_test._execute_validation({}) is REPORT_DF
+    data_validation_class.assert_called_once_with({}, deep_bytes=False)
+    validator.config_manager.release_clients.assert_called_once()
@@ -355,6 +355,28 @@ def test_get_result_handler(test_input, expected):
     assert res == expected
 
 
+def test_get_result_handler_write_mode():
+    res = cli_tools.get_result_handler("project.dataset.table", write_mode="load")
+    assert res == {
+        "type": "BigQuery",
+        "project_id": "project",
+        "table_id": "dataset.table",
+        "write_mode": "load",
+    }
+
+
+def test_get_file_result_handler():
+    res = cli_tools.get_file_result_handler(
+        "gs://bucket/results", "jsonl", partition_by="run_id"
+    )
+    assert res == {
+        "type": "File",
+        "directory": "gs://bucket/results",
+        "file_format": "jsonl",
+        "partition_by": "run_id",
+    }
+
+
 @pytest.mark.parametrize(
     "test_input,expected",
     [
@@ -412,3 +434,62 @@ def test_split_table_err(
     """Test split table throws the right errors."""
     with pytest.raises(ValueError):
         cli_tools.split_table(test_input)
+
+
+def test_configure_arg_parser_parallelism():
+    """Test the parallelism arg is parsed and validated."""
+    parser = cli_tools.configure_arg_parser()
+    args = parser.parse_args(["configs", "run", "-cdir", "dir", "--parallelism", "4"])
+    assert args.parallelism == 4
+
+    args = parser.parse_args(["configs", "run", "-cdir", "dir"])
+    assert args.parallelism == 1
+
+    with pytest.raises(argparse.ArgumentTypeError):
+        cli_tools.positive_int("0")
+
+
+def test_configure_arg_parser_combiner():
+    """Test the combiner argument defaults to ibis and accepts native."""
+    parser = cli_tools.configure_arg_parser()
+    validate_args = [
+        "validate",
+        "column",
+        "-sc",
+        "my_conn",
+        "-tc",
+        "my_conn",
+        "-tbls",
+        "my_schema.my_table",
+    ]
+    args = parser.parse_args(validate_args)
+    assert args.combiner == "ibis"
+
+    args = parser.parse_args(validate_args + ["--combiner", "native"])
+    assert args.combiner == "native"
+
+
+@mock.patch("data_validation.clients.get_shared_data_client")
+@mock.patch("data_validation.state_manager.StateManager.get_connection_config")
+def test_get_pre_build_configs_no_cache(mock_get_connection, mock_get_client):
+    """Test --no-cache disables the query cache of validate commands."""
+    mock_get_connection.return_value = {"source_type": "Postgres"}
+    mock_get_client.return_value = mock.Mock(_source_type="Postgres")
+    parser = cli_tools.configure_arg_parser()
+    validate_args = [
+        "validate",
+        "column",
+        "-sc",
+        "my_conn",
+        "-tc",
+        "my_conn",
+        "-tbls",
+        "my_schema.my_table",
+        "--cache",
+    ]
+
+    args = parser.parse_args(validate_args)
+    assert cli_tools.get_pre_build_configs(args, "Column")[0]["cache"]
+
+    args = parser.parse_args(validate_args + ["--no-cache"])
+    assert not cli_tools.get_pre_build_configs(args, "Column")[0]["cache"]
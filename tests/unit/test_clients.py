@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 import pytest
 
@@ -91,3 +93,201 @@ def test_get_pandas_data_client(fs):
     ibis_client = clients.get_data_client(conn_config)
 
     assert isinstance(ibis_client, PandasClient)
+
+
+@mock.patch("data_validation.clients.get_data_client")
+def test_client_registry_shares_clients(mock_get_data_client):
+    """Test clients are shared per connection config until idle."""
+    now = [0]
+    mock_get_data_client.side_effect = lambda config: mock.Mock()
+    registry = clients.ClientRegistry(
+        idle_seconds=100, health_check_seconds=10, clock=lambda: now[0]
+    )
+
+    client = registry.get_client(ORACLE_CONN_CONFIG)
+    assert registry.get_client(dict(reversed(ORACLE_CONN_CONFIG.items()))) is client
+    assert registry.get_client({**ORACLE_CONN_CONFIG, "port": 1522}) is not client
+    assert mock_get_data_client.call_count == 2
+
+    # Checked out clients are never evicted.
+    now[0] = 150
+    assert registry.get_client(ORACLE_CONN_CONFIG) is client
+    for _ in range(3):
+        registry.release_client(client)
+    assert registry.get_stats() == {
+        "Oracle": {"checked_out": 1, "idle": 1, "checkouts": 1, "evictions": {}}
+    }
+
+    now[0] = 300
+    assert registry.get_client(ORACLE_CONN_CONFIG) is not client
+    assert mock_get_data_client.call_count == 3
+    assert registry.get_stats() == {
+        "Oracle": {
+            "checked_out": 2,
+            "idle": 0,
+            "checkouts": 2,
+            "evictions": {"idle": 1},
+        }
+    }
+
+
+@mock.patch("data_validation.clients._is_client_healthy", return_value=False)
+@mock.patch("data_validation.clients.get_data_client")
+def test_client_registry_replaces_unhealthy_clients(
+    mock_get_data_client, mock_is_healthy
+):
+    """Test unhealthy clients are replaced once the check interval passed."""
+    now = [0]
+    mock_get_data_client.side_effect = lambda config: mock.Mock()
+    registry = clients.ClientRegistry(
+        idle_seconds=100, health_check_seconds=10, clock=lambda: now[0]
+    )
+
+    client = registry.get_client(ORACLE_CONN_CONFIG)
+    now[0] = 5
+    assert registry.get_client(ORACLE_CONN_CONFIG) is client
+    mock_is_healthy.assert_not_called()
+
+    now[0] = 20
+    assert registry.get_client(ORACLE_CONN_CONFIG) is not client
+    mock_is_healthy.assert_called_once_with(client)
+
+
+@mock.patch("data_validation.clients._close_client")
+@mock.patch("data_validation.clients._is_client_healthy", return_value=False)
+@mock.patch("data_validation.clients.get_data_client")
+def test_client_registry_closes_unhealthy_clients_once_released(
+    mock_get_data_client, mock_is_healthy, mock_close_client
+):
+    """Test unhealthy clients in use are closed by their last release."""
+    now = [0]
+    mock_get_data_client.side_effect = lambda config: mock.Mock()
+    registry = clients.ClientRegistry(
+        idle_seconds=100, health_check_seconds=10, clock=lambda: now[0]
+    )
+
+    client = registry.get_client(ORACLE_CONN_CONFIG)
+    now[0] = 20
+    assert registry.get_client(ORACLE_CONN_CONFIG) is not client
+    mock_close_client.assert_not_called()
+
+    registry.release_client(client)
+    mock_close_client.assert_called_once_with(client)
+
+
+def test_client_registry_connects_outside_registry_lock():
+    """Test a slow connection does not block other connection configs."""
+    connecting = threading.Event()
+    connected = threading.Event()
+
+    def get_data_client(config):
+        if config.get("port") == 1522:
+            connecting.set()
+            connected.wait(5)
+        return mock.Mock()
+
+    registry = clients.ClientRegistry()
+    with mock.patch(
+        "data_validation.clients.get_data_client", side_effect=get_data_client
+    ):
+        with ThreadPoolExecutor() as executor:
+            slow_client = executor.submit(
+                registry.get_client, {**ORACLE_CONN_CONFIG, "port": 1522}
+            )
+            assert connecting.wait(5)
+            assert registry.get_client(ORACLE_CONN_CONFIG) is not None
+            assert not slow_client.done()
+            connected.set()
+            assert slow_client.result() is not None
+
+
+def test_client_registry_does_not_share_file_system_clients(fs):
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_DATA)
+    registry = clients.ClientRegistry()
+
+    client = registry.get_client(SOURCE_CONN_CONFIG)
+    assert isinstance(client, PandasClient)
+    assert registry.get_client(SOURCE_CONN_CONFIG) is not client
+
+
+def test_client_lookup_imports_lazily():
+    """Test backends are imported on first lookup only."""
+    lookup = clients._LazyClientLookup(
+        {
+            "Json": ("json", "dumps", None),
+            "Missing": ("no_such_backend", "Client", "pip install no-such-backend"),
+        }
+    )
+    assert "Missing" in lookup
+    assert sorted(lookup) == ["Json", "Missing"]
+
+    import json
+
+    assert lookup["Json"] is json.dumps
+    with pytest.raises(Exception, match="pip install no-such-backend"):
+        lookup["Missing"]()
+
+
+def test_client_lookup_source_types():
+    assert set(clients.CLIENT_LOOKUP) >= {"BigQuery", "FileSystem", "Postgres"}
+    assert clients.CLIENT_LOOKUP["FileSystem"] is clients.get_pandas_client
+
+
+@mock.patch.dict(
+    clients.CLIENT_CLASSES, {"Missing": ("no_such_backend.client", "Client")}
+)
+def test_get_client_class_of_unused_backend():
+    """Test no class is returned for backends that were never imported."""
+    assert clients.get_client_class("Missing") is None
+    assert not clients.is_oracle_client(_get_pandas_client())
+
+
+def _get_sqlite_client(tmp_path):
+    import sqlalchemy
+
+    db_path = str(tmp_path / "fetch.db")
+    engine = sqlalchemy.create_engine(f"sqlite:///{db_path}")
+    engine.execute("CREATE TABLE my_table (id INTEGER, name TEXT, value REAL)")
+    engine.execute(
+        "INSERT INTO my_table VALUES (1, 'a', 1.5), (2, NULL, NULL), (3, 'c', 2.0)"
+    )
+    return ibis.sqlite.connect(db_path)
+
+
+def test_iter_record_batches_streams_sqlalchemy_results(tmp_path):
+    client = _get_sqlite_client(tmp_path)
+    assert clients.supports_streaming(client)
+
+    batches = list(
+        clients.iter_record_batches(client, client.table(TABLE_NAME), batch_rows=2)
+    )
+
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert batches[0].schema.names == ["id", "name", "value"]
+    assert str(batches[0].schema.field("id").type) == "int64"
+    assert batches[0].column(1).to_pylist() == ["a", None]
+
+
+def test_iter_dataframes_matches_execute(tmp_path):
+    client = _get_sqlite_client(tmp_path)
+    table = client.table(TABLE_NAME)
+
+    chunks = list(clients.iter_dataframes(client, table, batch_rows=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    pandas.testing.assert_frame_equal(
+        pandas.concat(chunks, ignore_index=True), client.execute(table)
+    )
+
+
+def test_iter_dataframes_splits_pandas_results():
+    client = _get_pandas_client()
+    table = client.table(TABLE_NAME)
+    assert not clients.supports_streaming(client)
+
+    chunks = list(clients.iter_dataframes(client, table.union(table), batch_rows=1))
+
+    assert [len(chunk) for chunk in chunks] == [1, 1]
+    assert list(chunks[1].index) == [0]
+    batches = list(clients.iter_record_batches(client, table))
+    assert batches[0].to_pydict() == {"a": [1], "b": [2]}
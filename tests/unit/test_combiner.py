@@ -55,6 +55,20 @@ def module_under_test():
     return combiner
 
 
+@pytest.fixture(params=["ibis", "native"])
+def generate_report(request, module_under_test):
+    """Return a ``generate_report`` callable for each combiner implementation."""
+    if request.param == "ibis":
+        return module_under_test.generate_report
+
+    def generate_report_from_dataframes(client, run_metadata, source, target, **kwargs):
+        return module_under_test.generate_report_from_dataframes(
+            run_metadata, source.execute(), target.execute(), **kwargs
+        )
+
+    return generate_report_from_dataframes
+
+
 @pytest.fixture
 def patch_datetime_now(monkeypatch):
     class mydatetime:
@@ -65,7 +79,7 @@ def patch_datetime_now(monkeypatch):
     monkeypatch.setattr(datetime, "datetime", mydatetime)
 
 
-def test_generate_report_with_different_columns(module_under_test):
+def test_generate_report_with_different_columns(module_under_test, generate_report):
     source = pandas.DataFrame({"count": [1], "sum": [3]})
     target = pandas.DataFrame({"count": [2]})
     pandas_client = ibis.backends.pandas.connect(
@@ -77,7 +91,7 @@ def test_generate_report_with_different_columns(module_under_test):
     with pytest.raises(
         ValueError, match="Expected source and target to have same schema"
     ):
-        module_under_test.generate_report(
+        generate_report(
             pandas_client,
             # Schema validation occurs before run_metadata is needed.
             None,
@@ -86,7 +100,7 @@ def test_generate_report_with_different_columns(module_under_test):
         )
 
 
-def test_generate_report_with_too_many_rows(module_under_test):
+def test_generate_report_with_too_many_rows(module_under_test, generate_report):
     source = pandas.DataFrame({"count": [1, 1]})
     target = pandas.DataFrame({"count": [2, 2]})
     pandas_client = ibis.backends.pandas.connect(
@@ -96,7 +110,7 @@ def test_generate_report_with_too_many_rows(module_under_test):
         }
     )
 
-    report = module_under_test.generate_report(
+    report = generate_report(
         pandas_client,
         # Validation occurs before run_metadata is needed.
         EXAMPLE_RUN_METADATA,
@@ -348,12 +362,18 @@ def test_generate_report_with_too_many_rows(module_under_test):
     ),
 )
 def test_generate_report_without_group_by(
-    module_under_test, patch_datetime_now, source_df, target_df, run_metadata, expected
+    module_under_test,
+    generate_report,
+    patch_datetime_now,
+    source_df,
+    target_df,
+    run_metadata,
+    expected,
 ):
     pandas_client = ibis.backends.pandas.connect(
         {"test_source": source_df, "test_target": target_df}
     )
-    report = module_under_test.generate_report(
+    report = generate_report(
         pandas_client,
         run_metadata,
         source=pandas_client.table("test_source"),
@@ -597,6 +617,7 @@ def test_generate_report_without_group_by(
 )
 def test_generate_report_with_group_by(
     module_under_test,
+    generate_report,
     patch_datetime_now,
     source_df,
     target_df,
@@ -607,7 +628,7 @@ def test_generate_report_with_group_by(
     pandas_client = ibis.backends.pandas.connect(
         {"test_source": source_df, "test_target": target_df}
     )
-    report = module_under_test.generate_report(
+    report = generate_report(
         pandas_client,
         run_metadata,
         join_on_fields=join_on_fields,
@@ -905,12 +926,18 @@ def test_generate_report_with_group_by(
     ),
 )
 def test_generate_report_with_nan_agg_value(
-    module_under_test, patch_datetime_now, source_df, target_df, run_metadata, expected
+    module_under_test,
+    generate_report,
+    patch_datetime_now,
+    source_df,
+    target_df,
+    run_metadata,
+    expected,
 ):
     pandas_client = ibis.backends.pandas.connect(
         {"test_source": source_df, "test_target": target_df}
     )
-    report = module_under_test.generate_report(
+    report = generate_report(
         pandas_client,
         run_metadata,
         source=pandas_client.table("test_source"),
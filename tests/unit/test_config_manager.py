@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+
 import pytest
 
 from data_validation import consts
@@ -205,9 +207,7 @@ def test_get_threshold_property(module_under_test):
 
 
 def test_process_in_memory(module_under_test):
-    """Test process in memory for normal validations.
-    TODO: emceehilton Re-enable opposite test once option is available
-    """
+    """Test process in memory for normal validations."""
     config_manager = module_under_test.ConfigManager(
         SAMPLE_CONFIG, MockIbisClient(), MockIbisClient(), verbose=False
     )
@@ -215,21 +215,29 @@ def test_process_in_memory(module_under_test):
     assert config_manager.process_in_memory() is True
 
 
-# def test_do_not_process_in_memory(module_under_test):
-#     """Test process in memory for normal validations."""
-#     config_manager = module_under_test.ConfigManager(
-#         copy.deepcopy(SAMPLE_CONFIG), MockIbisClient(), MockIbisClient(), verbose=False
-#     )
-#     config_manager._config[consts.CONFIG_TYPE] = consts.ROW_VALIDATION
-#     config_manager._config[consts.CONFIG_PRIMARY_KEYS] = [
-#         {
-#             consts.CONFIG_FIELD_ALIAS: "id",
-#             consts.CONFIG_SOURCE_COLUMN: "id",
-#             consts.CONFIG_TARGET_COLUMN: "id",
-#             consts.CONFIG_CAST: None,
-#         },
-#     ]
-#     assert config_manager.process_in_memory() is True
+def test_do_not_process_in_memory(module_under_test):
+    """Test remote combine shares the client of a shared connection."""
+    config = copy.deepcopy(SAMPLE_CONFIG)
+    config[consts.CONFIG_PROCESS_IN_MEMORY] = False
+    config_manager = module_under_test.ConfigManager(
+        config, MockIbisClient(), MockIbisClient(), verbose=False
+    )
+
+    assert config_manager.target_client is config_manager.source_client
+    assert config_manager.process_in_memory() is False
+
+
+def test_process_in_memory_different_connections(module_under_test):
+    """Test remote combine falls back to memory across connections."""
+    config = copy.deepcopy(SAMPLE_CONFIG)
+    config[consts.CONFIG_PROCESS_IN_MEMORY] = False
+    config[consts.CONFIG_TARGET_CONN] = {"type": "Other connection"}
+    config_manager = module_under_test.ConfigManager(
+        config, MockIbisClient(), MockIbisClient(), verbose=False
+    )
+
+    assert config_manager.target_client is not config_manager.source_client
+    assert config_manager.process_in_memory() is True
 
 
 def test_get_table_info(module_under_test):
@@ -326,6 +334,23 @@ def test_get_result_handler(module_under_test):
     assert handler._table_id == "dataset.table_name"
 
 
+def test_get_file_result_handler(module_under_test):
+    config = copy.deepcopy(SAMPLE_CONFIG)
+    config[consts.CONFIG_RESULT_HANDLER] = {
+        consts.CONFIG_TYPE: "File",
+        consts.RESULT_DIRECTORY: "/tmp/dvt_results",
+        consts.RESULT_PARTITION_BY: "run_id",
+    }
+    config_manager = module_under_test.ConfigManager(
+        config, MockIbisClient(), MockIbisClient(), verbose=False
+    )
+    handler = config_manager.get_result_handler()
+
+    assert handler._directory == "/tmp/dvt_results"
+    assert handler._file_format == consts.RESULT_FILE_FORMAT_PARQUET
+    assert handler._partition_by == "run_id"
+
+
 def test_get_primary_keys_list(module_under_test):
     config_manager = module_under_test.ConfigManager(
         SAMPLE_CONFIG, MockIbisClient(), MockIbisClient(), verbose=False
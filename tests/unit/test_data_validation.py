@@ -12,15 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import hashlib
 import json
 import pandas
 import pytest
 import random
 from datetime import datetime, timedelta
+from unittest import mock
 
 import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
 
-from data_validation import consts
+from data_validation import consts, profiling, state_manager
 
 
 SOURCE_TABLE_FILE_PATH = "source_table_data.json"
@@ -506,6 +510,41 @@ def test_data_validation_client(module_under_test, fs):
     assert int(result_df.source_agg_value[0]) == 2
 
 
+def test_data_validation_remote_combine(module_under_test, fs):
+    """Test combining results with a single query on a shared connection."""
+    data = _generate_fake_data(rows=10, second_range=0)
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+
+    config = copy.deepcopy(SAMPLE_ROW_CONFIG)
+    config[consts.CONFIG_TARGET_CONN] = SOURCE_CONN_CONFIG
+    config[consts.CONFIG_PROCESS_IN_MEMORY] = False
+    client = module_under_test.DataValidation(config)
+    assert client.config_manager.process_in_memory() is False
+
+    result_df = client.execute()
+    assert len(result_df) == 20
+    assert set(result_df.validation_name) == {"int_value", "text_value"}
+    assert (result_df.validation_status == consts.VALIDATION_STATUS_SUCCESS).all()
+    assert (result_df.source_agg_value == result_df.target_agg_value).all()
+    assert set(result_df.group_by_columns) == {
+        '{"id": "%d"}' % row["id"] for row in data
+    }
+
+
+def test_data_validation_remote_combine_column(module_under_test, fs):
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_DATA)
+
+    config = copy.deepcopy(SAMPLE_CONFIG)
+    config[consts.CONFIG_TARGET_CONN] = SOURCE_CONN_CONFIG
+    config[consts.CONFIG_PROCESS_IN_MEMORY] = False
+    client = module_under_test.DataValidation(config)
+
+    with mock.patch.object(client, "_combine_in_memory", side_effect=AssertionError):
+        result_df = client.execute()
+    assert int(result_df.source_agg_value[0]) == 2
+    assert int(result_df.target_agg_value[0]) == 2
+
+
 def test_get_pandas_schema(module_under_test):
     """Test extracting pandas schema from dataframes for Ibis Pandas."""
     pandas_schema = module_under_test.DataValidation._get_pandas_schema(
@@ -714,6 +753,88 @@ def test_row_level_validation(module_under_test, fs):
     assert len(result_df) == 200
     assert len(str_comparison_df) == 100
     assert len(int_comparison_df) == 100
+    # Without profiling, fetches record rows and the bytes of string pointers
+    fetch_spans = [
+        run_span
+        for run_span in client.run_metadata.spans
+        if run_span.name == profiling.SPAN_FETCH
+    ]
+    assert [run_span.attributes["rows"] for run_span in fetch_spans] == [100, 100]
+    assert all(run_span.attributes["bytes"] > 0 for run_span in fetch_spans)
+
+
+def test_row_level_validation_deep_bytes(module_under_test, fs):
+    data = _generate_fake_data(rows=100, second_range=0)
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(data))
+
+    fetched_bytes = []
+    for deep_bytes in [False, True]:
+        client = module_under_test.DataValidation(
+            SAMPLE_ROW_CONFIG, deep_bytes=deep_bytes
+        )
+        client.execute()
+        fetched_bytes.append(
+            sum(
+                run_span.attributes["bytes"]
+                for run_span in client.run_metadata.spans
+                if run_span.name == profiling.SPAN_FETCH
+            )
+        )
+
+    # Strings are measured without profiling the validation
+    assert not client.profile
+    assert fetched_bytes[1] > fetched_bytes[0]
+
+
+def test_row_level_validation_profile(module_under_test, fs):
+    data = _generate_fake_data(rows=100, second_range=0)
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(data))
+
+    client = module_under_test.DataValidation(SAMPLE_ROW_CONFIG, profile=True)
+    client.execute()
+
+    profile_df = profiling.get_profile_df(client.run_metadata).set_index(
+        ["stage", "side"]
+    )
+    assert set(profile_df.index) == {
+        (profiling.SPAN_COMPILE, ""),
+        (profiling.SPAN_FETCH, consts.RESULT_TYPE_SOURCE),
+        (profiling.SPAN_FETCH, consts.RESULT_TYPE_TARGET),
+        (profiling.SPAN_COMBINE, ""),
+        (profiling.SPAN_VALIDATION, ""),
+        (profiling.SPAN_RESULT_HANDLER, ""),
+    }
+    assert (
+        profile_df.loc[(profiling.SPAN_FETCH, consts.RESULT_TYPE_SOURCE), "rows"] == 100
+    )
+    assert (
+        profile_df.loc[(profiling.SPAN_FETCH, consts.RESULT_TYPE_TARGET), "bytes"] > 0
+    )
+    assert profile_df.loc[(profiling.SPAN_COMBINE, ""), "rows"] == 200
+    assert client.run_metadata.process_peak_memory_mb > 0
+
+
+def test_write_profile(module_under_test, fs):
+    data = _generate_fake_data(rows=10, second_range=0)
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(data))
+    result_handler = mock.Mock()
+
+    client = module_under_test.DataValidation(
+        SAMPLE_ROW_CONFIG, result_handler=result_handler, profile=True
+    )
+    client.execute()
+    client.write_profile()
+
+    profile_df = result_handler.execute_profile.call_args[0][0]
+    assert list(profile_df.columns) == profiling.PROFILE_COLUMNS
+    assert (profile_df["run_id"] == client.run_metadata.run_id).all()
+    assert (
+        profile_df["process_peak_memory_mb"]
+        == client.run_metadata.process_peak_memory_mb
+    ).all()
 
 
 def test_fail_row_level_validation(module_under_test, fs):
@@ -728,6 +849,295 @@ def test_fail_row_level_validation(module_under_test, fs):
     assert len(fail_df) == 5
 
 
+def test_native_combiner_row_level_validation(module_under_test, fs):
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_PK_DATA)
+    _create_table_file(TARGET_TABLE_FILE_PATH, JSON_PK_BAD_DATA)
+
+    ibis_df = module_under_test.DataValidation(SAMPLE_JSON_ROW_CONFIG).execute()
+    native_config = copy.deepcopy(SAMPLE_JSON_ROW_CONFIG)
+    native_config[consts.CONFIG_COMBINER] = consts.COMBINER_NATIVE
+    native_df = module_under_test.DataValidation(native_config).execute()
+
+    sort_columns = ["validation_name", "group_by_columns"]
+    compare_columns = [
+        "validation_name",
+        "group_by_columns",
+        "source_agg_value",
+        "target_agg_value",
+        "validation_status",
+    ]
+    ibis_df = ibis_df.sort_values(sort_columns).reset_index(drop=True)
+    native_df = native_df.sort_values(sort_columns).reset_index(drop=True)
+    assert list(native_df.columns) == list(ibis_df.columns)
+    pandas.testing.assert_frame_equal(
+        native_df[compare_columns], ibis_df[compare_columns]
+    )
+
+
+def test_streaming_row_level_validation(module_under_test, fs):
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_PK_DATA)
+    _create_table_file(TARGET_TABLE_FILE_PATH, JSON_PK_BAD_DATA)
+
+    in_memory_df = module_under_test.DataValidation(SAMPLE_JSON_ROW_CONFIG).execute()
+    streaming_config = copy.deepcopy(SAMPLE_JSON_ROW_CONFIG)
+    streaming_config[consts.CONFIG_MEMORY_BUDGET_MB] = 1
+    result_handler = mock.Mock()
+    result_handler.execute.side_effect = lambda result_df: result_df
+    with mock.patch(
+        "data_validation.streaming_compare.num_partitions_for_budget",
+        return_value=3,
+    ):
+        streaming_validator = module_under_test.DataValidation(
+            streaming_config, profile=True
+        )
+        streaming_df = streaming_validator.get_result_df()
+        executed_df = module_under_test.DataValidation(
+            streaming_config, result_handler=result_handler
+        ).execute()
+
+    # execute passes each partition report to the result handler on its own
+    assert len(executed_df) == 0
+    partition_dfs = [call.args[0] for call in result_handler.execute.call_args_list]
+    assert 1 < len(partition_dfs) <= 3
+    assert sum(len(partition_df) for partition_df in partition_dfs) == len(in_memory_df)
+
+    # Rows streamed from each side are recorded as fetch spans
+    profile_df = profiling.get_profile_df(streaming_validator.run_metadata)
+    fetch_df = profile_df[profile_df["stage"] == profiling.SPAN_FETCH].set_index("side")
+    assert set(fetch_df.index) == {
+        consts.RESULT_TYPE_SOURCE,
+        consts.RESULT_TYPE_TARGET,
+    }
+    assert (fetch_df["rows"] > 0).all()
+    assert (fetch_df["bytes"] > 0).all()
+
+    sort_columns = ["validation_name", "group_by_columns"]
+    compare_columns = [
+        "validation_name",
+        "group_by_columns",
+        "source_agg_value",
+        "target_agg_value",
+        "validation_status",
+    ]
+    in_memory_df = in_memory_df.sort_values(sort_columns).reset_index(drop=True)
+    streaming_df = streaming_df.sort_values(sort_columns).reset_index(drop=True)
+    pandas.testing.assert_frame_equal(
+        streaming_df[compare_columns], in_memory_df[compare_columns]
+    )
+
+
+def test_merkle_row_level_validation(module_under_test, fs):
+    data = [
+        {"id": i, "text_value": hashlib.sha256(str(i).encode()).hexdigest()}
+        for i in range(200)
+    ]
+    target_data = copy.deepcopy(data)
+    target_data[7]["text_value"] = hashlib.sha256(b"changed").hexdigest()
+    target_data.append({"id": 200, "text_value": hashlib.sha256(b"200").hexdigest()})
+    _create_table_file(SOURCE_TABLE_FILE_PATH, json.dumps(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, json.dumps(target_data))
+
+    config = copy.deepcopy(SAMPLE_ROW_CONFIG)
+    config[consts.CONFIG_COMPARISON_FIELDS] = config[consts.CONFIG_COMPARISON_FIELDS][
+        1:
+    ]
+    config[consts.CONFIG_MERKLE] = True
+    result_df = module_under_test.DataValidation(config).execute()
+
+    prefixes = {
+        data[7]["text_value"][:2],
+        target_data[7]["text_value"][:2],
+        target_data[200]["text_value"][:2],
+    }
+    fail_df = result_df[result_df["validation_status"] == consts.VALIDATION_STATUS_FAIL]
+    assert len(fail_df) == 2
+    assert data[7]["text_value"] in list(fail_df["source_agg_value"])
+
+    summary_row, row_df = result_df.iloc[0], result_df.iloc[1:]
+    assert summary_row["aggregation_type"] == consts.CONFIG_MERKLE
+    assert summary_row["validation_status"] == consts.VALIDATION_STATUS_SUCCESS
+    # Both sides count their rows outside of the buckets compared row by row
+    source_rows = row_df["source_agg_value"].notnull().sum()
+    target_rows = row_df["target_agg_value"].notnull().sum()
+    assert int(summary_row["source_agg_value"]) == len(data) - source_rows
+    assert int(summary_row["target_agg_value"]) == len(target_data) - target_rows
+    assert 1 < len(row_df) < len(data)
+    assert set(row_df["source_agg_value"].dropna().str[:2]) <= prefixes
+
+
+def test_merkle_row_level_validation_identical_tables(module_under_test, fs):
+    data = [
+        {"id": i, "text_value": hashlib.sha256(str(i).encode()).hexdigest()}
+        for i in range(200)
+    ]
+    _create_table_file(SOURCE_TABLE_FILE_PATH, json.dumps(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, json.dumps(data))
+
+    config = copy.deepcopy(SAMPLE_ROW_CONFIG)
+    config[consts.CONFIG_COMPARISON_FIELDS] = config[consts.CONFIG_COMPARISON_FIELDS][
+        1:
+    ]
+    config[consts.CONFIG_MERKLE] = True
+    result_df = module_under_test.DataValidation(config).execute()
+
+    assert len(result_df) == 1
+    assert result_df["aggregation_type"].iloc[0] == consts.CONFIG_MERKLE
+    assert result_df["source_agg_value"].iloc[0] == "200"
+    assert result_df["target_agg_value"].iloc[0] == "200"
+    assert (result_df["validation_status"] == consts.VALIDATION_STATUS_SUCCESS).all()
+
+
+def _get_fingerprint_config():
+    config = copy.deepcopy(SAMPLE_ROW_CONFIG)
+    config[consts.CONFIG_COMPARISON_FIELDS] = config[consts.CONFIG_COMPARISON_FIELDS][
+        1:
+    ]
+    config[consts.CONFIG_FINGERPRINT] = True
+    return config
+
+
+def test_fingerprint_row_level_validation(module_under_test, fs):
+    data = [
+        {"id": i, "text_value": hashlib.sha256(str(i).encode()).hexdigest()}
+        for i in range(20)
+    ]
+    _create_table_file(SOURCE_TABLE_FILE_PATH, json.dumps(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, json.dumps(data[::-1]))
+
+    result_df = module_under_test.DataValidation(_get_fingerprint_config()).execute()
+
+    assert len(result_df) == 1
+    assert result_df["aggregation_type"][0] == consts.CONFIG_FINGERPRINT
+    assert result_df["validation_status"][0] == consts.VALIDATION_STATUS_SUCCESS
+    assert result_df["source_agg_value"][0].startswith("20:")
+
+
+def test_fail_fingerprint_row_level_validation(module_under_test, fs):
+    data = [
+        {"id": i, "text_value": hashlib.sha256(str(i).encode()).hexdigest()}
+        for i in range(20)
+    ]
+    target_data = copy.deepcopy(data)
+    target_data[3]["text_value"] = hashlib.sha256(b"changed").hexdigest()
+    _create_table_file(SOURCE_TABLE_FILE_PATH, json.dumps(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, json.dumps(target_data))
+
+    result_df = module_under_test.DataValidation(_get_fingerprint_config()).execute()
+
+    fail_df = result_df[result_df["validation_status"] == consts.VALIDATION_STATUS_FAIL]
+    assert list(fail_df["aggregation_type"]) == [consts.CONFIG_FINGERPRINT, None]
+    assert fail_df["source_agg_value"].iloc[1] == data[3]["text_value"]
+    assert len(result_df) == 21
+
+
+def test_recursive_validation_batches_failed_groups(module_under_test, fs):
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_PK_DATA)
+    _create_table_file(TARGET_TABLE_FILE_PATH, JSON_PK_DATA)
+
+    config = copy.deepcopy(SAMPLE_JSON_ROW_CONFIG)
+    config[consts.CONFIG_GROUPED_COLUMNS] = [
+        {
+            consts.CONFIG_FIELD_ALIAS: "col_a",
+            consts.CONFIG_SOURCE_COLUMN: "col_a",
+            consts.CONFIG_TARGET_COLUMN: "col_a",
+            consts.CONFIG_CAST: None,
+        }
+    ]
+    grouped_df = pandas.DataFrame(
+        {
+            consts.GROUP_BY_COLUMNS: [
+                '{"col_a": "0"}',
+                '{"col_a": "1"}',
+                '{"col_a": "2"}',
+            ],
+            consts.AGGREGATION_TYPE: ["hash"] * 3,
+            consts.SOURCE_AGG_VALUE: ["a", "b", "c"],
+            consts.TARGET_AGG_VALUE: ["a", "x", "y"],
+        }
+    )
+    rows_df = pandas.DataFrame({consts.GROUP_BY_COLUMNS: ['{"pkey": "1"}']})
+    client = module_under_test.DataValidation(config)
+    with mock.patch.object(
+        client, "_execute_validation", side_effect=[grouped_df, rows_df]
+    ) as execute_validation:
+        result_df = client.get_result_df()
+
+    # One query for the group level and one for all failed groups.
+    assert execute_validation.call_count == 2
+    recursive_builder = execute_validation.call_args_list[1][0][0]
+    isin_filter = recursive_builder.source_builder.filters[-1]
+    assert isin_filter.left_field == "col_a"
+    assert list(isin_filter.right) == ["1", "2"]
+    assert list(result_df[consts.GROUP_BY_COLUMNS]) == [
+        '{"col_a": "0"}',
+        '{"pkey": "1"}',
+    ]
+
+
+def test_recursive_validation_levels_share_workers(module_under_test, fs):
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_PK_DATA)
+    _create_table_file(TARGET_TABLE_FILE_PATH, JSON_PK_DATA)
+
+    config = copy.deepcopy(SAMPLE_JSON_ROW_CONFIG)
+    config[consts.CONFIG_GROUPED_COLUMNS] = [
+        {
+            consts.CONFIG_FIELD_ALIAS: alias,
+            consts.CONFIG_SOURCE_COLUMN: alias,
+            consts.CONFIG_TARGET_COLUMN: alias,
+            consts.CONFIG_CAST: None,
+        }
+        for alias in ["col_a", "col_b"]
+    ]
+    config[consts.CONFIG_RECURSIVE_BATCH_SIZE] = 1
+
+    def get_grouped_df(group_keys, target_values):
+        return pandas.DataFrame(
+            {
+                consts.GROUP_BY_COLUMNS: group_keys,
+                consts.AGGREGATION_TYPE: ["hash"] * len(group_keys),
+                consts.SOURCE_AGG_VALUE: ["a"] * len(group_keys),
+                consts.TARGET_AGG_VALUE: target_values,
+            }
+        )
+
+    def execute_validation(validation_builder, process_in_memory=True):
+        group_aliases = validation_builder.get_group_aliases()
+        if group_aliases == ["col_a"]:
+            return get_grouped_df(
+                ['{"col_a": "0"}', '{"col_a": "1"}', '{"col_a": "2"}'],
+                ["a", "x", "x"],
+            )
+        filters = {
+            query_filter.left_field: query_filter.right[0]
+            for query_filter in validation_builder.source_builder.filters
+        }
+        if "col_b" not in filters:
+            return get_grouped_df(
+                ['{"col_a": "%s", "col_b": "b"}' % filters["col_a"]], ["x"]
+            )
+        return pandas.DataFrame(
+            {consts.GROUP_BY_COLUMNS: ['{"pkey": "%s"}' % filters["col_a"]]}
+        )
+
+    client = module_under_test.DataValidation(config)
+    with mock.patch.object(
+        client, "_execute_validation", side_effect=execute_validation
+    ), mock.patch.object(
+        module_under_test,
+        "ThreadPoolExecutor",
+        wraps=module_under_test.ThreadPoolExecutor,
+    ) as thread_pool_executor:
+        result_df = client.get_result_df()
+
+    # Every level runs on the same pool of workers.
+    assert thread_pool_executor.call_count == 1
+    assert list(result_df[consts.GROUP_BY_COLUMNS]) == [
+        '{"col_a": "0"}',
+        '{"pkey": "1"}',
+        '{"pkey": "2"}',
+    ]
+
+
 def test_bad_join_row_level_validation(module_under_test, fs):
     data = _generate_fake_data(rows=100, second_range=0)
     target_data = _generate_fake_data(initial_id=100, rows=1, second_range=0)
@@ -767,3 +1177,163 @@ def test_random_row_level_validation(module_under_test, fs):
     assert result_df["difference"].sum() == 0
     assert ids != [i for i in range(10)]
     assert ids != [i for i in range(90, 100)]
+
+
+def _get_composite_key_random_row_config():
+    config = copy.deepcopy(SAMPLE_ROW_CONFIG)
+    config[consts.CONFIG_PRIMARY_KEYS].append(
+        {
+            consts.CONFIG_FIELD_ALIAS: "text_constant",
+            consts.CONFIG_SOURCE_COLUMN: "text_constant",
+            consts.CONFIG_TARGET_COLUMN: "text_constant",
+            consts.CONFIG_CAST: None,
+        }
+    )
+    config[consts.CONFIG_USE_RANDOM_ROWS] = True
+    config[consts.CONFIG_RANDOM_ROW_BATCH_SIZE] = 10
+    config[consts.CONFIG_RECURSIVE_BATCH_SIZE] = 3
+    return config
+
+
+def test_composite_key_random_row_level_validation(module_under_test, fs):
+    data = _generate_fake_data(rows=100, second_range=0)
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(data))
+
+    client = module_under_test.DataValidation(_get_composite_key_random_row_config())
+    with mock.patch.object(
+        client, "_execute_validation", wraps=client._execute_validation
+    ) as execute_validation:
+        result_df = client.execute()
+
+    # Batches of 3 keys of id, all sharing the value of text_constant
+    assert execute_validation.call_count == 4
+    batch_builder = execute_validation.call_args_list[0][0][0]
+    equal_filter, isin_filter = batch_builder.source_builder.filters[-2:]
+    assert equal_filter.left_field == "text_constant"
+    assert isin_filter.left_field == "id"
+    assert len(isin_filter.right) == 3
+
+    ids = {json.loads(key)["id"] for key in result_df["group_by_columns"]}
+    assert len(ids) == 10
+    assert len(result_df) == 20
+    assert (result_df["validation_status"] == consts.VALIDATION_STATUS_SUCCESS).all()
+
+
+def test_column_validation_random_rows_in_batches(module_under_test, fs):
+    data = _generate_fake_data(rows=100, second_range=0)
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(data))
+    config = copy.deepcopy(SAMPLE_CONFIG)
+    config[consts.CONFIG_AGGREGATES] = [
+        {
+            consts.CONFIG_SOURCE_COLUMN: "id",
+            consts.CONFIG_TARGET_COLUMN: "id",
+            consts.CONFIG_FIELD_ALIAS: "count_id",
+            consts.CONFIG_TYPE: "count",
+        }
+    ]
+    config[consts.CONFIG_PRIMARY_KEYS] = SAMPLE_ROW_CONFIG[consts.CONFIG_PRIMARY_KEYS]
+    config[consts.CONFIG_USE_RANDOM_ROWS] = True
+    config[consts.CONFIG_RANDOM_ROW_BATCH_SIZE] = 10
+    config[consts.CONFIG_RECURSIVE_BATCH_SIZE] = 3
+
+    client = module_under_test.DataValidation(config)
+    result_df = client.execute()
+
+    # The 10 sampled ids are filtered in IN-lists of at most 3 ids
+    isin_filter = client.validation_builder.source_builder.filters[-1]
+    predicate = isin_filter.compile(
+        client.config_manager.source_client.table("my_table")
+    )
+    assert isinstance(predicate.op(), ops.Or)
+    assert len(isin_filter.right) == 10
+    assert result_df["source_agg_value"].astype(int).tolist() == [10]
+    assert (result_df["validation_status"] == consts.VALIDATION_STATUS_SUCCESS).all()
+
+
+def test_random_row_batches_of_unique_composite_keys(module_under_test, fs):
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_PK_DATA)
+    _create_table_file(TARGET_TABLE_FILE_PATH, JSON_PK_DATA)
+    config = _get_composite_key_random_row_config()
+    config[consts.CONFIG_MAX_RECURSIVE_WORKERS] = 1
+    client = module_under_test.DataValidation(config)
+    random_rows = pandas.DataFrame(
+        {"id": range(10), "text_constant": [str(i) for i in range(10)]}
+    )
+    with mock.patch.object(client, "_get_random_rows", return_value=random_rows):
+        random_row_batches = client._get_random_row_batches()
+
+    # One batch per key would be too many queries, so batches select the
+    # sampled values of one primary key only.
+    assert random_row_batches == [
+        ({}, {"id": [0, 1, 2]}),
+        ({}, {"id": [3, 4, 5]}),
+        ({}, {"id": [6, 7, 8]}),
+        ({}, {"id": [9]}),
+    ]
+
+
+def test_incremental_cumulative_validation(module_under_test, fs):
+    """Test that incremental runs only validate new rows and roll them up."""
+    config = copy.deepcopy(SAMPLE_CONFIG)
+    config[consts.CONFIG_INCREMENTAL_COLUMN] = "pkey"
+    config[consts.CONFIG_CUMULATIVE] = True
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_PK_DATA)
+    _create_table_file(TARGET_TABLE_FILE_PATH, JSON_PK_DATA)
+
+    client = module_under_test.DataValidation(config)
+    result_df = client.execute()
+    assert list(result_df.source_agg_value) == ["2", "2"]
+    assert client._incremental_watermark == 2
+
+    new_rows = """[{"pkey":1, "col_a":1,"col_b":"a"},{"pkey":2, "col_a":1,"col_b":"b"},{"pkey":3, "col_a":1,"col_b":null}]"""
+    _create_table_file(SOURCE_TABLE_FILE_PATH, new_rows)
+    _create_table_file(TARGET_TABLE_FILE_PATH, new_rows)
+
+    client = module_under_test.DataValidation(config)
+    result_df = client.execute().set_index("validation_name")
+    assert client._incremental_watermark == 3
+    assert result_df.source_agg_value["count_col_a"] == "3"
+    assert result_df.source_agg_value["count_col_b"] == "2"
+    assert (result_df.validation_status == consts.VALIDATION_STATUS_SUCCESS).all()
+
+
+def test_incremental_validation_failure_keeps_watermark(module_under_test, fs):
+    """Test failed runs do not advance the watermark, which is the max of
+    both sides."""
+    config = copy.deepcopy(SAMPLE_CONFIG)
+    config[consts.CONFIG_INCREMENTAL_COLUMN] = "pkey"
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_PK_DATA)
+    _create_table_file(TARGET_TABLE_FILE_PATH, JSON_PK_BAD_DATA)
+
+    client = module_under_test.DataValidation(config)
+    result_df = client.execute()
+    assert (result_df.validation_status == consts.VALIDATION_STATUS_FAIL).any()
+    assert client._incremental_watermark == 5
+    assert (
+        state_manager.StateManager().get_validation_state(
+            client.config_manager.incremental_name
+        )
+        is None
+    )
+
+
+@mock.patch("data_validation.query_cache.QueryCache")
+def test_column_validation_uses_query_cache(mock_cache, module_under_test, fs):
+    """Test aggregate queries run through the query cache when enabled."""
+    _create_table_file(SOURCE_TABLE_FILE_PATH, JSON_DATA)
+    _create_table_file(TARGET_TABLE_FILE_PATH, JSON_DATA)
+    config = copy.deepcopy(SAMPLE_CONFIG)
+    config[consts.CONFIG_CACHE] = True
+    config[consts.CONFIG_CACHE_TTL] = 600
+    mock_cache.return_value.execute.side_effect = (
+        lambda client, conn, query, version=None: client.execute(query)
+    )
+
+    client = module_under_test.DataValidation(config)
+    result_df = client.execute()
+
+    assert int(result_df.source_agg_value[0]) == 2
+    mock_cache.assert_called_with(ttl_seconds=600)
+    assert mock_cache.return_value.execute.call_count == 2
@@ -0,0 +1,88 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import decimal
+
+import pandas
+import pytest
+
+from data_validation import consts
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation import incremental
+
+    return incremental
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        5,
+        2.5,
+        "abc",
+        decimal.Decimal("1.10"),
+        datetime.date(2023, 1, 2),
+        datetime.datetime(2023, 1, 2, 3, 4, 5, 6),
+    ],
+)
+def test_encode_decode_watermark(module_under_test, value):
+    encoded = module_under_test.encode_watermark(value)
+    assert module_under_test.decode_watermark(*encoded) == value
+
+
+def test_roll_up_results(module_under_test):
+    result_df = pandas.DataFrame(
+        {
+            "validation_name": ["count", "max__ts", "avg__x"],
+            "aggregation_type": ["count", "max", "avg"],
+            "group_by_columns": [None, None, None],
+            "source_agg_value": ["2", "2023-01-01", "1.5"],
+            "target_agg_value": ["1", "2023-01-01", "1.5"],
+            "difference": [-1.0, None, 0.0],
+            "pct_difference": [-50.0, None, 0.0],
+            "pct_threshold": [0.0, 0.0, 0.0],
+            "validation_status": [
+                consts.VALIDATION_STATUS_FAIL,
+                consts.VALIDATION_STATUS_FAIL,
+                consts.VALIDATION_STATUS_SUCCESS,
+            ],
+        }
+    )
+    cumulative = {
+        "count": {
+            "aggregation_type": "count",
+            "source_agg_value": "8",
+            "target_agg_value": "9",
+        },
+        "max__ts": {
+            "aggregation_type": "max",
+            "source_agg_value": "2022-12-31",
+            "target_agg_value": "2023-01-02",
+        },
+    }
+
+    rolled_df, new_cumulative = module_under_test.roll_up_results(result_df, cumulative)
+
+    assert list(rolled_df.source_agg_value) == ["10", "2023-01-01", "1.5"]
+    assert list(rolled_df.target_agg_value) == ["10", "2023-01-02", "1.5"]
+    assert list(rolled_df.validation_status) == [
+        consts.VALIDATION_STATUS_SUCCESS,
+        consts.VALIDATION_STATUS_FAIL,
+        consts.VALIDATION_STATUS_SUCCESS,
+    ]
+    assert rolled_df.difference[0] == 0.0
+    assert set(new_cumulative) == {"count", "max__ts"}
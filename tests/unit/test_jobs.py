@@ -0,0 +1,138 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+import pandas
+import pytest
+
+from data_validation.exceptions import JobQueueFull
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation import jobs
+
+    return jobs
+
+
+def _execute(config):
+    if config.get("fail"):
+        raise ValueError("Bad config")
+    return pandas.DataFrame({"id": range(config["rows"])})
+
+
+def test_job_succeeds(module_under_test, tmp_path):
+    manager = module_under_test.JobManager(
+        _execute, max_workers=2, result_directory=str(tmp_path)
+    )
+    job = manager.submit({"rows": 3})
+    manager.shutdown()
+
+    assert manager.get(job.job_id) is job
+    assert job.status == module_under_test.JOB_STATUS_SUCCEEDED
+    status = job.to_dict()
+    assert status["rows"] == 3
+    assert status["start_time"] <= status["end_time"]
+    # The report is spilled to a file instead of being kept in memory
+    assert job.result_path == str(tmp_path / f"{job.job_id}.parquet")
+    assert not hasattr(job, "result_df")
+
+
+def test_iter_results_pages_row_groups(module_under_test, tmp_path, monkeypatch):
+    monkeypatch.setattr(module_under_test, "RESULT_ROW_GROUP_ROWS", 4)
+    manager = module_under_test.JobManager(_execute, result_directory=str(tmp_path))
+    job = manager.submit({"rows": 10})
+    manager.shutdown()
+
+    def read_ids(**kwargs):
+        return [
+            row["id"]
+            for batch in job.iter_results(**kwargs)
+            for row in batch.to_pylist()
+        ]
+
+    assert job.get_result_schema().names == ["id"]
+    assert read_ids() == list(range(10))
+    assert read_ids(offset=3, limit=6) == list(range(3, 9))
+    assert read_ids(offset=8, limit=5) == [8, 9]
+    assert read_ids(offset=12) == []
+
+
+def test_job_fails(module_under_test, tmp_path):
+    manager = module_under_test.JobManager(_execute, result_directory=str(tmp_path))
+    job = manager.submit({"fail": True})
+    manager.shutdown()
+
+    assert job.status == module_under_test.JOB_STATUS_FAILED
+    assert job.error == "Bad config"
+    assert job.to_dict()["rows"] is None
+
+
+def test_jobs_queue_beyond_max_workers(module_under_test, tmp_path):
+    release = threading.Event()
+
+    def execute(config):
+        release.wait(timeout=10)
+        return _execute(config)
+
+    manager = module_under_test.JobManager(
+        execute, max_workers=1, result_directory=str(tmp_path)
+    )
+    first_job = manager.submit({"rows": 1})
+    second_job = manager.submit({"rows": 1})
+
+    assert second_job.status == module_under_test.JOB_STATUS_QUEUED
+    release.set()
+    manager.shutdown()
+    assert first_job.status == module_under_test.JOB_STATUS_SUCCEEDED
+    assert second_job.status == module_under_test.JOB_STATUS_SUCCEEDED
+
+
+def test_submissions_beyond_max_queued_jobs_are_rejected(module_under_test, tmp_path):
+    release = threading.Event()
+
+    def execute(config):
+        release.wait(timeout=10)
+        return _execute(config)
+
+    manager = module_under_test.JobManager(
+        execute, max_workers=1, max_queued_jobs=1, result_directory=str(tmp_path)
+    )
+    running_job = manager.submit({"rows": 1})
+    while running_job.status == module_under_test.JOB_STATUS_QUEUED:
+        time.sleep(0.01)
+    manager.submit({"rows": 1})
+
+    with pytest.raises(JobQueueFull):
+        manager.submit({"rows": 1})
+    release.set()
+    manager.shutdown()
+
+
+def test_oldest_finished_jobs_are_evicted(module_under_test, tmp_path):
+    manager = module_under_test.JobManager(
+        _execute, max_workers=1, max_finished_jobs=2, result_directory=str(tmp_path)
+    )
+    jobs = [manager.submit({"rows": 1}) for _ in range(3)]
+    manager.shutdown()
+
+    assert manager.get(jobs[0].job_id) is None
+    assert manager.get(jobs[1].job_id) is not None
+    assert manager.get(jobs[2].job_id) is not None
+    # Report files of evicted jobs are removed
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        f"{job.job_id}.parquet" for job in jobs[1:]
+    )
@@ -0,0 +1,47 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation import key_hash
+
+    return key_hash
+
+
+def test_get_key_hash_sql_of_null_keys(module_under_test):
+    """Test rows with a NULL key are not hashed, as Oracle joins NULL as ''."""
+    key_hash_sql = module_under_test.get_key_hash_sql("Oracle", ["id", "name"])
+
+    assert key_hash_sql.startswith(
+        "CASE WHEN id IS NULL OR name IS NULL THEN NULL ELSE "
+    )
+    assert key_hash_sql.endswith(" END")
+
+
+def test_get_key_hash_sql_hashes_utf8_on_mssql(module_under_test):
+    """Test SQL Server keys are hashed as UTF-8, like on other engines."""
+    key_hash_sql = module_under_test.get_key_hash_sql("MSSQL", ["name"])
+
+    assert (
+        "HASHBYTES('MD5', CAST(CAST(name AS NVARCHAR(4000)) "
+        "COLLATE Latin1_General_100_BIN2_UTF8 AS VARCHAR(4000)))"
+    ) in key_hash_sql
+
+
+def test_get_key_hash_sql_of_unsupported_source_type(module_under_test):
+    with pytest.raises(ValueError):
+        module_under_test.get_key_hash_sql("Teradata", ["id"])
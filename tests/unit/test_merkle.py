@@ -0,0 +1,131 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+
+import ibis
+import pandas
+import pytest
+
+
+def _get_hash_df(values):
+    return pandas.DataFrame(
+        {
+            "id": range(len(values)),
+            "hash__all": [hashlib.sha256(str(v).encode()).hexdigest() for v in values],
+        }
+    )
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation import merkle
+
+    return merkle
+
+
+def _get_table(df):
+    return ibis.pandas.connect({"my_table": df}).table("my_table")
+
+
+def test_get_hash_column(module_under_test):
+    table = _get_table(_get_hash_df(range(3)))
+    assert module_under_test.get_hash_column(table, ["id"]) == "hash__all"
+
+
+def test_get_hash_column_requires_string_hash(module_under_test):
+    table = _get_table(pandas.DataFrame({"id": [1], "int_value": [2]}))
+    with pytest.raises(ValueError):
+        module_under_test.get_hash_column(table, ["id"])
+
+
+def test_get_bucket_query(module_under_test):
+    df = _get_hash_df(range(50))
+    bucket_df = module_under_test.get_bucket_query(
+        _get_table(df), "hash__all", 1
+    ).execute()
+
+    buckets = df["hash__all"].str[:1]
+    assert sorted(bucket_df["merkle_bucket"]) == sorted(buckets.unique())
+    assert bucket_df["merkle_count"].sum() == 50
+    digits = module_under_test.DIGEST_HEX_DIGITS
+    for pos in range(module_under_test.DIGEST_SLICES):
+        expected_digest = (
+            df["hash__all"]
+            .str[64 - digits * (pos + 1) : 64 - digits * pos]
+            .apply(lambda h: int(h, 16))
+            .sum()
+        )
+        assert bucket_df[f"merkle_digest_{pos}"].sum() == expected_digest
+
+
+def test_get_bucket_query_splits_parent_buckets(module_under_test):
+    df = _get_hash_df(range(50))
+    parent = df["hash__all"][0][:2]
+    bucket_df = module_under_test.get_bucket_query(
+        _get_table(df), "hash__all", 4, parent_buckets=[parent]
+    ).execute()
+
+    assert all(bucket.startswith(parent) for bucket in bucket_df["merkle_bucket"])
+    assert bucket_df["merkle_count"].sum() == (df["hash__all"].str[:2] == parent).sum()
+
+
+def test_get_differing_buckets(module_under_test):
+    source_df = _get_hash_df(range(50))
+    target_df = _get_hash_df(list(range(49)) + ["changed"])
+    source_buckets = module_under_test.get_bucket_query(
+        _get_table(source_df), "hash__all", 2
+    ).execute()
+    target_buckets = module_under_test.get_bucket_query(
+        _get_table(target_df), "hash__all", 2
+    ).execute()
+
+    buckets, row_count = module_under_test.get_differing_buckets(
+        source_buckets, target_buckets
+    )
+
+    expected = {source_df["hash__all"][49][:2], target_df["hash__all"][49][:2]}
+    assert buckets == sorted(expected)
+    assert row_count >= len(expected)
+
+    leaf_df = module_under_test.get_leaf_query(
+        _get_table(target_df), "hash__all", 2, buckets
+    ).execute()
+    assert 49 in list(leaf_df["id"])
+
+
+def test_get_differing_buckets_of_equal_tables(module_under_test):
+    bucket_df = module_under_test.get_bucket_query(
+        _get_table(_get_hash_df(range(20))), "hash__all", 2
+    ).execute()
+    assert module_under_test.get_differing_buckets(bucket_df, bucket_df) == ([], 0)
+
+
+def test_get_fingerprint_is_order_independent(module_under_test):
+    df = _get_hash_df(range(30))
+    reversed_df = df[::-1].reset_index(drop=True)
+    changed_df = _get_hash_df(list(range(29)) + ["changed"])
+
+    fingerprints = [
+        module_under_test.get_fingerprint(
+            module_under_test.get_fingerprint_query(
+                _get_table(table_df), "hash__all"
+            ).execute()
+        )
+        for table_df in [df, reversed_df, changed_df]
+    ]
+
+    assert fingerprints[0] == fingerprints[1]
+    assert fingerprints[0] != fingerprints[2]
+    assert fingerprints[0].startswith("30:")
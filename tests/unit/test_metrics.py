@@ -0,0 +1,126 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+
+from data_validation import clients, consts, metadata, profiling
+
+pytest.importorskip("prometheus_client")
+
+CONFIG = {
+    consts.CONFIG_SOURCE_CONN: {consts.SOURCE_TYPE: "Postgres"},
+    consts.CONFIG_TARGET_CONN: {consts.SOURCE_TYPE: "BigQuery"},
+}
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation import metrics
+
+    return metrics
+
+
+def _get_value(module_under_test, name, **labels):
+    return module_under_test.REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_finish_validation_records_spans(module_under_test):
+    run_metadata = metadata.RunMetadata()
+    for side, rows in [("source", 10), ("target", 12)]:
+        with profiling.span(run_metadata, profiling.SPAN_FETCH, side=side) as fetch:
+            fetch.attributes.update({"rows": rows, "bytes": 100})
+    with profiling.span(run_metadata, profiling.SPAN_COMBINE) as combine:
+        combine.attributes["rows"] = 12
+    with profiling.span(run_metadata, profiling.SPAN_RESULT_HANDLER):
+        pass
+    labels = {"backend": "BigQuery", "side": "target"}
+    rows_fetched = _get_value(module_under_test, "dvt_rows_fetched_total", **labels)
+    queries = _get_value(module_under_test, "dvt_query_seconds_count", **labels)
+    rows_compared = _get_value(module_under_test, "dvt_rows_compared_total")
+    in_flight = _get_value(module_under_test, "dvt_validations_in_flight")
+
+    module_under_test.start_validation(CONFIG)
+    assert _get_value(module_under_test, "dvt_validations_in_flight") == in_flight + 1
+    module_under_test.finish_validation(CONFIG, run_metadata=run_metadata)
+
+    assert _get_value(module_under_test, "dvt_validations_in_flight") == in_flight
+    assert (
+        _get_value(module_under_test, "dvt_rows_fetched_total", **labels)
+        == rows_fetched + 12
+    )
+    assert (
+        _get_value(module_under_test, "dvt_query_seconds_count", **labels)
+        == queries + 1
+    )
+    assert (
+        _get_value(module_under_test, "dvt_rows_compared_total") == rows_compared + 12
+    )
+
+
+@mock.patch("data_validation.clients.get_data_client")
+def test_connection_clients_are_read_from_client_registry(
+    mock_get_data_client, module_under_test
+):
+    """Test the client metrics are the check outs of the client registry."""
+    now = [0]
+    mock_get_data_client.side_effect = lambda config: mock.Mock()
+    registry = clients.ClientRegistry(idle_seconds=100, clock=lambda: now[0])
+    postgres_client = registry.get_client({consts.SOURCE_TYPE: "Postgres"})
+    registry.get_client({consts.SOURCE_TYPE: "Postgres"})
+    registry.get_client({consts.SOURCE_TYPE: "Oracle"})
+    registry.release_client(registry.get_client({consts.SOURCE_TYPE: "MySQL"}))
+    now[0] = 200
+    registry.get_client({consts.SOURCE_TYPE: "Teradata"})
+    for _ in range(2):
+        registry.release_client(postgres_client)
+
+    with mock.patch.object(clients, "CLIENT_REGISTRY", registry):
+        content = module_under_test.render().decode()
+
+    assert 'dvt_connection_clients{backend="Postgres",state="idle"} 1.0' in content
+    assert 'dvt_connection_clients{backend="Oracle",state="checked_out"} 1.0' in content
+    assert 'dvt_connection_client_checkouts{backend="Teradata"} 1.0' in content
+    assert (
+        'dvt_connection_client_evictions_total{backend="MySQL",reason="idle"} 1.0'
+        in content
+    )
+
+
+def test_get_backend_of_missing_connection(module_under_test):
+    assert module_under_test.get_backend({}, consts.RESULT_TYPE_SOURCE) == "unknown"
+
+
+@mock.patch("data_validation.data_validation.DataValidation")
+def test_app_metrics_endpoint(mock_data_validation, module_under_test):
+    from data_validation import app
+
+    mock_data_validation.return_value.run_metadata = metadata.RunMetadata()
+    mock_data_validation.return_value.get_result_df.side_effect = ValueError(
+        "Bad config"
+    )
+    errors = _get_value(module_under_test, "dvt_validations_total", status="error")
+
+    client = app.app.test_client()
+    client.post("/", json=CONFIG)
+    response = client.get("/metrics")
+
+    assert response.content_type == module_under_test.CONTENT_TYPE
+    assert (
+        _get_value(module_under_test, "dvt_validations_total", status="error")
+        == errors + 1
+    )
+    assert "# TYPE dvt_query_seconds histogram" in response.get_data(as_text=True)
+    assert "# TYPE dvt_connection_clients gauge" in response.get_data(as_text=True)
@@ -18,10 +18,15 @@ import pytest
 import json
 import random
 from datetime import datetime, timedelta
+from unittest import mock
+
+import ibis
+import pandas
 
 from data_validation import cli_tools
 from data_validation import consts
 from data_validation.config_manager import ConfigManager
+from data_validation.query_builder.query_builder import QueryBuilder
 
 SOURCE_TABLE_FILE_PATH = "source_table_data.json"
 TARGET_TABLE_FILE_PATH = "target_table_data.json"
@@ -423,6 +428,223 @@ def test_get_partition_key_filters(module_under_test):
     assert partition_filters_list[0] == expected_partition_filters_list
 
 
+def test_get_partition_key_filters_fused_probes(module_under_test):
+    """Probe several tables concurrently with one stats query per side."""
+    data = _generate_fake_data(rows=1001, second_range=0)
+
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(data))
+
+    config_managers = [_generate_config_manager("my_table") for _ in range(3)]
+
+    parser = cli_tools.configure_arg_parser()
+    mock_args = parser.parse_args(CLI_ARGS_JSON_SOURCE + ["-par", "3"])
+    assert mock_args.parallelism == 3
+
+    builder = module_under_test.PartitionBuilder(config_managers, mock_args)
+    with mock.patch.object(
+        module_under_test.PartitionRowBuilder,
+        "get_stats_query",
+        autospec=True,
+        side_effect=module_under_test.PartitionRowBuilder.get_stats_query,
+    ) as stats_query, mock.patch.object(
+        module_under_test.PartitionRowBuilder, "get_count_query"
+    ) as count_query:
+        partition_filters_list = builder._get_partition_key_filters()
+
+    assert partition_filters_list == [PARTITION_FILTERS_LIST] * 3
+    assert stats_query.call_count == 6
+    count_query.assert_not_called()
+
+
+def test_get_quantile_filters(module_under_test):
+    """Build equal population partition filters and assert the bounds."""
+    data = _generate_fake_data(rows=1001, second_range=0)
+
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(data))
+
+    config_managers = [_generate_config_manager("my_table")]
+
+    parser = cli_tools.configure_arg_parser()
+    mock_args = parser.parse_args(CLI_ARGS_JSON_SOURCE + ["-ptype", "quantile"])
+
+    builder = module_under_test.PartitionBuilder(config_managers, mock_args)
+    partition_filters_list = builder._get_quantile_filters()
+    assert partition_filters_list == [
+        [
+            "(id < 333 or id IS NULL)",
+            "id >= 333 and id < 667",
+            "id >= 667",
+        ]
+    ]
+
+
+def test_get_quantile_query_ranks_a_table_sample(module_under_test):
+    """Rank the keys of a table sample to find the bounds of large tables."""
+    client = ibis.pandas.connect(
+        {
+            "my_table": pandas.DataFrame({"id": range(10000)}),
+            "my_sample": pandas.DataFrame({"id": range(0, 10000, 5)}),
+        }
+    )
+    client._source_type = "Postgres"
+    partition_row_builder = module_under_test.PartitionRowBuilder(
+        "id", client, None, "my_table", QueryBuilder([], [], [], [], [], None)
+    )
+    with mock.patch.object(
+        client, "sql", create=True, return_value=client.table("my_sample")
+    ), mock.patch(
+        "data_validation.query_builder.partition_row_builder.get_table_sample_query",
+        return_value="SELECT * FROM my_table TABLESAMPLE BERNOULLI (20)",
+    ) as sample_query:
+        quantile_df = partition_row_builder.get_quantile_query(
+            2, row_count=10000
+        ).execute()
+
+    sample_query.assert_called_once_with(client, None, "my_table", 0.2)
+    # Only keys of the sample, multiples of 5, are bounds
+    bounds = sorted(quantile_df["lower_bound"])
+    assert all(bound % 5 == 0 for bound in bounds)
+    assert bounds[0] == 0 and 4990 <= bounds[1] <= 5010
+
+
+def test_get_hash_mod_filters(module_under_test):
+    """Build hash-mod partition filters for a composite integer key."""
+    data = _generate_fake_data(rows=10, second_range=0)
+
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(data))
+
+    config_managers = [_generate_config_manager("my_table")]
+
+    parser = cli_tools.configure_arg_parser()
+    mock_args = parser.parse_args(
+        CLI_ARGS_JSON_SOURCE + ["-ptype", "hash-mod", "-partkey", "id,int_value"]
+    )
+
+    builder = module_under_test.PartitionBuilder(config_managers, mock_args)
+    assert builder.partition_keys == ["id", "int_value"]
+
+    partition_filters_list = builder._get_hash_mod_filters()
+    hashed = "MOD(MOD(ABS(id), 3) + MOD(ABS(int_value), 3), 3)"
+    assert partition_filters_list == [
+        [
+            (
+                f"({hashed} = 0 or id IS NULL or int_value IS NULL)",
+                f"({hashed} = 0 or id IS NULL or int_value IS NULL)",
+            ),
+            (f"{hashed} = 1", f"{hashed} = 1"),
+            (f"{hashed} = 2", f"{hashed} = 2"),
+        ]
+    ]
+
+    mock_args = parser.parse_args(
+        CLI_ARGS_JSON_SOURCE + ["-ptype", "hash-mod", "-partkey", "text_value"]
+    )
+    builder = module_under_test.PartitionBuilder(config_managers, mock_args)
+    with pytest.raises(TypeError):
+        builder._get_hash_mod_filters()
+
+
+def test_get_hash_mod_filters_string_keys(module_under_test):
+    """Hash string partition keys with the MD5 function of each backend."""
+    data = _generate_fake_data(rows=10, second_range=0)
+
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(data))
+
+    config_manager = _generate_config_manager("my_table")
+    parser = cli_tools.configure_arg_parser()
+    mock_args = parser.parse_args(
+        CLI_ARGS_JSON_SOURCE + ["-ptype", "hash-mod", "-partkey", "text_value,id"]
+    )
+    builder = module_under_test.PartitionBuilder([config_manager], mock_args)
+
+    with mock.patch.object(
+        config_manager,
+        "get_source_connection",
+        return_value={consts.SOURCE_TYPE: "BigQuery"},
+    ), mock.patch.object(
+        config_manager,
+        "get_target_connection",
+        return_value={consts.SOURCE_TYPE: "Postgres"},
+    ):
+        partition_filters_list = builder._get_hash_mod_filters()
+
+    source_hashed = (
+        "MOD(CASE WHEN text_value IS NULL OR id IS NULL THEN NULL ELSE "
+        "CAST(CONCAT('0x', SUBSTR(TO_HEX(MD5(CAST(text_value AS STRING) "
+        "|| '|' || CAST(id AS STRING))), 1, 8)) AS INT64) END, 3)"
+    )
+    target_hashed = (
+        "MOD(CASE WHEN text_value IS NULL OR id IS NULL THEN NULL ELSE "
+        "('x' || SUBSTR(MD5(CAST(text_value AS VARCHAR) || '|' || "
+        "CAST(id AS VARCHAR)), 1, 8))::BIT(32)::BIGINT END, 3)"
+    )
+    nulls = "text_value IS NULL or id IS NULL"
+    assert partition_filters_list == [
+        [
+            (
+                f"({source_hashed} = 0 or {nulls})",
+                f"({target_hashed} = 0 or {nulls})",
+            ),
+            (f"{source_hashed} = 1", f"{target_hashed} = 1"),
+            (f"{source_hashed} = 2", f"{target_hashed} = 2"),
+        ]
+    ]
+
+
+def test_get_partition_config_managers(module_under_test):
+    """Build in memory partition ConfigManagers sharing the table clients."""
+    data = _generate_fake_data(rows=1001, second_range=0)
+
+    _create_table_file(SOURCE_TABLE_FILE_PATH, _get_fake_json_data(data))
+    _create_table_file(TARGET_TABLE_FILE_PATH, _get_fake_json_data(data))
+
+    config_manager = _generate_config_manager("my_table")
+
+    parser = cli_tools.configure_arg_parser()
+    mock_args = parser.parse_args(
+        [
+            "validate",
+            "row",
+            "-sc",
+            "{}",
+            "-tc",
+            "{}",
+            "-tbls",
+            "my_table",
+            "-pk",
+            "id",
+            "-comp-fields",
+            "int_value",
+            "-pn",
+            "3",
+            "-par",
+            "4",
+        ]
+    )
+
+    builder = module_under_test.PartitionBuilder([config_manager], mock_args)
+    assert builder.config_dir is None
+    partition_config_managers = builder.get_partition_config_managers()
+
+    assert len(partition_config_managers) == 1
+    assert len(partition_config_managers[0]) == 3
+    for partition_filter, partition_config_manager in zip(
+        PARTITION_FILTERS_LIST, partition_config_managers[0]
+    ):
+        assert partition_config_manager.source_client is config_manager.source_client
+        assert partition_config_manager.target_client is config_manager.target_client
+        assert partition_config_manager.filters[-1] == {
+            "type": "custom",
+            "source": partition_filter,
+            "target": partition_filter,
+        }
+    assert config_manager.filters == []
+
+
 def test_add_partition_filters_to_config(module_under_test):
     """Add partition filters to ConfigManager object, build YAML config list
     and assert YAML configs
@@ -0,0 +1,89 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pandas
+import pytest
+
+from data_validation import metadata
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation import profiling
+
+    return profiling
+
+
+def test_span_records_seconds_and_attributes(module_under_test):
+    run_metadata = metadata.RunMetadata()
+
+    with module_under_test.span(
+        run_metadata, module_under_test.SPAN_FETCH, side="source"
+    ) as fetch_span:
+        fetch_span.attributes["rows"] = 3
+
+    assert run_metadata.spans == [fetch_span]
+    assert fetch_span.seconds >= 0
+    assert fetch_span.attributes == {"side": "source", "rows": 3}
+
+
+def test_span_is_recorded_on_error(module_under_test):
+    run_metadata = metadata.RunMetadata()
+
+    with pytest.raises(ValueError):
+        with module_under_test.span(run_metadata, module_under_test.SPAN_COMPILE):
+            raise ValueError("Bad query")
+
+    assert [run_span.name for run_span in run_metadata.spans] == ["compile"]
+
+
+def test_get_profile_df(module_under_test):
+    run_metadata = metadata.RunMetadata()
+    for side, rows in [("source", 2), ("target", 3), ("source", 4)]:
+        with module_under_test.span(
+            run_metadata, module_under_test.SPAN_FETCH, side=side
+        ) as fetch_span:
+            fetch_span.attributes["rows"] = rows
+    with module_under_test.span(run_metadata, module_under_test.SPAN_COMBINE):
+        pass
+
+    profile_df = module_under_test.get_profile_df(run_metadata)
+
+    assert list(profile_df.columns) == module_under_test.PROFILE_COLUMNS
+    assert list(profile_df["side"]) == ["source", "target", ""]
+    assert list(profile_df["calls"]) == [2, 1, 1]
+    assert list(profile_df["rows"][:2]) == [6, 3]
+    assert pandas.isna(profile_df["rows"][2])
+    assert (profile_df["run_id"] == run_metadata.run_id).all()
+
+
+def test_format_profile(module_under_test):
+    run_metadata = metadata.RunMetadata(process_peak_memory_mb=12.5)
+    with module_under_test.span(run_metadata, module_under_test.SPAN_COMPILE):
+        pass
+
+    profile_df = module_under_test.get_profile_df(run_metadata)
+    summary = module_under_test.format_profile(profile_df)
+
+    assert list(profile_df["process_peak_memory_mb"]) == [12.5]
+    assert summary.startswith(f"Profile of run {run_metadata.run_id}:")
+    assert "compile" in summary
+    assert summary.endswith("Peak memory of the process (all runs): 12.5 MB")
+
+
+def test_get_frame_bytes(module_under_test):
+    df = pandas.DataFrame({"a": ["x" * 100]})
+
+    assert module_under_test.get_frame_bytes(df) > 100
+    assert module_under_test.get_frame_bytes(df, deep=False) == 8
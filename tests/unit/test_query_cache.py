@@ -0,0 +1,121 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import ibis
+import pandas
+import pytest
+import sqlalchemy
+
+CONN_CONFIG = {"source_type": "Postgres", "host": "localhost"}
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation import query_cache
+
+    return query_cache
+
+
+@pytest.fixture
+def sqlite_client(tmp_path):
+    db_path = str(tmp_path / "cache.db")
+    engine = sqlalchemy.create_engine(f"sqlite:///{db_path}")
+    engine.execute("CREATE TABLE my_table (id INTEGER, value REAL)")
+    engine.execute("INSERT INTO my_table VALUES (1, 1.5), (2, 2.5), (3, NULL)")
+    client = ibis.sqlite.connect(db_path)
+    return mock.Mock(wraps=client)
+
+
+def _get_sum_query(client, min_id):
+    table = client.table("my_table")
+    return table.filter(table.id > min_id).aggregate(
+        [table.value.sum().name("sum__value"), table.count().name("count")]
+    )
+
+
+def test_get_query_sql_renders_literals(module_under_test, sqlite_client):
+    sql = module_under_test.get_query_sql(_get_sum_query(sqlite_client, 1))
+    assert "t0.id > 1" in sql
+
+
+def test_get_query_sql_of_pandas_query(module_under_test):
+    client = ibis.pandas.connect({"my_table": pandas.DataFrame({"id": [1]})})
+    assert module_under_test.get_query_sql(client.table("my_table")) is None
+
+
+def test_execute_reads_cached_result(module_under_test, sqlite_client, tmp_path):
+    cache = module_under_test.QueryCache(directory=str(tmp_path / "cache"))
+
+    first_df = cache.execute(
+        sqlite_client, CONN_CONFIG, _get_sum_query(sqlite_client, 0)
+    )
+    second_df = cache.execute(
+        sqlite_client, CONN_CONFIG, _get_sum_query(sqlite_client, 0)
+    )
+    cache.execute(sqlite_client, CONN_CONFIG, _get_sum_query(sqlite_client, 1))
+
+    assert sqlite_client.execute.call_count == 2
+    pandas.testing.assert_frame_equal(first_df, second_df)
+    assert second_df["sum__value"][0] == 4.0
+
+
+def test_key_depends_on_connection_and_version(module_under_test):
+    key = module_under_test.QueryCache.get_key(CONN_CONFIG, "SELECT 1")
+    assert key == module_under_test.QueryCache.get_key(dict(CONN_CONFIG), "SELECT 1")
+    assert key != module_under_test.QueryCache.get_key(
+        {"source_type": "MySQL"}, "SELECT 1"
+    )
+    assert key != module_under_test.QueryCache.get_key(
+        CONN_CONFIG, "SELECT 1", version="v2"
+    )
+
+
+def test_get_expired_result(module_under_test, tmp_path):
+    now = [1000.0]
+    cache = module_under_test.QueryCache(
+        directory=str(tmp_path), ttl_seconds=60, clock=lambda: now[0]
+    )
+    cache.put("key", pandas.DataFrame({"count": [3]}))
+
+    now[0] += 30
+    assert cache.get("key")["count"][0] == 3
+    now[0] += 60
+    assert cache.get("key") is None
+
+
+def test_put_evicts_least_recently_used(module_under_test, tmp_path):
+    now = [1000.0]
+    result_df = pandas.DataFrame({"count": range(100)})
+    result_df.to_parquet(tmp_path / "size.parquet", index=False)
+    file_size = (tmp_path / "size.parquet").stat().st_size
+    (tmp_path / "size.parquet").unlink()
+    cache = module_under_test.QueryCache(
+        directory=str(tmp_path),
+        max_size_mb=2.5 * file_size / 1024 / 1024,
+        clock=lambda: now[0],
+    )
+
+    for key in ["a", "b"]:
+        now[0] += 1
+        cache.put(key, result_df)
+    now[0] += 1
+    cache.get("a")
+    now[0] += 1
+    cache.put("c", result_df)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
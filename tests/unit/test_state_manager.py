@@ -92,3 +92,13 @@ def test_create_and_list_validation(capsys, fs):
 
     validations = manager.list_validations()
     assert validations == [TEST_VALIDATION_NAME]
+
+
+def test_create_and_get_validation_state(capsys, fs):
+    manager = state_manager.StateManager()
+    assert manager.get_validation_state("my_table.Column") is None
+
+    state = {"incremental_column": "id", "watermark": 3, "watermark_type": "number"}
+    manager.create_validation_state("my_table.Column", state)
+
+    assert manager.get_validation_state("my_table.Column") == state
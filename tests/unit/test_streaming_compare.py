@@ -0,0 +1,70 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import decimal
+import os
+
+import pandas
+import pytest
+
+
+@pytest.fixture
+def module_under_test():
+    from data_validation import streaming_compare
+
+    return streaming_compare
+
+
+def test_partition_ids_match_across_key_types(module_under_test):
+    int_keys = pandas.DataFrame({"id": [1, 2, 3, 40]})
+    decimal_keys = pandas.DataFrame(
+        {"id": [decimal.Decimal(value) for value in (1, 2, 3, 40)]}
+    )
+
+    int_ids = module_under_test.partition_ids(int_keys, ["id"], 7)
+    decimal_ids = module_under_test.partition_ids(decimal_keys, ["id"], 7)
+
+    assert list(int_ids) == list(decimal_ids)
+    assert all(0 <= partition < 7 for partition in int_ids)
+
+
+def test_num_partitions_for_budget(module_under_test):
+    assert module_under_test.num_partitions_for_budget(10, 100, 1024**2) == 1
+    assert module_under_test.num_partitions_for_budget(10**6, 100, 1024**2) > 1
+
+
+def test_estimate_row_bytes(module_under_test):
+    import ibis
+
+    schema = ibis.schema([("id", "int64"), ("name", "string"), ("ts", "timestamp")])
+
+    assert module_under_test.estimate_row_bytes(schema) == (
+        2 * module_under_test.FIXED_VALUE_BYTES + module_under_test.VARIABLE_VALUE_BYTES
+    )
+
+
+def test_spill_store_round_trip(module_under_test):
+    df = pandas.DataFrame({"id": range(100), "value": range(100)})
+
+    with module_under_test.SpillStore(4) as spill_store:
+        spill_store.append("source", df.iloc[:50], ["id"])
+        spill_store.append("source", df.iloc[50:], ["id"])
+        partitions = [
+            spill_store.read("source", partition, df) for partition in range(4)
+        ]
+        directory = spill_store.directory
+
+    assert not os.path.exists(directory)
+    assert sorted(pandas.concat(partitions).id) == list(range(100))
+    assert sum(len(partition) for partition in partitions) == 100
@@ -227,3 +227,22 @@ def test_validation_add_filters(module_under_test):
     filter_field = builder.source_builder.filters[0]
 
     assert filter_field.left == "column_name > 100"
+
+
+def test_clone_adds_filters_to_copy(module_under_test):
+    mock_config_manager = ConfigManager(
+        COLUMN_VALIDATION_CONFIG, MockIbisClient(), MockIbisClient(), verbose=False
+    )
+    builder = module_under_test.ValidationBuilder(mock_config_manager)
+    mock_config_manager.append_query_groups(QUERY_GROUPS_TEST)
+    builder.add_config_query_groups()
+
+    cloned_builder = builder.clone()
+    cloned_builder.pop_grouped_fields()
+    cloned_builder.add_config_filters()
+
+    assert len(cloned_builder.source_builder.filters) == 2
+    assert len(builder.source_builder.filters) == 1
+    assert list(builder.get_group_aliases()) == ["start_alias"]
+    assert cloned_builder.source_builder.filters[0] is builder.source_builder.filters[0]
+    assert cloned_builder.get_metadata() == builder.get_metadata()
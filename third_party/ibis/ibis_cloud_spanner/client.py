@@ -286,6 +286,7 @@ class CloudSpannerClient(SQLClient):
             instance_id, database_id
         )
         self.client = cs.Client()
+        self._databases = {}
 
     def _parse_instance_and_dataset(self, dataset):
         if not dataset and not self.dataset:
@@ -395,13 +396,17 @@ class CloudSpannerClient(SQLClient):
 
         return ibis.schema(t_schema)
 
+    def _get_database(self):
+        """Return the Database of the current dataset, reusing the client
+        and its session pool across queries."""
+        database_id = self.dataset_id
+        if database_id not in self._databases:
+            self._databases[database_id] = self.instance.database(database_id)
+        return self._databases[database_id]
+
     def _execute(self, stmt, results=True, query_parameters=None):
 
-        spanner_client = spanner.Client()
-        instance_id = self.instance_id
-        instance = spanner_client.instance(instance_id)
-        database_id = self.dataset_id
-        database_1 = instance.database(database_id)
+        database_1 = self._get_database()
 
         with database_1.snapshot() as snapshot:
             data_qry = pandas_df.to_pandas(snapshot, stmt, query_parameters)
@@ -411,11 +416,7 @@ class CloudSpannerClient(SQLClient):
         query_parameters = [
             cloud_spanner_param(param, value) for param, value in (params or {}).items()
         ]
-        spanner_client = spanner.Client()
-        instance_id = self.instance_id
-        instance = spanner_client.instance(instance_id)
-        database_id = self.dataset_id
-        database_1 = instance.database(database_id)
+        database_1 = self._get_database()
         with database_1.snapshot() as snapshot:
             if query_parameters:
                 param = {}
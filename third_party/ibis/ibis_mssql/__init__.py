@@ -1 +1,5 @@
-from third_party.ibis.ibis_mssql.api import compile, connect  # noqa
+try:
+    from third_party.ibis.ibis_mssql.api import compile, connect  # noqa
+except ImportError:
+    # pyodbc is optional, the compiler is still used to register operations
+    pass